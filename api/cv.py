@@ -9,7 +9,7 @@ from ..db import crud
 from ..services.cv_generator import save_cv, html_to_pdf
 from ..services.embedding_service import prepare_for_chromadb
 from ..services.experience_extractor import extract_from_transcript, extract_from_transcript_comprehensive
-from ..vector_db.chroma_client import get_vector_db
+from ..services.embedding_retry import store_embedding
 from ..config import CVS_DIR, VOICE_CALLS_DIR
 
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ router = APIRouter(prefix="/cv", tags=["cv"])
 
 
 @router.post("/generate")
-async def generate_cv(worker_id: str = Query(..., description="Worker ID")):
+def generate_cv(worker_id: str = Query(..., description="Worker ID")):
     """
     Generate CV for worker.
 
@@ -102,7 +102,7 @@ async def generate_cv(worker_id: str = Query(..., description="Worker ID")):
     try:
         cv_path = save_cv(
             worker_id,
-            dict(worker),
+            worker,
             experience,
             CVS_DIR,
             education_data=education_data_list,
@@ -121,20 +121,14 @@ async def generate_cv(worker_id: str = Query(..., description="Worker ID")):
 
     # Store embedding in vector DB
     try:
-        vector_db = get_vector_db()
-        embedding_data = prepare_for_chromadb(worker_id, dict(worker), experience)
-        vector_db.add_document(
-            embedding_data["id"],
-            embedding_data["document"],
-            embedding_data["metadata"]
-        )
+        store_embedding(prepare_for_chromadb(worker_id, worker, experience))
     except Exception as e:
         print(f"Warning: Embedding storage failed: {e}")
         # Don't fail if embedding fails - CV is more important
 
     # Return has_cv from DB so frontend can enable Access Resume
     cv_status = crud.get_cv_status(worker_id)
-    has_cv = bool(cv_status.get("has_cv", False)) if cv_status else False
+    has_cv = (cv_status.get("has_cv") or False) if cv_status else False
 
     return JSONResponse(
         status_code=200,
@@ -155,7 +149,7 @@ def _name_based_pdf_path(worker_id: str) -> Path:
 
 
 @router.get("/download/{worker_id}")
-async def download_cv(worker_id: str):
+def download_cv(worker_id: str):
     """Download CV for worker as PDF - ALWAYS returns PDF, never HTML"""
     import os
     import logging
@@ -349,7 +343,7 @@ def _run_cv_pipeline_for_worker(worker_id: str) -> bool:
     try:
         save_cv(
             worker_id,
-            dict(worker),
+            worker,
             experience,
             CVS_DIR,
             education_data=education_data_list,
@@ -361,13 +355,7 @@ def _run_cv_pipeline_for_worker(worker_id: str) -> bool:
         return False
 
     try:
-        vector_db = get_vector_db()
-        embedding_data = prepare_for_chromadb(worker_id, dict(worker), experience)
-        vector_db.add_document(
-            embedding_data["id"],
-            embedding_data["document"],
-            embedding_data["metadata"]
-        )
+        store_embedding(prepare_for_chromadb(worker_id, worker, experience))
     except Exception as e:
         logger.warning(f"Embedding storage failed for worker {worker_id}: {e}")
 
@@ -375,7 +363,7 @@ def _run_cv_pipeline_for_worker(worker_id: str) -> bool:
 
 
 @router.get("/preview/{worker_id}")
-async def preview_cv(worker_id: str):
+def preview_cv(worker_id: str):
     """
     Preview CV - returns HTML when CV exists; returns processing status when CV is not ready yet.
 
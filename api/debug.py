@@ -227,6 +227,16 @@ def get_database_stats():
         }
 
 
+@router.get("/embeddings")
+def get_embedding_stats():
+    """Embedding write counters and size of the pending_embeddings retry queue"""
+    from ..services.embedding_retry import get_metrics
+    return {
+        **get_metrics(),
+        "pending_embeddings": crud.count_pending_embeddings()
+    }
+
+
 @router.get("/education")
 def get_all_education():
     """Get all educational documents from database"""
@@ -8,7 +8,7 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 
 
 @router.get("/{worker_id}")
-async def get_worker_document(worker_id: str):
+def get_worker_document(worker_id: str):
     """Get document path for worker (personal document saved by form submit)."""
 
     worker = crud.get_worker(worker_id)
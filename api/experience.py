@@ -66,7 +66,7 @@ class ExtractRequest(BaseModel):
 
 
 @router.post("/start")
-async def start_experience_session(request: StartSessionRequest):
+def start_experience_session(request: StartSessionRequest):
     """
     Start a new experience collection session for a worker.
     Creates a conversation session and returns the first question.
@@ -108,7 +108,7 @@ async def start_experience_session(request: StartSessionRequest):
 
 
 @router.post("/chat")
-async def chat_message(request: ChatMessageRequest):
+def chat_message(request: ChatMessageRequest):
     """
     Handle a chat message from the user.
     Stores the response and returns the next question.
@@ -199,7 +199,7 @@ async def chat_message(request: ChatMessageRequest):
 
 
 @router.post("/extract")
-async def extract_experience(request: ExtractRequest):
+def extract_experience(request: ExtractRequest):
     """
     Extract structured experience data from the raw conversation.
     Uses LLM to structure the responses into JSON format.
@@ -284,7 +284,7 @@ async def extract_experience(request: ExtractRequest):
 
 
 @router.get("/session/{session_id}")
-async def get_session_status(session_id: str):
+def get_session_status(session_id: str):
     """Get the current status of an experience session"""
     try:
         session = crud.get_experience_session(session_id)
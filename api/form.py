@@ -25,6 +25,30 @@ logger.setLevel(logging.DEBUG)
 
 router = APIRouter(prefix="/form", tags=["form"])
 
+# Shared Voice Agent HTTP client - keeps TCP/TLS connections to the agent alive across calls
+_voice_agent_client = None
+
+
+def get_voice_agent_client():
+    """Return the process-wide httpx client for Voice Agent API calls (created lazily)."""
+    global _voice_agent_client
+    if _voice_agent_client is None or _voice_agent_client.is_closed:
+        import httpx
+        _voice_agent_client = httpx.AsyncClient(
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(retries=1),
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _voice_agent_client
+
+
+async def close_voice_agent_client():
+    """Close the shared Voice Agent client (called on app shutdown)."""
+    global _voice_agent_client
+    if _voice_agent_client is not None:
+        await _voice_agent_client.aclose()
+        _voice_agent_client = None
+
 
 # async def process_ocr_background(worker_id: str, personal_doc_path: str, educational_doc_path: str = None):
 #     """
@@ -353,10 +377,11 @@ async def process_ocr_background(worker_id: str, personal_doc_paths: list, educa
         dob = personal_data.get("dob") or ""
         address = personal_data.get("address") or ""
 
-        personal_saved = crud.update_worker_data(worker_id, name, dob, address)
+        personal_saved = await asyncio.to_thread(crud.update_worker_data, worker_id, name, dob, address)
 
         if personal_saved:
-            crud.update_worker_verification(
+            await asyncio.to_thread(
+                crud.update_worker_verification,
                 worker_id,
                 status="pending",
                 extracted_name=name,
@@ -401,7 +426,8 @@ async def process_ocr_background(worker_id: str, personal_doc_paths: list, educa
                 logger.warning("  ✗ LLM extraction failed for educational doc")
                 continue
 
-            saved = crud.save_educational_document_with_llm_data(
+            saved = await asyncio.to_thread(
+                crud.save_educational_document_with_llm_data,
                 worker_id=worker_id,
                 education_data=edu_data,
                 raw_ocr_text=edu_text,
@@ -420,7 +446,7 @@ async def process_ocr_background(worker_id: str, personal_doc_paths: list, educa
         # ----------------------------------------------------------------------
         # STEP 3: VERIFICATION
         # ----------------------------------------------------------------------
-        extraction_status = crud.get_worker_extraction_status(worker_id)
+        extraction_status = await asyncio.to_thread(crud.get_worker_extraction_status, worker_id)
         logger.info(f"[VERIFICATION] Extraction status: {extraction_status}")
 
         if not extraction_status.get("personal_extracted"):
@@ -436,25 +462,29 @@ async def process_ocr_background(worker_id: str, personal_doc_paths: list, educa
         personal_name = extraction_status.get("personal_name")
         personal_dob = extraction_status.get("personal_dob")
 
-        educational_docs = crud.get_educational_documents_for_verification(worker_id)
+        educational_docs = await asyncio.to_thread(crud.get_educational_documents_for_verification, worker_id)
 
         verification_result = verify_documents(personal_name, personal_dob, educational_docs)
 
         # Update DB verification state
         if verification_result["status"] == "verified":
-            crud.update_worker_verification(worker_id, status="verified")
+            await asyncio.to_thread(crud.update_worker_verification, worker_id, status="verified")
             for comp in verification_result["comparisons"]:
                 if comp["overall_match"]:
-                    crud.update_educational_document_verification(comp["document_id"], "verified")
+                    await asyncio.to_thread(
+                        crud.update_educational_document_verification, comp["document_id"], "verified"
+                    )
 
         else:
-            crud.update_worker_verification(
+            await asyncio.to_thread(
+                crud.update_worker_verification,
                 worker_id,
                 status="failed",
                 errors={"mismatches": verification_result["mismatches"]}
             )
             for mismatch in verification_result["mismatches"]:
-                crud.update_educational_document_verification(
+                await asyncio.to_thread(
+                    crud.update_educational_document_verification,
                     mismatch["document_id"], "failed",
                     errors={"field": mismatch["field"], "reason": mismatch.get("reason")}
                 )
@@ -530,7 +560,7 @@ def _worker_has_cv(worker_id: str) -> bool:
     operation_id="signup",
     response_model=SignupResponse,
 )
-async def signup(request: SignupRequest):
+def signup(request: SignupRequest):
     """
     Create a new worker with mobile number. Returns worker_id for document submit.
 
@@ -572,7 +602,7 @@ async def signup(request: SignupRequest):
 
 
 @router.get("/worker/mobile/{mobile_number}")
-async def get_worker_by_mobile_endpoint(mobile_number: str):
+def get_worker_by_mobile_endpoint(mobile_number: str):
     """
     Get worker information by mobile number.
     Returns worker_id and basic info if worker exists.
@@ -614,14 +644,15 @@ async def get_worker_data(worker_id: str):
     processes OCR synchronously and waits for completion before returning complete data.
     """
     try:
-        worker = crud.get_worker(worker_id)
+        # Dashboard poll: blocking SQLite reads go through the threadpool, not the event loop
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found")
 
         worker_dict = dict(worker)
 
         # Get document paths from database first (most reliable)
-        db_paths = crud.get_worker_document_paths(worker_id)
+        db_paths = await asyncio.to_thread(crud.get_worker_document_paths, worker_id)
         personal_doc_path_from_db = db_paths.get("personal")
         educational_doc_paths_from_db = db_paths.get("educational", [])
 
@@ -686,7 +717,7 @@ async def get_worker_data(worker_id: str):
 
         # Check if educational documents need processing
         # Only consider documents that are in database paths OR (glob results AND personal data exists)
-        education_docs_in_db = crud.get_educational_documents(worker_id)
+        education_docs_in_db = await asyncio.to_thread(crud.get_educational_documents, worker_id)
 
         # has_unprocessed_education should be True only if:
         # 1. There are educational_doc_paths in DB but not yet processed into educational_documents table
@@ -770,7 +801,7 @@ async def get_worker_data(worker_id: str):
                 logger.info(f"OCR processing completed for {worker_id}: {ocr_result}")
 
                 # Refresh worker data after OCR processing
-                worker = crud.get_worker(worker_id)
+                worker = await asyncio.to_thread(crud.get_worker, worker_id)
                 if worker:
                     worker_dict = dict(worker)
 
@@ -779,13 +810,15 @@ async def get_worker_data(worker_id: str):
                     logger.info(f"[VERIFICATION] Both personal and educational data extracted, running verification...")
                     try:
                         # Get extraction status
-                        extraction_status = crud.get_worker_extraction_status(worker_id)
+                        extraction_status = await asyncio.to_thread(crud.get_worker_extraction_status, worker_id)
 
                         if extraction_status.get("personal_extracted") and extraction_status.get(
                                 "educational_extracted", 0) > 0:
                             personal_name = extraction_status.get("personal_name")
                             personal_dob = extraction_status.get("personal_dob")
-                            educational_docs = crud.get_educational_documents_for_verification(worker_id)
+                            educational_docs = await asyncio.to_thread(
+                                crud.get_educational_documents_for_verification, worker_id
+                            )
 
                             logger.info(
                                 f"[VERIFICATION] Running verification with: personal_name='{personal_name}', personal_dob='{personal_dob}', edu_docs={len(educational_docs)}")
@@ -797,16 +830,20 @@ async def get_worker_data(worker_id: str):
                             if verification_result['status'] == 'verified':
                                 logger.info(
                                     f"[VERIFICATION] ✓ VERIFICATION SUCCESSFUL - All {verification_result['verified_count']}/{verification_result['total_count']} documents verified")
-                                crud.update_worker_verification(worker_id, status='verified')
+                                await asyncio.to_thread(crud.update_worker_verification, worker_id, status='verified')
 
                                 # Update individual educational documents
                                 for comp in verification_result['comparisons']:
                                     if comp['overall_match']:
-                                        crud.update_educational_document_verification(comp['document_id'], 'verified')
+                                        await asyncio.to_thread(
+                                            crud.update_educational_document_verification,
+                                            comp['document_id'], 'verified'
+                                        )
                             else:
                                 logger.warning(
                                     f"[VERIFICATION] ✗ VERIFICATION FAILED - Only {verification_result['verified_count']}/{verification_result['total_count']} documents verified")
-                                crud.update_worker_verification(
+                                await asyncio.to_thread(
+                                    crud.update_worker_verification,
                                     worker_id,
                                     status='failed',
                                     errors={"mismatches": verification_result['mismatches']}
@@ -815,14 +852,15 @@ async def get_worker_data(worker_id: str):
                                 # Update individual educational documents
                                 for mismatch in verification_result['mismatches']:
                                     doc_id = mismatch['document_id']
-                                    crud.update_educational_document_verification(
+                                    await asyncio.to_thread(
+                                        crud.update_educational_document_verification,
                                         doc_id,
                                         'failed',
                                         errors={"field": mismatch['field'], "reason": mismatch.get('reason')}
                                     )
 
                             # Refresh worker data again to get updated verification status
-                            worker = crud.get_worker(worker_id)
+                            worker = await asyncio.to_thread(crud.get_worker, worker_id)
                             if worker:
                                 worker_dict = dict(worker)
                         else:
@@ -871,7 +909,7 @@ async def get_worker_data(worker_id: str):
             # 2. Verification status is NOT "verified" yet
             logger.info(f"[v0] OCR not triggered - checking if verification should run...")
 
-            extraction_status = crud.get_worker_extraction_status(worker_id)
+            extraction_status = await asyncio.to_thread(crud.get_worker_extraction_status, worker_id)
             logger.info(f"[VERIFICATION_CHECK] Extraction status: {extraction_status}")
 
             personal_extracted = extraction_status.get("personal_extracted", False)
@@ -900,7 +938,9 @@ async def get_worker_data(worker_id: str):
                 try:
                     personal_name = extraction_status.get("personal_name")
                     personal_dob = extraction_status.get("personal_dob")
-                    educational_docs_to_verify = crud.get_educational_documents_for_verification(worker_id)
+                    educational_docs_to_verify = await asyncio.to_thread(
+                        crud.get_educational_documents_for_verification, worker_id
+                    )
 
                     logger.info(
                         f"[VERIFICATION] Running verification with: personal_name='{personal_name}', personal_dob='{personal_dob}', edu_docs={len(educational_docs_to_verify)}")
@@ -920,16 +960,19 @@ async def get_worker_data(worker_id: str):
                         if verification_result['status'] == 'verified':
                             logger.info(
                                 f"[VERIFICATION] ✓ VERIFICATION SUCCESSFUL - All {verification_result['verified_count']}/{verification_result['total_count']} documents verified")
-                            crud.update_worker_verification(worker_id, status='verified')
+                            await asyncio.to_thread(crud.update_worker_verification, worker_id, status='verified')
 
                             # Update individual educational documents
                             for comp in verification_result['comparisons']:
                                 if comp['overall_match']:
-                                    crud.update_educational_document_verification(comp['document_id'], 'verified')
+                                    await asyncio.to_thread(
+                                        crud.update_educational_document_verification, comp['document_id'], 'verified'
+                                    )
                         else:
                             logger.warning(
                                 f"[VERIFICATION] ✗ VERIFICATION FAILED - Only {verification_result['verified_count']}/{verification_result['total_count']} documents verified")
-                            crud.update_worker_verification(
+                            await asyncio.to_thread(
+                                crud.update_worker_verification,
                                 worker_id,
                                 status='failed',
                                 errors={"mismatches": verification_result['mismatches']}
@@ -938,14 +981,15 @@ async def get_worker_data(worker_id: str):
                             # Update individual educational documents
                             for mismatch in verification_result['mismatches']:
                                 doc_id = mismatch['document_id']
-                                crud.update_educational_document_verification(
+                                await asyncio.to_thread(
+                                    crud.update_educational_document_verification,
                                     doc_id,
                                     'failed',
                                     errors={"field": mismatch['field'], "reason": mismatch.get('reason')}
                                 )
 
                         # Refresh worker data to get updated verification status
-                        worker = crud.get_worker(worker_id)
+                        worker = await asyncio.to_thread(crud.get_worker, worker_id)
                         if worker:
                             worker_dict = dict(worker)
 
@@ -959,13 +1003,13 @@ async def get_worker_data(worker_id: str):
             message = "No uploaded documents found. Please upload your personal document first."
 
         # Get current worker data (complete after OCR processing)
-        education_docs = crud.get_educational_documents(worker_id)
+        education_docs = await asyncio.to_thread(crud.get_educational_documents, worker_id)
         education_list = [EducationalDocument.model_validate(d) for d in education_docs]
 
         # Resume status for dashboard "Access Resume" button (CV generated after transcript submit)
-        has_experience = crud.get_experience(worker_id) is not None
-        cv_status_record = crud.get_cv_status(worker_id)
-        has_cv = bool(cv_status_record.get("has_cv", False)) if cv_status_record else False
+        has_experience = await asyncio.to_thread(crud.get_experience, worker_id) is not None
+        cv_status_record = await asyncio.to_thread(crud.get_cv_status, worker_id)
+        has_cv = (cv_status_record.get("has_cv") or False) if cv_status_record else False
 
         # FLAG-BASED FLOW: Check exp_ready flag and get experience data from latest voice session
         exp_ready = False
@@ -973,7 +1017,8 @@ async def get_worker_data(worker_id: str):
         call_id_for_confirmation = None
 
         logger.info("[EXP_READY] Checking experience ready status...")
-        latest_session = crud.get_latest_voice_session_by_worker(worker_id)
+        # Minimal poll query: call_id + exp_ready, experience_json only once exp_ready is set
+        latest_session = await asyncio.to_thread(crud.get_exp_ready_by_worker, worker_id)
 
         if latest_session:
             logger.info(f"[EXP_READY] Latest voice session found for worker {worker_id}")
@@ -981,17 +1026,8 @@ async def get_worker_data(worker_id: str):
             logger.info(
                 f"[EXP_READY]   - exp_ready (raw): {latest_session.get('exp_ready')} (type: {type(latest_session.get('exp_ready')).__name__})")
 
-            # IMPORTANT: The exp_ready should already be converted to boolean by get_latest_voice_session_by_worker
-            # But we explicitly ensure it's a boolean here for the response
-            exp_ready_value = latest_session.get("exp_ready", False)
-
-            # Handle both cases: already boolean from CRUD function, or raw integer from database
-            if isinstance(exp_ready_value, bool):
-                exp_ready = exp_ready_value
-                logger.info(f"[EXP_READY]   - Already boolean: {exp_ready}")
-            else:
-                exp_ready = bool(exp_ready_value)
-                logger.info(f"[EXP_READY]   - Converted to boolean: {exp_ready} (from {exp_ready_value})")
+            # exp_ready is decoded to bool by the connection's BOOLEAN converter (NULL -> False)
+            exp_ready = latest_session.get("exp_ready") or False
 
             if exp_ready and latest_session.get("experience_json"):
                 try:
@@ -1020,7 +1056,7 @@ async def get_worker_data(worker_id: str):
             f"  exp_ready: {exp_ready} (type: {type(exp_ready).__name__}), experience_data_available: {experience_data is not None}")
 
         # Get verification status
-        extraction_status = crud.get_worker_extraction_status(worker_id)
+        extraction_status = await asyncio.to_thread(crud.get_worker_extraction_status, worker_id)
         verification_status = extraction_status.get("verification_status", "pending")
         educational_extracted_count = extraction_status.get("educational_extracted", 0)
 
@@ -1080,7 +1116,9 @@ async def get_worker_data(worker_id: str):
         # Add verification information
         if verification_status == "verified":
             # Get verification details
-            educational_docs_verification = crud.get_educational_documents_for_verification(worker_id)
+            educational_docs_verification = await asyncio.to_thread(
+                crud.get_educational_documents_for_verification, worker_id
+            )
             comparisons = []
             for edu_doc in educational_docs_verification:
                 comparisons.append({
@@ -1506,7 +1544,7 @@ async def submit_form(
     # Use provided worker_id or generate new one
     if worker_id:
         # Verify worker exists and mobile number matches
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             logger.warning(f"Worker ID provided but not found: {worker_id}")
             raise HTTPException(status_code=404, detail="Worker ID not found. Please signup first.")
@@ -1524,7 +1562,7 @@ async def submit_form(
         logger.info(f"Generated new worker ID: {worker_id}")
 
         # Create worker record
-        success = crud.create_worker(worker_id, mobile_number)
+        success = await asyncio.to_thread(crud.create_worker, worker_id, mobile_number)
         if not success:
             logger.error(f"Failed to create worker record for {worker_id}")
             raise HTTPException(status_code=500, detail="Failed to create worker record")
@@ -1567,7 +1605,7 @@ async def submit_form(
 
         # CRITICAL: Save document path to database for reliable retrieval
         # This ensures OCR can find the document even if file system paths differ
-        path_saved = crud.save_personal_document_path(worker_id, personal_doc_path)
+        path_saved = await asyncio.to_thread(crud.save_personal_document_path, worker_id, personal_doc_path)
         if not path_saved:
             logger.error(f"CRITICAL: Failed to save personal document path to database for worker {worker_id}")
             logger.error(f"  File saved to: {personal_doc_path}")
@@ -1577,7 +1615,7 @@ async def submit_form(
             logger.info(f"✓ Saved personal document path to database: {personal_doc_path}")
 
             # Verify path was saved correctly
-            db_paths = crud.get_worker_document_paths(worker_id)
+            db_paths = await asyncio.to_thread(crud.get_worker_document_paths, worker_id)
             if db_paths.get("personal") == personal_doc_path:
                 logger.info(f"✓ Verified: Personal document path correctly stored in database")
             else:
@@ -1636,7 +1674,9 @@ async def submit_form(
 
                         # CRITICAL: Save document path to database for reliable retrieval
                         # This ensures OCR can find the document even if file system paths differ
-                        path_saved = crud.add_educational_document_path(worker_id, educational_doc_path)
+                        path_saved = await asyncio.to_thread(
+                            crud.add_educational_document_path, worker_id, educational_doc_path
+                        )
                         if not path_saved:
                             logger.error(
                                 f"CRITICAL: Failed to save educational document path to database for worker {worker_id}")
@@ -1647,7 +1687,7 @@ async def submit_form(
                             logger.info(f"✓ Saved educational document path to database: {educational_doc_path}")
 
                             # Verify path was saved correctly
-                            db_paths = crud.get_worker_document_paths(worker_id)
+                            db_paths = await asyncio.to_thread(crud.get_worker_document_paths, worker_id)
                             edu_paths_in_db = db_paths.get("educational", [])
                             if educational_doc_path in edu_paths_in_db:
                                 logger.info(f"✓ Verified: Educational document path correctly stored in database")
@@ -1819,7 +1859,7 @@ async def trigger_ocr_and_voice(worker_id: str, personal_doc_path: str, educatio
         address = extracted.get("address") or ""
 
         logger.info(f"Saving extracted data to database for worker {worker_id}...")
-        success = crud.update_worker_data(worker_id, name, dob, address)
+        success = await asyncio.to_thread(crud.update_worker_data, worker_id, name, dob, address)
 
         if not success:
             logger.error(f"Failed to update worker data for {worker_id}")
@@ -1830,7 +1870,7 @@ async def trigger_ocr_and_voice(worker_id: str, personal_doc_path: str, educatio
         logger.info(
             f"Successfully updated worker data for {worker_id} - Name: {name[:30] if name else 'None'}, DOB: {dob}, Address: {address[:30] if address else 'None'}")
         # Verify persistence (helps diagnose if DB path differs)
-        verify = crud.get_worker(worker_id)
+        verify = await asyncio.to_thread(crud.get_worker, worker_id)
         if verify and (verify.get("name") or verify.get("dob") or verify.get("address")):
             logger.info(f"Verified worker {worker_id} has name/dob/address in DB")
         else:
@@ -1919,7 +1959,8 @@ async def trigger_ocr_and_voice(worker_id: str, personal_doc_path: str, educatio
 
                                 logger.info(f"Saving education data to database for worker {worker_id}...")
                                 # Use save_educational_document_with_llm_data for proper verification
-                                success = crud.save_educational_document_with_llm_data(
+                                success = await asyncio.to_thread(
+                                    crud.save_educational_document_with_llm_data,
                                     worker_id=worker_id,
                                     education_data=education_data,
                                     raw_ocr_text=education_ocr_text,
@@ -1993,9 +2034,7 @@ async def initiate_voice_call(worker_id: str) -> bool:
         bool: True if call was initiated successfully, False otherwise
     """
     try:
-        import httpx
-
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             logger.error(f"Worker not found for voice call: {worker_id}")
             return False
@@ -2017,72 +2056,72 @@ async def initiate_voice_call(worker_id: str) -> bool:
         logger.info("=" * 80)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                r = await client.post(
-                    voice_agent_url,
-                    params={
-                        "phone_number": mobile_number,
-                        "worker_id": worker_id  # Pass worker_id so Voice Agent can include it
-                    }
-                )
-                if r.is_success:
-                    logger.info(
-                        f"✓ Voice Agent API called successfully for {mobile_number} (worker_id: {worker_id}): {r.status_code}")
-                    # Voice Agent may return call_id - create voice session so transcript can be linked to this worker
-                    try:
-                        response_data = r.json()
-                        call_id = response_data.get("call_id") if isinstance(response_data, dict) else None
-                        if call_id:
-                            logger.info(f"✓ Voice Agent generated call_id: {call_id}")
-                            if crud.create_voice_session(call_id, worker_id, mobile_number):
-                                logger.info(
-                                    f"✓ Voice session created: call_id={call_id} -> worker_id={worker_id} (transcript will link to same worker)")
-                                return True
-                            else:
-                                # Session might already exist - try to link worker_id if not already linked
-                                session = crud.get_voice_session(call_id)
-                                if session and not session.get("worker_id"):
-                                    crud.link_call_to_worker(call_id, worker_id)
-                                    logger.info(
-                                        f"✓ Linked existing session: call_id={call_id} -> worker_id={worker_id}")
-                                logger.warning(f"Voice session for call_id={call_id} already exists or create failed")
-                                return True  # Call was initiated even if session creation failed
+            client = get_voice_agent_client()
+            r = await client.post(
+                voice_agent_url,
+                params={
+                    "phone_number": mobile_number,
+                    "worker_id": worker_id  # Pass worker_id so Voice Agent can include it
+                }
+            )
+            if r.is_success:
+                logger.info(
+                    f"✓ Voice Agent API called successfully for {mobile_number} (worker_id: {worker_id}): {r.status_code}")
+                # Voice Agent may return call_id - create voice session so transcript can be linked to this worker
+                try:
+                    response_data = r.json()
+                    call_id = response_data.get("call_id") if isinstance(response_data, dict) else None
+                    if call_id:
+                        logger.info(f"✓ Voice Agent generated call_id: {call_id}")
+                        if await asyncio.to_thread(crud.create_voice_session, call_id, worker_id, mobile_number):
+                            logger.info(
+                                f"✓ Voice session created: call_id={call_id} -> worker_id={worker_id} (transcript will link to same worker)")
+                            return True
                         else:
-                            logger.warning(f"Voice Agent response (no call_id): {response_data}")
-                            logger.warning(
-                                f"  Note: When transcript is submitted, worker_id will be resolved from phone_number={mobile_number}")
-                            logger.warning(f"  Mapping will be created automatically during transcript submission")
-                            return True  # API call succeeded even without call_id - mapping will happen during transcript submit
-                    except Exception as json_error:
-                        logger.debug(f"Could not parse Voice Agent response as JSON: {json_error}")
+                            # Session might already exist - try to link worker_id if not already linked
+                            session = await asyncio.to_thread(crud.get_voice_session, call_id)
+                            if session and not session.get("worker_id"):
+                                await asyncio.to_thread(crud.link_call_to_worker, call_id, worker_id)
+                                logger.info(
+                                    f"✓ Linked existing session: call_id={call_id} -> worker_id={worker_id}")
+                            logger.warning(f"Voice session for call_id={call_id} already exists or create failed")
+                            return True  # Call was initiated even if session creation failed
+                    else:
+                        logger.warning(f"Voice Agent response (no call_id): {response_data}")
                         logger.warning(
                             f"  Note: When transcript is submitted, worker_id will be resolved from phone_number={mobile_number}")
-                        return True  # API call succeeded even if JSON parsing failed - mapping will happen during transcript submit
+                        logger.warning(f"  Mapping will be created automatically during transcript submission")
+                        return True  # API call succeeded even without call_id - mapping will happen during transcript submit
+                except Exception as json_error:
+                    logger.debug(f"Could not parse Voice Agent response as JSON: {json_error}")
+                    logger.warning(
+                        f"  Note: When transcript is submitted, worker_id will be resolved from phone_number={mobile_number}")
+                    return True  # API call succeeded even if JSON parsing failed - mapping will happen during transcript submit
+            else:
+                # Check for ngrok offline error
+                if r.status_code == 404 and 'ngrok-error-code' in r.headers:
+                    ngrok_error = r.headers.get('ngrok-error-code', '')
+                    logger.error("=" * 80)
+                    logger.error("✗ NGROK TUNNEL IS OFFLINE")
+                    logger.error(f"  Error Code: {ngrok_error}")
+                    logger.error(f"  URL: {voice_agent_url}")
+                    logger.error(f"  Status: {r.status_code}")
+                    logger.error("")
+                    logger.error("  ACTION REQUIRED:")
+                    logger.error("  1. Start your ngrok tunnel:")
+                    logger.error(f"     ngrok http <your-voice-agent-port>")
+                    logger.error("  2. Update VOICE_AGENT_BASE_URL in .env with new ngrok URL")
+                    logger.error("  3. Restart the backend server")
+                    logger.error("")
+                    logger.error("  NOTE: Form submission will continue, but voice calls cannot be initiated.")
+                    logger.error("  You can manually trigger voice calls later when ngrok is active.")
+                    logger.error("=" * 80)
+                    return False
                 else:
-                    # Check for ngrok offline error
-                    if r.status_code == 404 and 'ngrok-error-code' in r.headers:
-                        ngrok_error = r.headers.get('ngrok-error-code', '')
-                        logger.error("=" * 80)
-                        logger.error("✗ NGROK TUNNEL IS OFFLINE")
-                        logger.error(f"  Error Code: {ngrok_error}")
-                        logger.error(f"  URL: {voice_agent_url}")
-                        logger.error(f"  Status: {r.status_code}")
-                        logger.error("")
-                        logger.error("  ACTION REQUIRED:")
-                        logger.error("  1. Start your ngrok tunnel:")
-                        logger.error(f"     ngrok http <your-voice-agent-port>")
-                        logger.error("  2. Update VOICE_AGENT_BASE_URL in .env with new ngrok URL")
-                        logger.error("  3. Restart the backend server")
-                        logger.error("")
-                        logger.error("  NOTE: Form submission will continue, but voice calls cannot be initiated.")
-                        logger.error("  You can manually trigger voice calls later when ngrok is active.")
-                        logger.error("=" * 80)
-                        return False
-                    else:
-                        logger.warning(f"✗ Voice Agent API returned {r.status_code} for {mobile_number}")
-                        logger.warning(f"Response preview: {r.text[:500]}...")
-                        logger.warning(f"Response headers: {dict(r.headers)}")
-                        return False
+                    logger.warning(f"✗ Voice Agent API returned {r.status_code} for {mobile_number}")
+                    logger.warning(f"Response preview: {r.text[:500]}...")
+                    logger.warning(f"Response headers: {dict(r.headers)}")
+                    return False
         except Exception as e:
             # Catch all httpx exceptions (TimeoutException, ConnectError, etc.)
             error_type = type(e).__name__
@@ -2130,7 +2169,7 @@ async def upload_personal_document(
     """
     try:
         # Verify worker exists
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found. Please signup first.")
 
@@ -2169,7 +2208,7 @@ async def upload_personal_document(
         # CRITICAL: Save document path to database for reliable retrieval
         # This ensures OCR can find the document even if file system paths differ
         personal_doc_path = str(file_path)
-        path_saved = crud.save_personal_document_path(worker_id, personal_doc_path)
+        path_saved = await asyncio.to_thread(crud.save_personal_document_path, worker_id, personal_doc_path)
         if not path_saved:
             logger.error(f"CRITICAL: Failed to save personal document path to database for worker {worker_id}")
             logger.error(f"  File saved to: {personal_doc_path}")
@@ -2179,7 +2218,7 @@ async def upload_personal_document(
             logger.info(f"✓ Saved personal document path to database: {personal_doc_path}")
 
             # Verify path was saved correctly
-            db_paths = crud.get_worker_document_paths(worker_id)
+            db_paths = await asyncio.to_thread(crud.get_worker_document_paths, worker_id)
             if db_paths.get("personal") == personal_doc_path:
                 logger.info(f"✓ Verified: Personal document path correctly stored in database")
             else:
@@ -2225,7 +2264,7 @@ async def upload_educational_document(
     """
     try:
         # Verify worker exists
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found. Please signup first.")
 
@@ -2264,7 +2303,7 @@ async def upload_educational_document(
         # CRITICAL: Save document path to database for reliable retrieval
         # This ensures OCR can find the document even if file system paths differ
         educational_doc_path = str(file_path)
-        path_saved = crud.add_educational_document_path(worker_id, educational_doc_path)
+        path_saved = await asyncio.to_thread(crud.add_educational_document_path, worker_id, educational_doc_path)
         if not path_saved:
             logger.error(f"CRITICAL: Failed to save educational document path to database for worker {worker_id}")
             logger.error(f"  File saved to: {educational_doc_path}")
@@ -2274,7 +2313,7 @@ async def upload_educational_document(
             logger.info(f"✓ Saved educational document path to database: {educational_doc_path}")
 
             # Verify path was saved correctly
-            db_paths = crud.get_worker_document_paths(worker_id)
+            db_paths = await asyncio.to_thread(crud.get_worker_document_paths, worker_id)
             edu_paths_in_db = db_paths.get("educational", [])
             if educational_doc_path in edu_paths_in_db:
                 logger.info(f"✓ Verified: Educational document path correctly stored in database")
@@ -2317,7 +2356,7 @@ async def upload_video(
     """
     try:
         # Verify worker exists
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found. Please signup first.")
 
@@ -2396,7 +2435,7 @@ async def upload_video(
             logger.info(f"✓ Video uploaded to Cloudinary: {video_url}")
 
             # Save video URL to database
-            success = crud.save_video_url(worker_id, video_url)
+            success = await asyncio.to_thread(crud.save_video_url, worker_id, video_url)
             if not success:
                 logger.error(f"Failed to save video URL to database for worker {worker_id}")
                 raise HTTPException(status_code=500, detail="Failed to save video URL to database")
@@ -2458,7 +2497,7 @@ async def process_ocr_for_review(worker_id: str):
     This shows the "Analysing data from the documents" screen.
     """
     try:
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found")
 
@@ -2497,7 +2536,8 @@ async def process_ocr_for_review(worker_id: str):
                 )
 
         # Save pending OCR results for review
-        success = crud.save_pending_ocr_results(
+        success = await asyncio.to_thread(
+            crud.save_pending_ocr_results,
             worker_id,
             personal_data=personal_data,
             education_data=education_data,
@@ -2528,7 +2568,7 @@ async def process_ocr_for_review(worker_id: str):
 
 
 @router.get("/{worker_id}/ocr-results")
-async def get_ocr_results(worker_id: str):
+def get_ocr_results(worker_id: str):
     """
     Get OCR results for review (if already processed).
     Returns data to display in review screen (Personal Details & Education Details).
@@ -2562,12 +2602,12 @@ async def submit_reviewed_data(worker_id: str):
     Saves data to database and initiates voice call.
     """
     try:
-        worker = crud.get_worker(worker_id)
+        worker = await asyncio.to_thread(crud.get_worker, worker_id)
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found")
 
         # Get pending OCR results
-        pending = crud.get_pending_ocr_results(worker_id)
+        pending = await asyncio.to_thread(crud.get_pending_ocr_results, worker_id)
         if not pending:
             raise HTTPException(status_code=400, detail="No OCR results found. Please process OCR first.")
 
@@ -2581,7 +2621,7 @@ async def submit_reviewed_data(worker_id: str):
             name = _normalize_name(personal_data.get("name") or "")
             dob = personal_data.get("dob") or ""
             address = personal_data.get("address") or ""
-            success = crud.update_worker_data(worker_id, name, dob, address)
+            success = await asyncio.to_thread(crud.update_worker_data, worker_id, name, dob, address)
             if not success:
                 logger.error(f"Failed to save personal data for {worker_id}")
                 raise HTTPException(status_code=500, detail="Failed to save personal data")
@@ -2600,14 +2640,14 @@ async def submit_reviewed_data(worker_id: str):
                 "percentage": education_data.get("percentage", ""),
                 "institution": education_data.get("institution", "")
             }
-            success = crud.save_educational_document(worker_id, education_record)
+            success = await asyncio.to_thread(crud.save_educational_document, worker_id, education_record)
             if not success:
                 logger.warning(f"Failed to save education data for {worker_id}, continuing...")
                 # Don't fail the entire submission if education save fails
 
         # Delete pending OCR results (cleanup)
         try:
-            crud.delete_pending_ocr_results(worker_id)
+            await asyncio.to_thread(crud.delete_pending_ocr_results, worker_id)
         except Exception as e:
             logger.warning(f"Failed to delete pending OCR results for {worker_id}: {str(e)}")
             # Don't fail if cleanup fails - data is already saved
@@ -2691,7 +2731,7 @@ async def _safe_trigger_ocr_and_voice(worker_id: str, personal_doc_path: str, ed
 
 
 @router.post("/{worker_id}/final-submit")
-async def final_submit(worker_id: str, background_tasks: BackgroundTasks):
+def final_submit(worker_id: str, background_tasks: BackgroundTasks):
     """
     Final submit - returns instantly; starts background task to initiate phone call.
     Frontend shows popup with message. Call initiation (and OCR if needed) runs in background.
@@ -2780,7 +2820,7 @@ async def final_submit(worker_id: str, background_tasks: BackgroundTasks):
     description="Delete specific document data from database. data_type can be 'personal', 'educational', or 'both'. Personal deletion clears name, dob, address, and work experience. Educational deletion clears educational documents. Both clears everything except worker_id and mobile_number.",
     operation_id="delete_document_data",
 )
-async def delete_document_data(worker_id: str, data_type: str):
+def delete_document_data(worker_id: str, data_type: str):
     """
     Delete document data based on type selection.
 
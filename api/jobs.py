@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
+import heapq
 import json
 
 from ..db import crud
@@ -8,7 +9,7 @@ from ..services.job_matcher import match_worker_to_job, generate_sample_jobs
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 @router.get("/seed")
-async def seed_sample_jobs():
+def seed_sample_jobs():
     """
     Seed database with sample job listings.
     Run once during initialization.
@@ -37,7 +38,7 @@ async def seed_sample_jobs():
     )
 
 @router.get("/match")
-async def match_worker_to_jobs(worker_id: str):
+def match_worker_to_jobs(worker_id: str):
     """
     Match worker to suitable jobs.
     Returns top matching jobs with scores.
@@ -55,13 +56,12 @@ async def match_worker_to_jobs(worker_id: str):
     if not experience:
         raise HTTPException(status_code=400, detail="Experience data not found")
     
-    # Get all jobs
-    jobs = crud.get_all_jobs()
-    
-    # Match worker to each job
+    # Stream jobs from the DB and match worker to each one
     matches = []
+    total_jobs = 0
     
-    for job in jobs:
+    for job in crud.iter_all_jobs():
+        total_jobs += 1
         match_data = match_worker_to_job(
             worker_id,
             experience.get("skills", []),
@@ -83,11 +83,8 @@ async def match_worker_to_jobs(worker_id: str):
             "location_match": match_data["location_score"],
         })
     
-    # Sort by match score
-    matches.sort(key=lambda x: x["match_score"], reverse=True)
-    
-    # Return top 10
-    top_matches = matches[:10]
+    # Top 10 by match score (stable for ties, like a full sort)
+    top_matches = heapq.nlargest(10, matches, key=lambda x: x["match_score"])
     
     return JSONResponse(
         status_code=200,
@@ -95,13 +92,13 @@ async def match_worker_to_jobs(worker_id: str):
             "status": "success",
             "worker_id": worker_id,
             "worker_name": worker.get("name", "Unknown"),
-            "total_jobs": len(jobs),
+            "total_jobs": total_jobs,
             "matches": top_matches
         }
     )
 
 @router.get("/all")
-async def get_all_jobs():
+def get_all_jobs():
     """Get all job listings"""
     
     jobs = crud.get_all_jobs()
@@ -116,16 +113,10 @@ async def get_all_jobs():
     )
 
 @router.get("/{job_id}")
-async def get_job_details(job_id: int):
+def get_job_details(job_id: int):
     """Get specific job details"""
     
-    jobs = crud.get_all_jobs()
-    
-    job = None
-    for j in jobs:
-        if j.get("job_id") == job_id or j.get("id") == job_id:
-            job = j
-            break
+    job = crud.get_job(job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
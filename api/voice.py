@@ -1,13 +1,24 @@
+import asyncio
+import copy
+import functools
 import json
 import logging
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+import uuid
+from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from ..db import crud
 
-# Use root logger configured in main.py - all logs will be saved to file
+try:
+    import orjson  # Optional: faster JSON parsing / response rendering
+except ImportError:
+    orjson = None
+
+# ORJSONResponse needs orjson installed; fall back to the stdlib encoder otherwise
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Level comes from the root logger (LOG_LEVEL, configured once in main / utils.logger)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 from ..db.models import VoiceWebhookInput, TranscriptSubmitRequest, LinkCallToWorkerRequest, ExperienceConfirmRequest
 from ..services import conversation_engine, language_renderer
@@ -18,12 +29,31 @@ from ..services.experience_extractor import extract_from_transcript, extract_fro
 
 router = APIRouter(prefix="/voice", tags=["voice"])
 
+# Initial Hinglish prompt is constant for the process lifetime - resolve once at import
+_INITIAL_VOICE_PROMPT = language_renderer.get_voice_prompt(0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_experience_json(experience_json: str) -> dict:
+    """Parse voice_sessions.experience_json (orjson when installed), cached per blob"""
+    if orjson is not None:
+        return orjson.loads(experience_json)
+    return json.loads(experience_json)
+
+
+def _parse_experience_json(experience_json: str) -> dict:
+    """
+    Parse voice_sessions.experience_json.
+    Link -> confirm retries reuse the cached parse; the result is a fresh copy, so callers may mutate it.
+    """
+    return copy.deepcopy(_load_experience_json(experience_json))
+
 
 # RAW SPEECH TEXT IS NOT STORED
 # Backend controls all conversation flow
 
 @router.post("/call/webhook")
-async def voice_webhook(input_data: VoiceWebhookInput):
+def voice_webhook(input_data: VoiceWebhookInput):
     """
     Voice webhook endpoint.
     Receives speech, determines next question.
@@ -65,8 +95,7 @@ async def voice_webhook(input_data: VoiceWebhookInput):
 
     # Update worker_id if we resolved it and session doesn't have it
     if worker_id and not session.get("worker_id"):
-        crud.link_call_to_worker(call_id, worker_id)
-        session = crud.get_voice_session(call_id)
+        session = crud.link_call_and_get_session(call_id, worker_id) or session
 
     current_step = session.get("current_step", 0)
 
@@ -105,7 +134,7 @@ async def voice_webhook(input_data: VoiceWebhookInput):
         # Persist final responses then save experience and generate CV (only if worker_id available)
         crud.update_voice_session(call_id, next_step, "ongoing", responses_json=responses_json_str)
         if worker_id:
-            await finalize_conversation(worker_id, call_id)
+            finalize_conversation(worker_id, call_id)
         next_step = 4
     else:
         crud.update_voice_session(call_id, next_step, "ongoing", responses_json=responses_json_str)
@@ -126,11 +155,11 @@ async def voice_webhook(input_data: VoiceWebhookInput):
     )
 
 
-async def finalize_conversation(worker_id: str, call_id: str):
+def finalize_conversation(worker_id: str, call_id: str):
     """Finalize conversation: save experience from voice responses, then generate CV."""
     from ..services.cv_generator import save_cv
     from ..services.embedding_service import prepare_for_chromadb
-    from ..vector_db.chroma_client import get_vector_db
+    from ..services.embedding_retry import store_embedding
     from ..config import CVS_DIR
 
     try:
@@ -183,7 +212,7 @@ async def finalize_conversation(worker_id: str, call_id: str):
             try:
                 save_cv(
                     worker_id,
-                    dict(worker),
+                    worker,
                     experience,
                     CVS_DIR,
                     education_data=education_data_list,
@@ -201,13 +230,8 @@ async def finalize_conversation(worker_id: str, call_id: str):
 
             # Store embedding
             try:
-                vector_db = get_vector_db()
-                embedding_data = prepare_for_chromadb(worker_id, dict(worker), experience)
-                vector_db.add_document(
-                    embedding_data["id"],
-                    embedding_data["document"],
-                    embedding_data["metadata"]
-                )
+                # Failed writes are queued in pending_embeddings for background retry
+                store_embedding(prepare_for_chromadb(worker_id, worker, experience))
             except Exception as e:
                 logger.warning(f"Failed to store embedding for {worker_id}: {str(e)}", exc_info=True)
                 # Don't fail - embedding is optional
@@ -218,8 +242,51 @@ async def finalize_conversation(worker_id: str, call_id: str):
         # Don't raise - allow flow to continue
 
 
+def _store_embedding(worker_id: str, worker_data: dict, experience: dict):
+    """
+    Store worker CV embedding in the vector database. Raises on failure; callers decide if it is fatal.
+    Failed vector DB writes are queued in pending_embeddings and retried in the background.
+    """
+    from ..services.embedding_service import prepare_for_chromadb
+    from ..services.embedding_retry import store_embedding
+
+    store_embedding(prepare_for_chromadb(worker_id, worker_data, experience))
+
+
+async def _generate_cv_and_store_embedding(worker_id: str, worker_data: dict, experience: dict,
+                                           education_data_list: list = None, transcript: str = None):
+    """Background task for the link auto-save flow: generate CV and store embedding concurrently. Never raises."""
+    from ..services.cv_generator import save_cv
+    from ..config import CVS_DIR
+
+    # CV (file + LLM) and embedding (vector DB) share no data once experience is known - overlap them
+    cv_result, embedding_result = await asyncio.gather(
+        asyncio.to_thread(
+            save_cv,
+            worker_id,
+            worker_data,
+            experience,
+            CVS_DIR,
+            education_data=education_data_list,
+            use_llm=True,
+            transcript=transcript
+        ),
+        asyncio.to_thread(_store_embedding, worker_id, worker_data, experience),
+        return_exceptions=True
+    )
+
+    if isinstance(cv_result, Exception):
+        logger.error(f"Background CV generation failed for {worker_id}: {str(cv_result)}", exc_info=cv_result)
+    else:
+        logger.info(f"✓ Background CV generated for worker {worker_id}: {cv_result}")
+
+    if isinstance(embedding_result, Exception):
+        # Don't fail - embedding is optional
+        logger.warning(f"Failed to store embedding for {worker_id}: {str(embedding_result)}", exc_info=embedding_result)
+
+
 @router.post("/transcript/submit")
-async def submit_transcript(body: TranscriptSubmitRequest):
+def submit_transcript(body: TranscriptSubmitRequest):
     """
     Voice Agent webhook: submit full conversation transcript after call ends.
 
@@ -285,23 +352,20 @@ async def submit_transcript(body: TranscriptSubmitRequest):
             if worker:
                 worker_id = worker["worker_id"]
                 logger.info(f"✓ Resolved worker_id from session phone_number: {worker_id}")
-                crud.link_call_to_worker(call_id, worker_id)
-                session = crud.get_voice_session(call_id)
+                session = crud.link_call_and_get_session(call_id, worker_id) or session
 
     # Link call_id to worker_id as soon as we have both, so transcript is stored with correct worker_id
     if worker_id and session and not session.get("worker_id"):
-        crud.link_call_to_worker(call_id, worker_id)
-        session = crud.get_voice_session(call_id)
+        session = crud.link_call_and_get_session(call_id, worker_id) or session
         logger.info(f"✓ Call {call_id} linked to worker {worker_id} before saving transcript")
 
-    # FLAG-BASED FLOW: Set exp_ready=false before extraction starts
-    logger.info("=" * 80)
-    logger.info("🚩 SETTING exp_ready=FALSE (extraction in progress)")
-    logger.info(f"  Call ID: {call_id}")
-    logger.info("=" * 80)
-    crud.update_voice_session(call_id, session.get("current_step", 0) if session else 0,
-                              session.get("status", "ongoing") if session else "ongoing", exp_ready=False)
-    session = crud.get_voice_session(call_id)  # Refresh session
+    # FLAG-BASED FLOW: exp_ready is created as 0, so only a re-submitted call needs it reset before extraction.
+    # transcript, experience_json and exp_ready=1 are then written together in a single UPDATE below.
+    if session and session.get("exp_ready"):
+        logger.info(f"🚩 Resetting exp_ready=FALSE for re-submitted call {call_id} (extraction in progress)")
+        crud.update_voice_session(call_id, session.get("current_step", 0),
+                                  session.get("status", "ongoing"), exp_ready=False)
+        session["exp_ready"] = False
 
     # STEP 1: Save transcript as JSON file FIRST (before LLM processing)
     transcript_json_data = {
@@ -427,29 +491,20 @@ async def submit_transcript(body: TranscriptSubmitRequest):
         logger.error(f"[DB_UPDATE] ✗ exp_ready flag may not have been set correctly")
 
     # FLAG-BASED FLOW: Read exp_ready from database to verify it was set correctly
+    # (flag-only read - the transcript / experience_json just written are not fetched back)
     logger.info("[DB_VERIFY] Verifying exp_ready flag was set correctly in database...")
-    session = crud.get_voice_session(call_id)
-
-    # Ensure exp_ready is properly converted to boolean for JSON response
-    exp_ready_value = session.get("exp_ready", 0) if session else 0
-    exp_ready_from_db = bool(exp_ready_value)
+    exp_ready_flag = crud.get_exp_ready_flag(call_id)
+    exp_ready_from_db = exp_ready_flag or False
 
     logger.info(f"[DB_VERIFY] Database query result:")
-    logger.info(f"[DB_VERIFY]   - Session exists: {session is not None}")
-    if session:
-        logger.info(
-            f"[DB_VERIFY]   - exp_ready (raw): {exp_ready_value} (type: {type(exp_ready_value)})")
-        logger.info(f"[DB_VERIFY]   - exp_ready (bool): {exp_ready_from_db}")
-        logger.info(f"[DB_VERIFY]   - status: {session.get('status')}")
-        logger.info(f"[DB_VERIFY]   - current_step: {session.get('current_step')}")
-        logger.info(f"[DB_VERIFY]   - has transcript: {len(session.get('transcript', '')) > 0}")
-        logger.info(f"[DB_VERIFY]   - has experience_json: {len(session.get('experience_json', '')) > 0}")
+    logger.info(f"[DB_VERIFY]   - Session exists: {exp_ready_flag is not None}")
+    logger.info(f"[DB_VERIFY]   - exp_ready: {exp_ready_from_db}")
 
     if exp_ready_from_db:
         logger.info(f"✓ VERIFIED: exp_ready flag is TRUE in database")
     else:
         logger.error(
-            f"✗ ERROR: exp_ready flag is NOT TRUE in database (value: {exp_ready_value})")
+            f"✗ ERROR: exp_ready flag is NOT TRUE in database (value: {exp_ready_flag})")
 
     # STEP 4: FLAG-BASED FLOW - Do NOT save experience to work_experience table or generate CV automatically
     # Experience is stored in voice_sessions.experience_json and will be saved after user confirmation
@@ -507,7 +562,7 @@ async def submit_transcript(body: TranscriptSubmitRequest):
                 "experience_extracted": True,
                 "experience_saved": False,  # Not saved to work_experience table yet
                 "cv_generated": False,  # Not generated yet
-                "exp_ready": bool(exp_ready_from_db),  # Explicitly cast to boolean for JSON
+                "exp_ready": exp_ready_from_db,
                 "experience": experience,  # Include experience object for frontend review
             }
         )
@@ -535,7 +590,7 @@ async def submit_transcript(body: TranscriptSubmitRequest):
                 "experience_extracted": True,
                 "experience_saved": False,
                 "cv_generated": False,
-                "exp_ready": bool(exp_ready_from_db),  # Explicitly cast to boolean for JSON
+                "exp_ready": exp_ready_from_db,
                 "message": "Transcript saved as JSON file. Link call_id to worker_id to confirm experience.",
                 "link_endpoint": "/voice/call/link"
             }
@@ -557,37 +612,33 @@ async def confirm_experience(body: ExperienceConfirmRequest):
     6. Generates CV using save_cv() function
     7. Stores embedding in vector database
     8. Returns success response with has_cv=true
+    Steps 6 and 7 run concurrently in worker threads.
     """
     from ..services.cv_generator import save_cv
-    from ..services.embedding_service import prepare_for_chromadb
-    from ..vector_db.chroma_client import get_vector_db
     from ..config import CVS_DIR
 
     call_id = body.call_id
     worker_id = body.worker_id
     experience = body.experience
 
-    logger.info("=" * 80)
-    logger.info("✅ EXPERIENCE CONFIRMATION REQUEST")
-    logger.info(f"  Call ID: {call_id}")
-    logger.info(f"  Worker ID: {worker_id}")
-    logger.info(f"  Experience Data: {json.dumps(experience, ensure_ascii=False, indent=2)}")
-    logger.info("=" * 80)
+    logger.info("experience_confirm call_id=%s worker_id=%s", call_id, worker_id)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Experience Data: %s", json.dumps(experience, ensure_ascii=False, indent=2))
 
     # Validate worker exists
-    worker = crud.get_worker(worker_id)
+    worker = await asyncio.to_thread(crud.get_worker, worker_id)
     if not worker:
         logger.error(f"Worker {worker_id} not found for experience confirmation")
         raise HTTPException(status_code=404, detail="Worker not found")
 
     # Validate voice session exists
-    session = crud.get_voice_session(call_id)
+    session = await asyncio.to_thread(crud.get_voice_session, call_id)
     if not session:
         logger.error(f"Voice session {call_id} not found for experience confirmation")
         raise HTTPException(status_code=404, detail="Voice session not found")
 
     # Validate exp_ready flag - must be true to confirm
-    exp_ready = bool(session.get("exp_ready", 0))
+    exp_ready = session.get("exp_ready") or False
     if not exp_ready:
         logger.error(f"exp_ready flag is false for call_id {call_id} - cannot confirm experience")
         raise HTTPException(
@@ -595,71 +646,63 @@ async def confirm_experience(body: ExperienceConfirmRequest):
             detail="Experience extraction not complete. Cannot confirm experience until exp_ready is true."
         )
 
-    logger.info(f"✓ exp_ready flag verified: {exp_ready}")
+    logger.debug("✓ exp_ready flag verified: %s", exp_ready)
 
     # Get transcript from voice session
     transcript = session.get("transcript")
 
     # Save experience to work_experience table
-    logger.info(f"Saving confirmed experience to work_experience table for worker_id: {worker_id}")
-    success = crud.save_experience(worker_id, experience)
+    logger.debug("Saving confirmed experience to work_experience table for worker_id: %s", worker_id)
+    success = await asyncio.to_thread(crud.save_experience, worker_id, experience)
     if not success:
         logger.error(f"Failed to save experience for {worker_id} during confirmation")
         raise HTTPException(status_code=500, detail="Failed to save experience")
 
-    logger.info(f"✓ Experience saved to work_experience table for worker_id: {worker_id}")
+    logger.debug("✓ Experience saved to work_experience table for worker_id: %s", worker_id)
 
     # Generate CV using save_cv() function
-    education_docs = crud.get_educational_documents(worker_id)
+    education_docs = await asyncio.to_thread(crud.get_educational_documents, worker_id)
     education_data_list = education_docs if education_docs else None
 
-    cv_path = None
-    try:
-        logger.info(f"Generating CV for worker_id: {worker_id} after experience confirmation")
-        if transcript:
-            logger.info(f"Using transcript for CV generation (length: {len(transcript)} chars)")
-        cv_path = save_cv(
+    # Generate CV and store embedding concurrently - both only depend on the confirmed experience
+    logger.debug("Generating CV for worker_id: %s after experience confirmation", worker_id)
+    if transcript:
+        logger.debug("Using transcript for CV generation (length: %d chars)", len(transcript))
+    cv_result, embedding_result = await asyncio.gather(
+        asyncio.to_thread(
+            save_cv,
             worker_id,
-            dict(worker),
+            worker,
             experience,
             CVS_DIR,
             education_data=education_data_list,
             use_llm=True,
             transcript=transcript
-        )
-        logger.info(f"✓ CV generated successfully: {cv_path}")
-    except Exception as e:
-        logger.error(f"Failed to generate CV for {worker_id} after confirmation: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to generate CV: {str(e)}")
+        ),
+        asyncio.to_thread(_store_embedding, worker_id, worker, experience),
+        return_exceptions=True
+    )
 
-    # Store embedding in vector database
-    try:
-        vector_db = get_vector_db()
-        embedding_data = prepare_for_chromadb(worker_id, dict(worker), experience)
-        vector_db.add_document(
-            embedding_data["id"],
-            embedding_data["document"],
-            embedding_data["metadata"]
-        )
-        logger.info(f"✓ Embedding stored for worker_id: {worker_id}")
-    except Exception as e:
-        logger.warning(f"Failed to store embedding for {worker_id}: {str(e)}", exc_info=True)
+    if isinstance(embedding_result, Exception):
+        logger.warning(f"Failed to store embedding for {worker_id}: {str(embedding_result)}", exc_info=embedding_result)
         # Don't fail - embedding is optional
+    else:
+        logger.debug("✓ Embedding stored for worker_id: %s", worker_id)
+
+    if isinstance(cv_result, Exception):
+        logger.error(f"Failed to generate CV for {worker_id} after confirmation: {str(cv_result)}", exc_info=cv_result)
+        raise HTTPException(status_code=500, detail=f"Failed to generate CV: {str(cv_result)}")
+    cv_path = cv_result
+    logger.info(f"✓ CV generated successfully: {cv_path}")
 
     # Get has_cv status from database
-    cv_status_record = crud.get_cv_status(worker_id)
-    has_cv_status = bool(cv_status_record.get("has_cv", False)) if cv_status_record else False
+    cv_status_record = await asyncio.to_thread(crud.get_cv_status, worker_id)
+    has_cv_status = (cv_status_record.get("has_cv") or False) if cv_status_record else False
 
-    logger.info("=" * 80)
-    logger.info("✅ EXPERIENCE CONFIRMATION COMPLETED SUCCESSFULLY")
-    logger.info(f"  Call ID: {call_id}")
-    logger.info(f"  Worker ID: {worker_id}")
-    logger.info(f"  Experience Saved: ✓")
-    logger.info(f"  CV Generated: ✓")
-    logger.info(f"  has_cv: {has_cv_status}")
-    logger.info("=" * 80)
+    logger.info("experience_confirmed call_id=%s worker_id=%s cv_path=%s has_cv=%s",
+                call_id, worker_id, cv_path, has_cv_status)
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=200,
         content={
             "status": "success",
@@ -674,18 +717,16 @@ async def confirm_experience(body: ExperienceConfirmRequest):
 
 
 @router.post("/call/start")
-async def start_voice_call(worker_id: str):
+def start_voice_call(worker_id: str):
     """
     Start voice call for a worker.
     Internal endpoint called after form submission.
     """
-    import uuid
-
     worker = crud.get_worker(worker_id)
     if not worker:
         raise HTTPException(status_code=404, detail="Worker not found")
 
-    call_id = str(uuid.uuid4())
+    call_id = uuid.uuid4().hex  # 32 hex chars - skips UUID.__str__ dash formatting
     phone_number = worker.get("mobile_number")
 
     # Create voice session
@@ -694,9 +735,9 @@ async def start_voice_call(worker_id: str):
         raise HTTPException(status_code=500, detail="Failed to create voice session")
 
     # Get initial Hinglish prompt
-    initial_prompt = language_renderer.get_voice_prompt(0)
+    initial_prompt = _INITIAL_VOICE_PROMPT
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=200,
         content={
             "call_id": call_id,
@@ -709,57 +750,43 @@ async def start_voice_call(worker_id: str):
 
 
 @router.post("/call/link")
-async def link_call_to_worker(body: LinkCallToWorkerRequest):
+def link_call_to_worker(body: LinkCallToWorkerRequest, background_tasks: BackgroundTasks):
     """
     Link call_id to worker_id after transcript is collected.
     FLAG-BASED FLOW: Checks exp_ready flag before auto-saving.
     - If exp_ready=true: returns experience data but does not auto-save or generate CV (user must confirm)
-    - If exp_ready=false or not set: proceeds with old auto-save flow (backward compatible)
+    - If exp_ready=false or not set: proceeds with old auto-save flow (backward compatible);
+      CV generation + embedding run as a background task and the response has cv_generated="pending"
+      (poll cv_status for has_cv)
+    - Retries of the auto-save flow after the CV was already generated for this session skip the experience
+      save and CV regeneration; re-linking to the same worker does not touch the session row
     Use this endpoint when worker_id was not available during transcript submission.
     """
-    from ..services.cv_generator import save_cv
-    from ..services.embedding_service import prepare_for_chromadb
-    from ..vector_db.chroma_client import get_vector_db
-    from ..config import CVS_DIR
 
     call_id = body.call_id
     worker_id = body.worker_id
 
-    # Verify worker exists
-    worker = crud.get_worker(worker_id)
+    # Verify worker, link call to worker and fetch refreshed session + education docs + cv_status in one trip
+    bundle = crud.link_and_fetch_bundle(call_id, worker_id)
+    if bundle is None:
+        raise HTTPException(status_code=500, detail="Failed to link call to worker")
+    worker = bundle["worker"]
     if not worker:
         raise HTTPException(status_code=404, detail="Worker not found")
-
-    # Get voice session
-    session = crud.get_voice_session(call_id)
+    session = bundle["session"]
     if not session:
         raise HTTPException(status_code=404, detail="Voice session not found")
 
-    # Link call to worker
-    success = crud.link_call_to_worker(call_id, worker_id)
-    if not success:
-        raise HTTPException(status_code=500, detail="Failed to link call to worker")
-
-    # Refresh session after linking to get updated data
-    session = crud.get_voice_session(call_id)
-    if not session:
-        raise HTTPException(status_code=500, detail="Failed to retrieve updated session after linking")
-
     # FLAG-BASED FLOW: Check exp_ready flag before auto-saving
-    exp_ready = bool(session.get("exp_ready", 0))
+    exp_ready = session.get("exp_ready") or False
 
-    logger.info("=" * 80)
-    logger.info("🔗 CALL LINK REQUEST")
-    logger.info(f"  Call ID: {call_id}")
-    logger.info(f"  Worker ID: {worker_id}")
-    logger.info(f"  exp_ready flag: {exp_ready}")
-    logger.info("=" * 80)
+    logger.info("call_link call_id=%s worker_id=%s exp_ready=%s", call_id, worker_id, exp_ready)
 
     # Check if we have experience stored in session
     experience = None
     if session.get("experience_json"):
         try:
-            experience = json.loads(session["experience_json"])
+            experience = _parse_experience_json(session["experience_json"])
         except (TypeError, json.JSONDecodeError):
             pass
     elif session.get("transcript"):
@@ -771,14 +798,10 @@ async def link_call_to_worker(body: LinkCallToWorkerRequest):
 
     # FLAG-BASED FLOW: If exp_ready=true, return experience data but do not auto-save or generate CV
     if exp_ready and experience:
-        logger.info("=" * 80)
-        logger.info("🚩 FLAG-BASED FLOW: exp_ready=true - returning experience data without auto-saving")
-        logger.info(f"  Call ID: {call_id}")
-        logger.info(f"  Worker ID: {worker_id}")
-        logger.info(f"  User must confirm experience via POST /voice/experience/confirm")
-        logger.info("=" * 80)
+        logger.debug("🚩 FLAG-BASED FLOW: exp_ready=true - returning experience data for call %s without auto-saving",
+                     call_id)
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=200,
             content={
                 "status": "success",
@@ -792,65 +815,67 @@ async def link_call_to_worker(body: LinkCallToWorkerRequest):
             }
         )
 
+    # IDEMPOTENT RETRY (auto-save flow): experience already stored and a CV generated since the session
+    # last changed - nothing to save or regenerate (save_cv calls the LLM)
+    if session.get("experience_json") and bundle["cv_up_to_date"]:
+        logger.debug("Call %s already linked with a current CV - returning without regenerating", call_id)
+
+        return FastJSONResponse(
+            status_code=200,
+            content={
+                "status": "success",
+                "call_id": call_id,
+                "worker_id": worker_id,
+                "exp_ready": exp_ready,
+                "experience_saved": True,
+                "cv_generated": True,
+                "cv_path": None,
+                "has_cv": True,
+                "message": "Call already linked and CV already generated"
+            }
+        )
+
     # BACKWARD COMPATIBILITY: If exp_ready=false or not set, proceed with old auto-save flow
     if experience:
-        logger.info("=" * 80)
-        logger.info("🔄 BACKWARD COMPATIBILITY: exp_ready=false or not set - proceeding with auto-save flow")
-        logger.info(f"  Call ID: {call_id}")
-        logger.info(f"  Worker ID: {worker_id}")
-        logger.info("=" * 80)
+        logger.debug("🔄 BACKWARD COMPATIBILITY: exp_ready=false or not set - auto-saving call %s", call_id)
 
         success = crud.save_experience(worker_id, experience)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save experience")
 
-        # Generate CV with transcript
-        education_docs = crud.get_educational_documents(worker_id)
-        education_data_list = education_docs if education_docs else None
+        # Generate CV with transcript + store embedding in the background - client polls cv_status for has_cv
+        education_data_list = bundle["education_docs"] or None
 
         # Get transcript from session
         transcript = session.get("transcript") if session else None
 
-        cv_path = save_cv(
+        background_tasks.add_task(
+            _generate_cv_and_store_embedding,
             worker_id,
-            dict(worker),
+            worker,
             experience,
-            CVS_DIR,
-            education_data=education_data_list,
-            use_llm=True,
-            transcript=transcript  # Pass transcript for richer CV content
+            education_data_list,
+            transcript  # Pass transcript for richer CV content
         )
 
-        # Store embedding
-        try:
-            vector_db = get_vector_db()
-            embedding_data = prepare_for_chromadb(worker_id, dict(worker), experience)
-            vector_db.add_document(
-                embedding_data["id"],
-                embedding_data["document"],
-                embedding_data["metadata"]
-            )
-        except Exception:
-            pass
-
-        # Return has_cv from DB so frontend can enable Access Resume (DB updated by save_cv above)
-        cv_status = crud.get_cv_status(worker_id)
-        has_cv = bool(cv_status.get("has_cv", False)) if cv_status else False
+        # has_cv reflects the status before this CV is generated; it flips to true once the background task completes
+        cv_status = bundle["cv_status"]
+        has_cv = (cv_status.get("has_cv") or False) if cv_status else False
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=200,
             content={
                 "status": "success",
                 "call_id": call_id,
                 "worker_id": worker_id,
                 "experience_saved": True,
-                "cv_generated": True,
-                "cv_path": cv_path,
+                "cv_generated": "pending",
+                "cv_path": None,
                 "has_cv": has_cv,
             }
         )
     else:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=200,
             content={
                 "status": "success",
@@ -16,13 +16,16 @@ VIDEO_UPLOADS_DIR = (DATA_DIR / "video_uploads").resolve()
 # POC: Using ngrok URL for testing - can be overridden via environment variable
 VOICE_AGENT_BASE_URL = os.getenv("VOICE_AGENT_BASE_URL", "https://uriah-cowlike-superobstinately.ngrok-free.dev")
 
-# Create directories
-DOCUMENTS_DIR.mkdir(parents=True, exist_ok=True)
-PERSONAL_DOCUMENTS_DIR.mkdir(parents=True, exist_ok=True)
-EDUCATIONAL_DOCUMENTS_DIR.mkdir(parents=True, exist_ok=True)
-CVS_DIR.mkdir(parents=True, exist_ok=True)
-VOICE_CALLS_DIR.mkdir(parents=True, exist_ok=True)
-VIDEO_UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+# Create directories (DOCUMENTS_DIR comes from its subdirectories via parents=True)
+for _dir in (
+    PERSONAL_DOCUMENTS_DIR,
+    EDUCATIONAL_DOCUMENTS_DIR,
+    CVS_DIR,
+    VOICE_CALLS_DIR,
+    VIDEO_UPLOADS_DIR,
+):
+    _dir.mkdir(parents=True, exist_ok=True)
+del _dir
 
 # API Configuration
 API_HOST = "0.0.0.0"
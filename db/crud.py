@@ -1,13 +1,356 @@
+import functools
 import json
 import logging
+import os
+import re
 import sqlite3
+import threading
+import time
 import uuid
-from typing import Optional
-from app.db.database import get_db_connection
-
-# Configure logging - ensure DEBUG level is captured
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
+from app.db.database import VOICE_SESSION_CALL_MOBILE_EXPR, borrow_conn, get_db_connection
+
+try:
+    import orjson  # Optional: faster JSON for the workplaces / skills / paths columns
+except ImportError:
+    orjson = None
+
+# Level comes from the root logger (LOG_LEVEL, configured once in main / utils.logger)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# UPDATE ... RETURNING needs SQLite 3.35+; older builds fall back to UPDATE + SELECT on the same cursor
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Experience duration parsing ("10 years", "1.5 yrs", "6 months") - compiled once, matched case-insensitively
+_YEARS_RE = re.compile(r'(\d+\.?\d*)\s*(?:year|yr|y)', re.IGNORECASE)
+_MONTHS_RE = re.compile(r'(\d+\.?\d*)\s*(?:month|mon|m)', re.IGNORECASE)
+_FIRST_INT_RE = re.compile(r'(\d+)')
+
+# Short-lived per-process cache of worker rows (get_worker is hit several times per request and on every retry/poll).
+# Writers in this module invalidate their worker_id; other processes may see a stale row for up to the TTL.
+_WORKER_CACHE_MAX = 4096
+_WORKER_CACHE_TTL = float(os.getenv("WORKER_CACHE_TTL", "60"))
+_worker_cache = OrderedDict()  # worker_id -> (expires_at, row dict)
+_worker_cache_lock = threading.Lock()
+_worker_cache_epoch = 0  # bumped on every invalidation so a read racing a write never re-caches the old row
+
+
+def _invalidate_worker(worker_id: str):
+    """Drop a cached worker row after it was written."""
+    global _worker_cache_epoch
+    with _worker_cache_lock:
+        _worker_cache_epoch += 1
+        _worker_cache.pop(worker_id, None)
+
+
+def _db_op(default, action: str):
+    """
+    Run a single-statement crud function on a pooled connection.
+
+    The wrapped function takes a cursor as its first argument; callers pass only the remaining ones.
+    Any error is logged as "Error <action> <first arg>" and `default` is returned instead; the
+    connection always goes back to the pool. Writers commit via cursor.connection.commit().
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                with borrow_conn() as conn:
+                    return fn(conn.cursor(), *args, **kwargs)
+            except Exception as e:
+                logger.error("Error %s %s: %s", action, args[0] if args else "", e, exc_info=True)
+                return default
+        return wrapper
+    return decorator
+
+
+# Column JSON encoding: compact UTF-8 text. orjson when installed, stdlib json otherwise
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing except clauses still match).
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    _loads = json.loads
+
+
+# Conversation / OCR payload columns: values past this size are stored zlib-compressed as BLOB.
+# Small values and rows written before compression stay TEXT; the stored type tells them apart on read.
+_COMPRESS_MIN_BYTES = 1024
+
+
+def _pack(text: Optional[str]):
+    """Encode a JSON text column value for storage (bytes bind as BLOB)."""
+    if text is None:
+        return None
+    data = text.encode()
+    if len(data) < _COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(data)
+
+
+def _unpack(value):
+    """Inverse of _pack: BLOB values are decompressed back to JSON text, TEXT passes through."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode()
+    return value
+
+
+def _unpack_experience_session(row) -> dict:
+    session = dict(zip(_EXPERIENCE_SESSION_COLS, row))
+    session["raw_conversation"] = _unpack(session["raw_conversation"])
+    session["structured_data"] = _unpack(session["structured_data"])
+    return session
+
+
+# ========== SQL STATEMENTS ==========
+# Hot-path statements live here as constants; pooled connections keep up to 256 compiled statements
+# (cached_statements) keyed by SQL text, so these are parsed once per connection.
+
+# Explicit column lists for the hot getters: results are built with dict(zip(cols, row)).
+_WORKER_COLS = (
+    "worker_id", "mobile_number", "name", "dob", "address", "personal_document_path",
+    "educational_document_paths", "created_at", "video_url", "verification_status", "verified_at",
+    "verification_errors", "personal_extracted_name", "personal_extracted_dob",
+)
+_EXPERIENCE_COLS = (
+    "primary_skill", "experience_years", "skills", "preferred_location", "current_location",
+    "availability", "workplaces", "total_experience_duration", "experience_years_float",
+)
+_VOICE_SESSION_COLS = (
+    "call_id", "worker_id", "phone_number", "status", "current_step", "responses_json",
+    "transcript", "experience_json", "created_at", "updated_at", "exp_ready",
+)
+
+SQL_INSERT_WORKER = "INSERT INTO workers (worker_id, mobile_number) VALUES (?, ?)"
+SQL_SELECT_WORKER_BY_ID = f"SELECT {', '.join(_WORKER_COLS)} FROM workers WHERE worker_id = ?"
+SQL_SELECT_WORKER_BY_MOBILE = f"SELECT {', '.join(_WORKER_COLS)} FROM workers WHERE mobile_number = ?"
+SQL_WORKER_EXISTS = "SELECT EXISTS(SELECT 1 FROM workers WHERE worker_id = ?)"
+SQL_UPDATE_WORKER_PERSONAL = """
+UPDATE workers
+SET name = ?, dob = ?, address = ?, personal_extracted_name = ?, personal_extracted_dob = ?,
+    verification_status = 'pending', verification_errors = NULL
+WHERE worker_id = ?
+"""
+SQL_RESET_EDUCATION_VERIFICATION = "UPDATE educational_documents SET verification_status = NULL WHERE worker_id = ?"
+SQL_UPDATE_WORKER_PERSONAL_DOCUMENT_PATH = "UPDATE workers SET personal_document_path = ? WHERE worker_id = ?"
+SQL_UPDATE_WORKER_VIDEO_URL = "UPDATE workers SET video_url = ? WHERE worker_id = ?"
+SQL_APPEND_EDUCATIONAL_DOCUMENT_PATH = """
+UPDATE workers
+SET educational_document_paths = CASE
+    WHEN educational_document_paths IS NULL OR NOT json_valid(educational_document_paths) THEN json_array(?)
+    WHEN EXISTS (SELECT 1 FROM json_each(educational_document_paths) WHERE value = ?) THEN educational_document_paths
+    ELSE json_insert(educational_document_paths, '$[#]', ?)
+END
+WHERE worker_id = ?
+"""
+SQL_UPSERT_WORK_EXPERIENCE = """
+INSERT INTO work_experience
+(worker_id, primary_skill, experience_years, skills, preferred_location, current_location, availability, workplaces, total_experience_duration, experience_years_float)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(worker_id) DO UPDATE SET
+    primary_skill = excluded.primary_skill, experience_years = excluded.experience_years,
+    skills = excluded.skills, preferred_location = excluded.preferred_location,
+    current_location = excluded.current_location, availability = excluded.availability,
+    workplaces = excluded.workplaces, total_experience_duration = excluded.total_experience_duration,
+    experience_years_float = excluded.experience_years_float
+"""
+# Session summaries for lookups whose callers never read transcript / responses_json (potentially large TEXT)
+_VOICE_SESSION_SUMMARY_COLS = (
+    "call_id", "worker_id", "phone_number", "status", "current_step", "experience_json",
+    "created_at", "updated_at", "exp_ready",
+)
+_VOICE_SESSION_SUMMARY_SQL = ", ".join(_VOICE_SESSION_SUMMARY_COLS)
+SQL_SELECT_LATEST_VOICE_SESSION_BY_WORKER = (
+    f"SELECT {_VOICE_SESSION_SUMMARY_SQL} FROM voice_sessions WHERE worker_id = ? ORDER BY updated_at DESC LIMIT 1"
+)
+SQL_SELECT_LATEST_VOICE_SESSION_BY_PHONE = (
+    f"SELECT {_VOICE_SESSION_SUMMARY_SQL} FROM voice_sessions WHERE phone_number = ? ORDER BY created_at DESC LIMIT 1"
+)
+# Latest non-empty transcript for a worker: by worker_id first, else by the worker's mobile number.
+# Each branch is an index seek on a partial transcript index; priority picks the worker_id match.
+SQL_SELECT_LATEST_TRANSCRIPT_FOR_WORKER = """
+SELECT call_id, transcript, worker_id FROM (
+    SELECT * FROM (
+        SELECT call_id, transcript, worker_id, 0 AS priority FROM voice_sessions
+        WHERE worker_id = ?1 AND transcript IS NOT NULL AND transcript != ''
+        ORDER BY updated_at DESC LIMIT 1
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT call_id, transcript, worker_id, 1 AS priority FROM voice_sessions
+        WHERE phone_number = (SELECT mobile_number FROM workers WHERE worker_id = ?1)
+          AND transcript IS NOT NULL AND transcript != ''
+        ORDER BY updated_at DESC LIMIT 1
+    )
+)
+ORDER BY priority LIMIT 1
+"""
+SQL_SELECT_EXP_READY = "SELECT exp_ready FROM voice_sessions WHERE call_id = ?"
+# Dashboard poll: experience_json is only read once the flag is set (it may spill to overflow pages)
+SQL_SELECT_EXP_READY_BY_WORKER = (
+    "SELECT call_id, exp_ready, CASE WHEN exp_ready THEN experience_json END FROM voice_sessions "
+    "WHERE worker_id = ? ORDER BY updated_at DESC LIMIT 1"
+)
+SQL_SELECT_LATEST_VOICE_SESSION_BY_CALL_MOBILE = (
+    f"SELECT {_VOICE_SESSION_SUMMARY_SQL} FROM voice_sessions WHERE {VOICE_SESSION_CALL_MOBILE_EXPR} IN (?, '+91' || ?) "
+    "ORDER BY updated_at DESC LIMIT 1"
+)
+SQL_UPDATE_EXP_READY = "UPDATE voice_sessions SET exp_ready = ?, updated_at = CURRENT_TIMESTAMP WHERE call_id = ?"
+_EXPERIENCE_SESSION_COLS = (
+    "session_id", "worker_id", "current_question", "raw_conversation", "structured_data", "status",
+    "created_at", "updated_at",
+)
+SQL_SELECT_EXPERIENCE_SESSION = (
+    f"SELECT {', '.join(_EXPERIENCE_SESSION_COLS)} FROM experience_sessions WHERE session_id = ?"
+)
+SQL_SELECT_LATEST_EXPERIENCE_SESSION_BY_WORKER = (
+    f"SELECT {', '.join(_EXPERIENCE_SESSION_COLS)} FROM experience_sessions "
+    "WHERE worker_id = ? ORDER BY created_at DESC LIMIT 1"
+)
+_CV_STATUS_COLS = ("worker_id", "has_cv", "cv_generated_at", "updated_at")
+SQL_SELECT_CV_STATUS = f"SELECT {', '.join(_CV_STATUS_COLS)} FROM cv_status WHERE worker_id = ?"
+SQL_INSERT_EDUCATIONAL_DOCUMENT = """
+INSERT INTO educational_documents
+(worker_id, document_type, qualification, board, stream, year_of_passing, school_name, marks_type, marks, percentage)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# OCR education save / verification and the delete_* paths
+SQL_UPDATE_EDUCATIONAL_DOCUMENT_LLM = """
+UPDATE educational_documents
+SET document_type = ?, qualification = ?, board = ?, stream = ?, year_of_passing = ?, school_name = ?,
+    marks_type = ?, marks = ?, percentage = ?, raw_ocr_text = ?, llm_extracted_data = ?,
+    extracted_name = ?, extracted_dob = ?, verification_status = ?
+WHERE worker_id = ?
+"""
+SQL_INSERT_EDUCATIONAL_DOCUMENT_LLM = """
+INSERT INTO educational_documents
+(worker_id, document_type, qualification, board, stream, year_of_passing, school_name, marks_type, marks, percentage,
+ raw_ocr_text, llm_extracted_data, extracted_name, extracted_dob, verification_status)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# education_data fields worth a row: at least one must be set or the save is skipped
+_EDUCATIONAL_DOCUMENT_DATA_KEYS = (
+    "document_type", "qualification", "board", "stream", "year_of_passing", "school_name",
+    "marks_type", "marks", "percentage", "name", "dob",
+)
+SQL_SELECT_WORKER_PERSONAL_EXTRACTED = (
+    "SELECT personal_extracted_name, personal_extracted_dob FROM workers WHERE worker_id = ?"
+)
+SQL_MARK_EDUCATIONAL_DOCUMENTS_VERIFIED = (
+    "UPDATE educational_documents SET verification_status = 'VERIFIED' WHERE worker_id = ?"
+)
+SQL_MARK_EDUCATIONAL_DOCUMENTS_MISMATCH = (
+    "UPDATE educational_documents SET verification_status = 'MISMATCH', verification_errors = ? WHERE worker_id = ?"
+)
+SQL_SET_WORKER_VERIFICATION_STATUS = "UPDATE workers SET verification_status = ? WHERE worker_id = ?"
+SQL_UPDATE_EDUCATIONAL_DOCUMENT_VERIFICATION = (
+    "UPDATE educational_documents SET verification_status = ?, verification_errors = ? WHERE id = ?"
+)
+_EDUCATIONAL_VERIFICATION_COLS = (
+    "id", "qualification", "extracted_name", "extracted_dob", "school_name", "board", "verification_status",
+)
+SQL_SELECT_EDUCATIONAL_DOCUMENTS_FOR_VERIFICATION = """
+SELECT id, qualification, extracted_name, extracted_dob, school_name, board,
+       COALESCE(NULLIF(verification_status, ''), 'pending')
+FROM educational_documents
+WHERE worker_id = ? AND qualification IS NOT NULL
+ORDER BY id
+"""
+SQL_COUNT_EDUCATIONAL_DOCUMENTS_EXTRACTED = """
+SELECT COUNT(*), COUNT(CASE WHEN extracted_name IS NOT NULL AND extracted_name != '' THEN 1 END)
+FROM educational_documents
+WHERE worker_id = ? AND qualification IS NOT NULL
+"""
+SQL_DELETE_WORK_EXPERIENCE_BY_WORKER = "DELETE FROM work_experience WHERE worker_id = ?"
+SQL_DELETE_VOICE_SESSIONS_BY_WORKER = "DELETE FROM voice_sessions WHERE worker_id = ?"
+SQL_DELETE_EXPERIENCE_SESSIONS_BY_WORKER = "DELETE FROM experience_sessions WHERE worker_id = ?"
+SQL_DELETE_EDUCATIONAL_DOCUMENTS_BY_WORKER = "DELETE FROM educational_documents WHERE worker_id = ?"
+SQL_DELETE_PENDING_OCR_RESULTS = "DELETE FROM pending_ocr_results WHERE worker_id = ?"
+SQL_CLEAR_WORKER_PERSONAL_DATA = """
+UPDATE workers
+SET name = NULL, dob = NULL, address = NULL, personal_document_path = NULL,
+    personal_extracted_name = NULL, personal_extracted_dob = NULL, verification_status = NULL
+WHERE worker_id = ?
+"""
+SQL_CLEAR_WORKER_EDUCATIONAL_DATA = (
+    "UPDATE workers SET educational_document_paths = NULL, verification_status = 'pending' WHERE worker_id = ?"
+)
+SQL_CLEAR_WORKER_ALL_DATA = """
+UPDATE workers
+SET name = NULL, dob = NULL, address = NULL, personal_document_path = NULL,
+    personal_extracted_name = NULL, personal_extracted_dob = NULL,
+    educational_document_paths = NULL, video_url = NULL
+WHERE worker_id = ?
+"""
+SQL_CLEAR_PENDING_OCR_PERSONAL = (
+    "UPDATE pending_ocr_results SET personal_document_path = NULL, personal_data_json = NULL WHERE worker_id = ?"
+)
+SQL_CLEAR_PENDING_OCR_EDUCATIONAL = (
+    "UPDATE pending_ocr_results SET educational_document_path = NULL, education_data_json = NULL WHERE worker_id = ?"
+)
+SQL_RESET_CV_STATUS = "UPDATE cv_status SET has_cv = 0, cv_generated_at = NULL WHERE worker_id = ?"
+# Retry queue: delete a drained row only if it was not re-queued (replaced) since it was read
+SQL_DELETE_PENDING_EMBEDDING_VERSION = """
+DELETE FROM pending_embeddings
+WHERE doc_id = ? AND attempts = ? AND next_attempt_at = ? AND document = ? AND metadata_json IS ?
+"""
+SQL_UPSERT_CV_STATUS = """
+INSERT INTO cv_status (worker_id, has_cv, cv_generated_at, created_at, updated_at)
+VALUES (?1, ?2, CASE WHEN ?2 THEN CURRENT_TIMESTAMP END, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+ON CONFLICT(worker_id) DO UPDATE SET
+    has_cv = excluded.has_cv, cv_generated_at = excluded.cv_generated_at, updated_at = CURRENT_TIMESTAMP
+"""
+SQL_SELECT_VOICE_SESSION = f"SELECT {', '.join(_VOICE_SESSION_COLS)} FROM voice_sessions WHERE call_id = ?"
+SQL_SELECT_EXPERIENCE = f"SELECT {', '.join(_EXPERIENCE_COLS)} FROM work_experience WHERE worker_id = ?"
+SQL_INSERT_VOICE_SESSION = """
+INSERT INTO voice_sessions (call_id, worker_id, phone_number, exp_ready) VALUES (?, ?, ?, 0)
+ON CONFLICT(call_id) DO NOTHING
+"""
+SQL_INSERT_EXPERIENCE_SESSION = """
+INSERT INTO experience_sessions (session_id, worker_id, raw_conversation, structured_data) VALUES (?, ?, '{}', '{}')
+ON CONFLICT(session_id) DO NOTHING
+"""
+
+
+def _update_variants(table: str, key_column: str, fixed: tuple, optional: tuple, trailer: tuple = ()) -> dict:
+    """
+    Build every UPDATE a dynamic "only set the fields that were passed" builder can produce, once at import.
+    Keyed by bitmask of present optional columns (bit i = optional[i]); placeholders follow fixed, then optional order.
+    """
+    variants = {}
+    for mask in range(1 << len(optional)):
+        assignments = [f"{column} = ?" for column in fixed]
+        assignments += [f"{column} = ?" for i, column in enumerate(optional) if mask & (1 << i)]
+        assignments += list(trailer)
+        variants[mask] = f"UPDATE {table} SET {', '.join(assignments)} WHERE {key_column} = ?"
+    return variants
+
+
+_WORKER_OCR_COLUMNS = ("raw_ocr_text", "llm_extracted_data")
+SQL_UPDATE_WORKER_OCR = _update_variants("workers", "worker_id", (), _WORKER_OCR_COLUMNS)
+
+_WORKER_VERIFICATION_COLUMNS = ("verification_errors", "personal_extracted_name", "personal_extracted_dob")
+SQL_UPDATE_WORKER_VERIFICATION = _update_variants(
+    "workers", "worker_id", ("verification_status",), _WORKER_VERIFICATION_COLUMNS
+)
+SQL_UPDATE_WORKER_VERIFICATION_VERIFIED = _update_variants(
+    "workers", "worker_id", ("verification_status",), _WORKER_VERIFICATION_COLUMNS,
+    trailer=("verified_at = CURRENT_TIMESTAMP",)
+)
+
+_VOICE_SESSION_COLUMNS = ("responses_json", "transcript", "experience_json", "exp_ready")
+SQL_UPDATE_VOICE_SESSION = _update_variants(
+    "voice_sessions", "call_id", ("current_step", "status"), _VOICE_SESSION_COLUMNS,
+    trailer=("updated_at = CURRENT_TIMESTAMP",)
+)
 
 
 def create_worker(worker_id: str, mobile_number: str) -> bool:
@@ -22,10 +365,7 @@ def create_worker(worker_id: str, mobile_number: str) -> bool:
         # This allows testing with same mobile number multiple times
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-        INSERT INTO workers (worker_id, mobile_number)
-        VALUES (?, ?)
-        """, (worker_id, mobile_number))
+        cursor.execute(SQL_INSERT_WORKER, (worker_id, mobile_number))
         conn.commit()
         logger.info(
             f"[POC] Worker created: {worker_id} (Mobile: {mobile_number}) - Same mobile can be used multiple times for testing")
@@ -37,10 +377,7 @@ def create_worker(worker_id: str, mobile_number: str) -> bool:
         # Generate new UUID and retry once
         new_worker_id = str(uuid.uuid4())
         try:
-            cursor.execute("""
-            INSERT INTO workers (worker_id, mobile_number)
-            VALUES (?, ?)
-            """, (new_worker_id, mobile_number))
+            cursor.execute(SQL_INSERT_WORKER, (new_worker_id, mobile_number))
             conn.commit()
             logger.info(f"[POC] Worker created with new ID: {new_worker_id} (Mobile: {mobile_number})")
             return True
@@ -62,83 +399,75 @@ def update_worker_data(worker_id: str, name: str, dob: str, address: str) -> boo
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        logger.info(
-            f"Updating worker data for {worker_id}: name={bool(name)}, dob={bool(dob)}, address={bool(address)}")
-        logger.info(f"  Values: name='{name}', dob='{dob}', address='{address}'")
-        logger.info(f"  Also setting: personal_extracted_name='{name}', personal_extracted_dob='{dob}'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Updating worker data for %s: name=%s, dob=%s, address=%s",
+                        worker_id, bool(name), bool(dob), bool(address))
+        logger.debug("  Values: name=%r, dob=%r, address=%r (also personal_extracted_name/dob)", name, dob, address)
+
+        # Both UPDATEs below are one transaction: one commit (one WAL sync) instead of two
+        cursor.execute("BEGIN IMMEDIATE")
 
         # CRITICAL: Reset verification_status to 'pending' when personal data is updated
         # This ensures fresh verification flow when personal data is reuploaded after deletion
         # Also clear verification_errors so they don't show up in GET endpoint
-        cursor.execute("""
-        UPDATE workers
-        SET name = ?, dob = ?, address = ?, personal_extracted_name = ?, personal_extracted_dob = ?, verification_status = 'pending', verification_errors = NULL
-        WHERE worker_id = ?
-        """, (name, dob, address, name, dob, worker_id))
-        conn.commit()
+        cursor.execute(SQL_UPDATE_WORKER_PERSONAL, (name, dob, address, name, dob, worker_id))
 
         if cursor.rowcount == 0:
             logger.error(f"UPDATE workers matched 0 rows for worker_id={worker_id!r}. Worker may not exist.")
+            conn.rollback()
             return False
 
-        logger.info(
-            f"Successfully updated worker {worker_id} (rowcount={cursor.rowcount}) with personal_extracted_name, personal_extracted_dob, and reset verification_status to 'pending'")
+        logger.info("Successfully updated worker %s (rowcount=%s), verification_status reset to 'pending'",
+                    worker_id, cursor.rowcount)
 
         # ============================================================================
         # RESET EDUCATIONAL DOCUMENT VERIFICATION
         # Since personal data has changed, educational verification is now invalid
         # ============================================================================
-        logger.info(
-            f"Resetting educational document verification status for worker {worker_id} due to personal data update")
+        logger.debug("Resetting educational document verification status for worker %s due to personal data update",
+                     worker_id)
 
-        cursor.execute("""
-        UPDATE educational_documents
-        SET verification_status = NULL
-        WHERE worker_id = ?
-        """, (worker_id,))
+        cursor.execute(SQL_RESET_EDUCATION_VERIFICATION, (worker_id,))
 
-        logger.info(f"Reset educational document verification_status to NULL (rows affected: {cursor.rowcount})")
+        logger.info("Reset educational document verification_status to NULL (rows affected: %s)", cursor.rowcount)
         conn.commit()
 
         return True
     except Exception as e:
         logger.error(f"Error updating worker data {worker_id}: {str(e)}", exc_info=True)
+        if conn is not None:
+            conn.rollback()
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
 
 def update_worker_ocr_data(worker_id: str, raw_ocr_text: str = None, llm_extracted_data: str = None) -> bool:
     """Update worker with raw OCR text and LLM extracted data for personal document"""
+    if raw_ocr_text is None and llm_extracted_data is None:
+        return True  # Nothing to update - no connection borrowed, cache entry kept
+
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        updates = []
+        mask = 0
         params = []
 
         if raw_ocr_text is not None:
-            updates.append("raw_ocr_text = ?")
+            mask |= 1
             params.append(raw_ocr_text)
 
         if llm_extracted_data is not None:
-            updates.append("llm_extracted_data = ?")
+            mask |= 2
             params.append(llm_extracted_data)
 
-        if not updates:
-            return True  # Nothing to update
-
         params.append(worker_id)
 
-        query = f"""
-        UPDATE workers 
-        SET {', '.join(updates)}
-        WHERE worker_id = ?
-        """
-
-        cursor.execute(query, params)
+        cursor.execute(SQL_UPDATE_WORKER_OCR[mask], params)
         conn.commit()
 
         if cursor.rowcount > 0:
@@ -152,20 +481,37 @@ def update_worker_ocr_data(worker_id: str, raw_ocr_text: str = None, llm_extract
         logger.error(f"Error updating worker OCR data {worker_id}: {str(e)}", exc_info=True)
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
 
 def get_worker(worker_id: str) -> dict:
-    """Get worker data"""
+    """Get worker data (served from a short TTL cache; callers get their own copy)"""
+    now = time.monotonic()
+    with _worker_cache_lock:
+        cached = _worker_cache.get(worker_id)
+        if cached is not None and cached[0] > now:
+            _worker_cache.move_to_end(worker_id)
+            return dict(cached[1])
+        epoch = _worker_cache_epoch
+
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
+        cursor.execute(SQL_SELECT_WORKER_BY_ID, (worker_id,))
         row = cursor.fetchone()
         if row:
-            return dict(row)
+            worker = dict(zip(_WORKER_COLS, row))
+            # Missing workers are not cached so a just-created worker is visible immediately
+            with _worker_cache_lock:
+                if epoch == _worker_cache_epoch:
+                    _worker_cache[worker_id] = (now + _WORKER_CACHE_TTL, worker)
+                    _worker_cache.move_to_end(worker_id)
+                    if len(_worker_cache) > _WORKER_CACHE_MAX:
+                        _worker_cache.popitem(last=False)
+            return dict(worker)
         return None
     except Exception as e:
         logger.error(f"Error getting worker {worker_id}: {str(e)}", exc_info=True)
@@ -175,6 +521,12 @@ def get_worker(worker_id: str) -> dict:
             conn.close()
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolve_path(path: str) -> str:
+    """Absolute, symlink-free form of a stored document path (resolve() walks every parent with lstat)."""
+    return str(Path(path).resolve())
+
+
 def save_personal_document_path(worker_id: str, document_path: str) -> bool:
     """
     Save personal document path to database.
@@ -183,40 +535,26 @@ def save_personal_document_path(worker_id: str, document_path: str) -> bool:
     conn = None
     try:
         # Ensure path is absolute (resolved) for reliable retrieval
-        from pathlib import Path
-        resolved_path = str(Path(document_path).resolve())
+        resolved_path = _resolve_path(document_path)
 
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Verify worker exists before updating
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
-            logger.error(f"Cannot save document path: Worker {worker_id} does not exist")
-            return False
-
-        cursor.execute("""
-        UPDATE workers 
-        SET personal_document_path = ?
-        WHERE worker_id = ?
-        """, (resolved_path, worker_id))
+        # A missing worker shows up as rowcount 0 - no separate existence check or read-back needed
+        cursor.execute(SQL_UPDATE_WORKER_PERSONAL_DOCUMENT_PATH, (resolved_path, worker_id))
         conn.commit()
 
-        # Verify the update succeeded
-        cursor.execute("SELECT personal_document_path FROM workers WHERE worker_id = ?", (worker_id,))
-        saved_path = cursor.fetchone()
-        if saved_path and saved_path[0] == resolved_path:
-            logger.info(f"✓ Saved personal document path for worker {worker_id}: {resolved_path}")
-            return True
-        else:
-            logger.error(f"Failed to verify saved path for worker {worker_id}")
-            logger.error(f"  Expected: {resolved_path}")
-            logger.error(f"  Found in DB: {saved_path[0] if saved_path else None}")
+        if cursor.rowcount == 0:
+            logger.error(f"Cannot save document path: Worker {worker_id} does not exist")
             return False
+
+        logger.info(f"✓ Saved personal document path for worker {worker_id}: {resolved_path}")
+        return True
     except Exception as e:
         logger.error(f"Error saving personal document path for {worker_id}: {str(e)}", exc_info=True)
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -229,67 +567,27 @@ def add_educational_document_path(worker_id: str, document_path: str) -> bool:
     conn = None
     try:
         # Ensure path is absolute (resolved) for reliable retrieval
-        from pathlib import Path
-        resolved_path = str(Path(document_path).resolve())
+        resolved_path = _resolve_path(document_path)
 
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Verify worker exists before updating
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
-            logger.error(f"Cannot save document path: Worker {worker_id} does not exist")
-            return False
-
-        # Get existing paths
-        cursor.execute("SELECT educational_document_paths FROM workers WHERE worker_id = ?", (worker_id,))
-        row = cursor.fetchone()
-        existing_paths = []
-        if row and row[0]:
-            try:
-                existing_paths = json.loads(row[0])
-                # Resolve all existing paths to ensure consistency
-                existing_paths = [str(Path(p).resolve()) for p in existing_paths]
-            except Exception as parse_error:
-                logger.warning(f"Failed to parse existing educational paths for {worker_id}: {parse_error}")
-                existing_paths = []
-
-        # Add new path if not already present (compare resolved paths)
-        if resolved_path not in existing_paths:
-            existing_paths.append(resolved_path)
-
-        paths_json = json.dumps(existing_paths, ensure_ascii=False)
-        cursor.execute("""
-        UPDATE workers 
-        SET educational_document_paths = ?
-        WHERE worker_id = ?
-        """, (paths_json, worker_id))
+        # Append server-side (JSON1) - no read/parse/re-resolve/verify round trips.
+        # Existing entries were resolved when they were added; a missing worker shows up as rowcount 0.
+        cursor.execute(SQL_APPEND_EDUCATIONAL_DOCUMENT_PATH, (resolved_path, resolved_path, resolved_path, worker_id))
         conn.commit()
 
-        # Verify the update succeeded
-        cursor.execute("SELECT educational_document_paths FROM workers WHERE worker_id = ?", (worker_id,))
-        saved_row = cursor.fetchone()
-        if saved_row and saved_row[0]:
-            try:
-                saved_paths = json.loads(saved_row[0])
-                if resolved_path in saved_paths:
-                    logger.info(f"✓ Added educational document path for worker {worker_id}: {resolved_path}")
-                    return True
-                else:
-                    logger.error(f"Failed to verify saved educational path for worker {worker_id}")
-                    logger.error(f"  Expected: {resolved_path}")
-                    logger.error(f"  Found in DB: {saved_paths}")
-                    return False
-            except Exception as verify_error:
-                logger.error(f"Failed to verify saved paths: {verify_error}")
-                return False
-        else:
-            logger.error(f"No educational paths found in DB after save for worker {worker_id}")
+        if cursor.rowcount == 0:
+            logger.error(f"Cannot save document path: Worker {worker_id} does not exist")
             return False
+
+        logger.info(f"✓ Added educational document path for worker {worker_id}: {resolved_path}")
+        return True
     except Exception as e:
         logger.error(f"Error adding educational document path for {worker_id}: {str(e)}", exc_info=True)
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -303,21 +601,18 @@ def save_video_url(worker_id: str, video_url: str) -> bool:
             return False
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
+        cursor.execute(SQL_UPDATE_WORKER_VIDEO_URL, (video_url.strip(), worker_id))
+        conn.commit()
+        if cursor.rowcount == 0:
             logger.error(f"Cannot save video URL: Worker {worker_id} does not exist")
             return False
-        cursor.execute(
-            "UPDATE workers SET video_url = ? WHERE worker_id = ?",
-            (video_url.strip(), worker_id)
-        )
-        conn.commit()
         logger.info(f"Saved video_url for worker {worker_id}")
         return True
     except Exception as e:
         logger.error(f"Error saving video_url for {worker_id}: {str(e)}", exc_info=True)
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -332,12 +627,12 @@ def get_worker_document_paths(worker_id: str) -> dict:
                        (worker_id,))
         row = cursor.fetchone()
         if row:
-            personal_path = row[0] if row[0] else None
-            educational_paths_json = row[1] if row[1] else None
+            personal_path = row["personal_document_path"] or None
+            educational_paths_json = row["educational_document_paths"] or None
             educational_paths = []
             if educational_paths_json:
                 try:
-                    educational_paths = json.loads(educational_paths_json)
+                    educational_paths = _loads(educational_paths_json)
                 except:
                     educational_paths = []
             return {
@@ -359,10 +654,10 @@ def get_worker_by_mobile(mobile_number: str) -> dict:
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM workers WHERE mobile_number = ?", (mobile_number,))
+        cursor.execute(SQL_SELECT_WORKER_BY_MOBILE, (mobile_number,))
         row = cursor.fetchone()
         if row:
-            return dict(row)
+            return dict(zip(_WORKER_COLS, row))
         return None
     except Exception as e:
         logger.error(f"Error getting worker by mobile {mobile_number}: {str(e)}", exc_info=True)
@@ -372,6 +667,15 @@ def get_worker_by_mobile(mobile_number: str) -> dict:
             conn.close()
 
 
+def _parse_year_month(value) -> tuple:
+    """Parse "YYYY-MM" / "YYYY-MM-DD" into (year, month) without going through strptime."""
+    year, month = str(value).strip()[:7].split("-")
+    year, month = int(year), int(month)
+    if not 1 <= month <= 12:
+        raise ValueError(f"invalid year-month: {value!r}")
+    return year, month
+
+
 def calculate_total_experience_duration(workplaces):
     """
     Calculate total experience duration from all workplaces.
@@ -387,71 +691,53 @@ def calculate_total_experience_duration(workplaces):
     if not workplaces or not isinstance(workplaces, list):
         return 0
 
+    years_search = _YEARS_RE.search
+    months_search = _MONTHS_RE.search
     for workplace in workplaces:
         try:
             # PRIORITY 1: Parse work_duration string (NEW - for voice transcript format)
-            if "work_duration" in workplace and workplace["work_duration"]:
-                duration_str = str(workplace["work_duration"]).lower().strip()
-
-                # Extract numbers and units
-                import re
+            work_duration = workplace.get("work_duration")
+            if work_duration:
+                duration_str = str(work_duration)
 
                 # Match patterns like "10 years", "2 year", "6 months", "1.5 years"
-                years_match = re.search(r'(\d+\.?\d*)\s*(?:year|yr|y)', duration_str)
-                months_match = re.search(r'(\d+\.?\d*)\s*(?:month|mon|m)', duration_str)
+                years_match = years_search(duration_str)
+                months_match = months_search(duration_str)
 
                 workplace_months = 0
                 if years_match:
-                    years = float(years_match.group(1))
-                    workplace_months += int(years * 12)
-                    logger.info(f"[EXPERIENCE] Parsed {years} years = {int(years * 12)} months from '{duration_str}'")
+                    workplace_months += int(float(years_match.group(1)) * 12)
 
                 if months_match:
-                    months = float(months_match.group(1))
-                    workplace_months += int(months)
-                    logger.info(f"[EXPERIENCE] Parsed {months} months from '{duration_str}'")
+                    workplace_months += int(float(months_match.group(1)))
 
                 if workplace_months > 0:
                     total_months += workplace_months
                     continue
                 else:
-                    logger.warning(f"[EXPERIENCE] Could not parse work_duration: '{duration_str}'")
+                    logger.warning("[EXPERIENCE] Could not parse work_duration: %r", duration_str)
 
             # PRIORITY 2: If duration_months is already provided, use it
-            if "duration_months" in workplace and workplace["duration_months"]:
-                duration = int(workplace.get("duration_months", 0))
-                total_months += max(0, duration)
-                logger.info(f"[EXPERIENCE] Using duration_months: {duration} months")
+            duration_months = workplace.get("duration_months")
+            if duration_months:
+                total_months += max(0, int(duration_months))
                 continue
 
-            # PRIORITY 3: Calculate from dates
-            if "start_date" in workplace and "end_date" in workplace:
-                from datetime import datetime
-                start_str = str(workplace["start_date"]).strip()
-                end_str = str(workplace["end_date"]).strip()
-
-                # Parse dates in format YYYY-MM or YYYY-MM-DD
-                if len(start_str) == 7:  # YYYY-MM format
-                    start = datetime.strptime(start_str, "%Y-%m")
-                else:  # YYYY-MM-DD format
-                    start = datetime.strptime(start_str[:10], "%Y-%m-%d")
-
-                if len(end_str) == 7:  # YYYY-MM format
-                    end = datetime.strptime(end_str, "%Y-%m")
-                else:  # YYYY-MM-DD format
-                    end = datetime.strptime(end_str[:10], "%Y-%m-%d")
-
-                months = (end.year - start.year) * 12 + (end.month - start.month)
+            # PRIORITY 3: Calculate from dates (YYYY-MM or YYYY-MM-DD)
+            start_date = workplace.get("start_date")
+            end_date = workplace.get("end_date")
+            if start_date is not None and end_date is not None:
+                start_year, start_month = _parse_year_month(start_date)
+                end_year, end_month = _parse_year_month(end_date)
+                months = (end_year - start_year) * 12 + (end_month - start_month)
                 total_months += max(0, months)
-                logger.info(f"[EXPERIENCE] Calculated from dates: {months} months")
 
         except (ValueError, TypeError, AttributeError) as e:
-            logger.warning(f"Could not calculate duration for workplace {workplace}: {str(e)}")
+            logger.warning("Could not calculate duration for workplace %s: %s", workplace, e)
             continue
 
-    total_years = total_months / 12.0
-    logger.info(f"[EXPERIENCE] ✓ Total experience calculated: {total_months} months ({total_years:.1f} years)")
-    logger.info(f"[EXPERIENCE]   - From {len(workplaces)} workplace(s)")
+    logger.info("[EXPERIENCE] ✓ Total experience calculated: %d months (%.1f years) from %d workplace(s)",
+                total_months, total_months / 12.0, len(workplaces))
     return total_months
 
 
@@ -472,8 +758,7 @@ def save_experience(worker_id: str, experience_data: dict) -> bool:
         # Extract years from total_experience if needed
         experience_years = experience_data.get("experience_years", 0)
         if not experience_years and total_experience:
-            import re
-            years_match = re.search(r'(\d+)', str(total_experience))
+            years_match = _FIRST_INT_RE.search(str(total_experience))
             if years_match:
                 experience_years = int(years_match.group(1))
 
@@ -490,7 +775,7 @@ def save_experience(worker_id: str, experience_data: dict) -> bool:
 
         # Combine all skills for storage (backward compatibility)
         all_skills = list(skills_list) + list(tools_list)
-        skills_json = json.dumps(all_skills, ensure_ascii=False)
+        skills_json = _dumps(all_skills)
 
         preferred_location = experience_data.get("preferred_location", "")
 
@@ -498,10 +783,16 @@ def save_experience(worker_id: str, experience_data: dict) -> bool:
         current_location = experience_data.get("current_location", "")
         availability = experience_data.get("availability", "Not specified")
         workplaces = experience_data.get("workplaces", [])
-        # Ensure workplaces is a list and convert to JSON
+        # Normalize workplaces to a list once (callers may pass the JSON text); the same list
+        # feeds the duration calculation and the compact JSON stored below
+        if isinstance(workplaces, str):
+            try:
+                workplaces = _loads(workplaces)
+            except json.JSONDecodeError:
+                workplaces = []
         if not isinstance(workplaces, list):
             workplaces = []
-        workplaces_json = json.dumps(workplaces, ensure_ascii=False) if workplaces else None
+        workplaces_json = _dumps(workplaces) if workplaces else None
 
         # Calculate total experience duration from all workplaces
         total_duration_months = calculate_total_experience_duration(workplaces)
@@ -511,63 +802,27 @@ def save_experience(worker_id: str, experience_data: dict) -> bool:
         if workplaces and total_duration_months > 0:
             experience_years_float = round(total_duration_months / 12.0, 1)  # Round to 1 decimal place
             experience_years_int = int(total_duration_months / 12)
-            logger.info(
-                f"[EXPERIENCE] Calculated experience: {experience_years_float} years ({total_duration_months} months)")
-            logger.info(
-                f"[EXPERIENCE] Overriding experience_years: {experience_years} → {experience_years_int} (integer), {experience_years_float} (float)")
+            logger.debug("[EXPERIENCE] Overriding experience_years: %s → %s (integer), %s (float)",
+                         experience_years, experience_years_int, experience_years_float)
             experience_years = experience_years_int  # Keep integer for backward compatibility
 
-        logger.info(
-            f"[EXPERIENCE] Saving experience for {worker_id}: job_title={job_title}, years={experience_years}, years_float={experience_years_float}, workplaces={len(workplaces)}, total_months={total_duration_months}")
-
-        # Check if experience already exists - update instead of insert
-        cursor.execute("SELECT id FROM work_experience WHERE worker_id = ? ORDER BY created_at DESC LIMIT 1",
-                       (worker_id,))
-        existing = cursor.fetchone()
+        logger.debug("[EXPERIENCE] Saving experience for %s: job_title=%s, years=%s, years_float=%s, total_months=%s",
+                     worker_id, job_title, experience_years, experience_years_float, total_duration_months)
 
-        if existing:
-            # Update existing experience with float years
-            cursor.execute("""
-            UPDATE work_experience 
-            SET primary_skill = ?, experience_years = ?, skills = ?, preferred_location = ?,
-                current_location = ?, availability = ?, workplaces = ?, total_experience_duration = ?,
-                experience_years_float = ?
-            WHERE worker_id = ? AND id = ?
-            """, (
-                primary_skill,
-                experience_years,
-                skills_json,
-                preferred_location,
-                current_location if current_location else None,
-                availability if availability and availability != "Not specified" else None,
-                workplaces_json,
-                total_duration_months,
-                experience_years_float,
-                worker_id,
-                existing["id"]
-            ))
-            logger.info(
-                f"[EXPERIENCE] Experience updated for {worker_id}: {experience_years_float} years ({total_duration_months} months), {len(workplaces)} workplaces")
-        else:
-            # Insert new experience with float years
-            cursor.execute("""
-            INSERT INTO work_experience 
-            (worker_id, primary_skill, experience_years, skills, preferred_location, current_location, availability, workplaces, total_experience_duration, experience_years_float)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                worker_id,
-                primary_skill,
-                experience_years,
-                skills_json,
-                preferred_location,
-                current_location if current_location else None,
-                availability if availability and availability != "Not specified" else None,
-                workplaces_json,
-                total_duration_months,
-                experience_years_float
-            ))
-            logger.info(
-                f"[EXPERIENCE] Experience saved for {worker_id}: {experience_years_float} years ({total_duration_months} months), {len(workplaces)} workplaces")
+        cursor.execute(SQL_UPSERT_WORK_EXPERIENCE, (
+            worker_id,
+            primary_skill,
+            experience_years,
+            skills_json,
+            preferred_location,
+            current_location if current_location else None,
+            availability if availability and availability != "Not specified" else None,
+            workplaces_json,
+            total_duration_months,
+            experience_years_float
+        ))
+        logger.info("[EXPERIENCE] Experience saved for %s: %s years (%s months), %d workplaces",
+                    worker_id, experience_years_float, total_duration_months, len(workplaces))
 
         conn.commit()
         return True
@@ -589,16 +844,16 @@ def get_experience(worker_id: str) -> dict:
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM work_experience WHERE worker_id = ? ORDER BY created_at DESC LIMIT 1",
-                       (worker_id,))
+        # work_experience holds one row per worker (unique index on worker_id)
+        cursor.execute(SQL_SELECT_EXPERIENCE, (worker_id,))
         row = cursor.fetchone()
 
         if row:
-            experience = dict(row)
+            experience = dict(zip(_EXPERIENCE_COLS, row))
             # Parse JSON strings
             if experience.get("skills"):
                 try:
-                    experience["skills"] = json.loads(experience["skills"])
+                    experience["skills"] = _loads(experience["skills"])
                 except (TypeError, json.JSONDecodeError):
                     experience["skills"] = []
             else:
@@ -607,7 +862,7 @@ def get_experience(worker_id: str) -> dict:
             # Parse workplaces JSON if available
             if experience.get("workplaces"):
                 try:
-                    experience["workplaces"] = json.loads(experience["workplaces"])
+                    experience["workplaces"] = _loads(experience["workplaces"])
                 except (TypeError, json.JSONDecodeError):
                     logger.warning(f"Failed to parse workplaces JSON for {worker_id}")
                     experience["workplaces"] = []
@@ -635,28 +890,19 @@ def create_voice_session(call_id: str, worker_id: str = None, phone_number: str
     """Create a voice call session - worker_id optional (for Voice Agent generated call_id). Prevents duplicates. Sets exp_ready=0."""
     conn = None
     try:
-        # Check if session already exists
-        existing = get_voice_session(call_id)
-        if existing:
-            logger.info(f"Voice session {call_id} already exists, skipping creation")
-            return True  # Return True as session exists (idempotent)
-
         conn = get_db_connection()
         cursor = conn.cursor()
         logger.info(
             f"Creating voice session {call_id} for worker {worker_id or 'UNKNOWN'}, phone: {phone_number or 'N/A'}")
 
-        cursor.execute("""
-        INSERT INTO voice_sessions (call_id, worker_id, phone_number, exp_ready)
-        VALUES (?, ?, ?, 0)
-        """, (call_id, worker_id, phone_number))
+        # Conflicts on call_id are a no-op (idempotent create) - no probe SELECT, no IntegrityError race
+        cursor.execute(SQL_INSERT_VOICE_SESSION, (call_id, worker_id, phone_number))
         conn.commit()
-        logger.info(f"Voice session created: {call_id} (exp_ready=0)")
+        if cursor.rowcount == 0:
+            logger.info(f"Voice session {call_id} already exists, skipping creation")
+        else:
+            logger.info(f"Voice session created: {call_id} (exp_ready=0)")
         return True
-    except sqlite3.IntegrityError as e:
-        # Handle race condition - session might have been created between check and insert
-        logger.warning(f"Voice session {call_id} already exists (race condition): {str(e)}")
-        return True  # Return True as session exists (idempotent)
     except Exception as e:
         logger.error(f"Error creating voice session {call_id}: {str(e)}", exc_info=True)
         return False
@@ -672,50 +918,37 @@ def update_voice_session(call_id: str, step: int, status: str = "ongoing", respo
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        logger.info(f"Updating voice session {call_id}: step={step}, status={status}")
-
-        updates = []
-        params = []
+        logger.debug("Updating voice session %s: step=%s, status=%s", call_id, step, status)
 
-        updates.append("current_step = ?")
-        params.append(step)
-
-        updates.append("status = ?")
-        params.append(status)
+        mask = 0
+        params = [step, status]
 
         if responses_json is not None:
-            updates.append("responses_json = ?")
+            mask |= 1
             params.append(responses_json)
 
         if transcript is not None:
-            updates.append("transcript = ?")
+            mask |= 2
             params.append(transcript)
 
         if experience_json is not None:
-            updates.append("experience_json = ?")
+            mask |= 4
             params.append(experience_json)
 
         if exp_ready is not None:
             # Convert boolean to integer for SQLite storage (1 for True, 0 for False)
-            updates.append("exp_ready = ?")
+            mask |= 8
             params.append(1 if exp_ready else 0)
-            logger.info(f"Setting exp_ready={exp_ready} (stored as {1 if exp_ready else 0}) for call_id={call_id}")
-
-        updates.append("updated_at = CURRENT_TIMESTAMP")
+            logger.debug("Setting exp_ready=%s for call_id=%s", exp_ready, call_id)
 
-        query = f"""
-        UPDATE voice_sessions 
-        SET {', '.join(updates)}
-        WHERE call_id = ?
-        """
         params.append(call_id)
 
-        cursor.execute(query, params)
+        cursor.execute(SQL_UPDATE_VOICE_SESSION[mask], params)
         conn.commit()
         if cursor.rowcount == 0:
             logger.error(f"Voice session update affected 0 rows for call_id={call_id!r} - session may not exist")
             return False
-        logger.info(f"Voice session updated: {call_id}")
+        logger.info("Voice session updated: %s", call_id)
         return True
     except Exception as e:
         logger.error(f"Error updating voice session {call_id}: {str(e)}", exc_info=True)
@@ -725,27 +958,12 @@ def update_voice_session(call_id: str, step: int, status: str = "ongoing", respo
             conn.close()
 
 
-def get_voice_session(call_id: str) -> dict:
+@_db_op(None, "getting voice session")
+def get_voice_session(cursor, call_id: str) -> dict:
     """Get voice session details with exp_ready as boolean"""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM voice_sessions WHERE call_id = ?", (call_id,))
-        row = cursor.fetchone()
-        if row:
-            session_dict = dict(row)
-            # Convert exp_ready from integer (0/1) to boolean for consistency
-            if 'exp_ready' in session_dict and session_dict['exp_ready'] is not None:
-                session_dict['exp_ready'] = bool(session_dict['exp_ready'])
-            return session_dict
-        return None
-    except Exception as e:
-        logger.error(f"Error getting voice session {call_id}: {str(e)}", exc_info=True)
-        return None
-    finally:
-        if conn is not None:
-            conn.close()
+    cursor.execute(SQL_SELECT_VOICE_SESSION, (call_id,))
+    row = cursor.fetchone()
+    return dict(zip(_VOICE_SESSION_COLS, row)) if row else None
 
 
 def link_call_to_worker(call_id: str, worker_id: str) -> bool:
@@ -784,27 +1002,157 @@ def link_call_to_worker(call_id: str, worker_id: str) -> bool:
             conn.close()
 
 
-def get_cv_status(worker_id: str) -> dict:
-    """Get CV status for a worker. Returns dict with has_cv flag and metadata."""
+def _link_session(cursor, call_id: str, worker_id: str) -> Optional[dict]:
+    """Set worker_id on a voice session and return the updated row (exp_ready as bool), or None if call_id is unknown."""
+    if _SQLITE_HAS_RETURNING:
+        cursor.execute("""
+        UPDATE voice_sessions 
+        SET worker_id = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE call_id = ?
+        RETURNING *
+        """, (worker_id, call_id))
+        rows = cursor.fetchall()
+        row = rows[0] if rows else None
+    else:
+        cursor.execute("""
+        UPDATE voice_sessions 
+        SET worker_id = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE call_id = ?
+        """, (worker_id, call_id))
+        if cursor.rowcount == 0:
+            return None
+        cursor.execute(SQL_SELECT_VOICE_SESSION, (call_id,))
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(row)
+
+
+def link_call_and_get_session(call_id: str, worker_id: str) -> Optional[dict]:
+    """
+    Link a call_id to worker_id and return the updated voice session in one round-trip.
+    Returns None if the worker or session does not exist, or on database error.
+    """
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM cv_status WHERE worker_id = ?", (worker_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        # If no record exists, return default (no CV yet)
-        logger.debug(f"No cv_status record found for worker {worker_id}, returning default (has_cv=0)")
+
+        cursor.execute(SQL_WORKER_EXISTS, (worker_id,))
+        if not cursor.fetchone()[0]:
+            logger.error(f"Worker {worker_id} not found for linking")
+            return None
+
+        session_dict = _link_session(cursor, call_id, worker_id)
+        if session_dict is None:
+            logger.error(f"Call session {call_id} not found for linking")
+            conn.rollback()
+            return None
+
+        conn.commit()
+        logger.info(f"Successfully linked call_id {call_id} to worker_id {worker_id}")
+        return session_dict
+    except Exception as e:
+        logger.error(f"Error linking call_id {call_id} to worker_id {worker_id}: {str(e)}", exc_info=True)
+        if conn:
+            conn.rollback()
         return None
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def link_and_fetch_bundle(call_id: str, worker_id: str) -> dict:
+    """
+    Link call_id to worker_id and fetch everything the link endpoint needs in one connection/transaction.
+
+    Returns:
+        {
+            "worker": dict or None (None if worker does not exist - nothing is linked),
+            "session": dict or None (voice session after linking, None if call_id not found; a session
+                       already linked to worker_id is not updated),
+            "education_docs": list (educational documents with actual data),
+            "cv_status": dict or None,
+            "cv_up_to_date": bool (session was already linked to worker_id - a retry - and the CV was
+                             generated strictly after the session last changed)
+        }
+        Returns None on database error.
+    """
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        bundle = {"worker": None, "session": None, "education_docs": [], "cv_status": None, "cv_up_to_date": False}
+
+        cursor.execute("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
+        row = cursor.fetchone()
+        if not row:
+            logger.error(f"Worker {worker_id} not found for linking")
+            return bundle
+        bundle["worker"] = dict(row)
+
+        cursor.execute(SQL_SELECT_VOICE_SESSION, (call_id,))
+        row = cursor.fetchone()
+        if not row:
+            logger.error(f"Call session {call_id} not found for linking")
+            return bundle
+        session_dict = dict(row)
+        # updated_at before any link bump - a CV generated after that already covers this session
+        session_changed_at = session_dict["updated_at"]
+
+        # Re-linking to the same worker (a retry) leaves the row alone: bumping updated_at would make
+        # the session look newer than the CV and the next retry would regenerate it
+        is_retry = session_dict["worker_id"] == worker_id
+        if not is_retry:
+            session_dict = _link_session(cursor, call_id, worker_id)
+            if session_dict is None:
+                logger.error(f"Call session {call_id} not found for linking")
+                conn.rollback()
+                return bundle
+        bundle["session"] = session_dict
+
+        cursor.execute(SQL_SELECT_CV_STATUS, (worker_id,))
+        row = cursor.fetchone()
+        cv_status = dict(zip(_CV_STATUS_COLS, row)) if row else None
+        bundle["cv_status"] = cv_status
+        # Timestamps are second-resolution text: a CV from the same second may predate the session write
+        bundle["cv_up_to_date"] = bool(
+            is_retry and cv_status and cv_status.get("has_cv") and cv_status.get("cv_generated_at")
+            and session_changed_at and cv_status["cv_generated_at"] > session_changed_at
+        )
+
+        # Education docs only feed CV generation - not needed when the CV is already current
+        if not bundle["cv_up_to_date"]:
+            cursor.execute("""
+                SELECT * FROM educational_documents 
+                WHERE worker_id = ? 
+                AND qualification IS NOT NULL 
+                ORDER BY created_at DESC
+            """, (worker_id,))
+            bundle["education_docs"] = [dict(row) for row in cursor]
+
+        conn.commit()
+        logger.info(f"Successfully linked call_id {call_id} to worker_id {worker_id}")
+        return bundle
     except Exception as e:
-        logger.error(f"Error getting cv_status for {worker_id}: {str(e)}", exc_info=True)
+        logger.error(f"Error linking call_id {call_id} to worker_id {worker_id}: {str(e)}", exc_info=True)
+        if conn:
+            conn.rollback()
         return None
     finally:
         if conn is not None:
             conn.close()
 
 
+@_db_op(None, "getting cv_status for")
+def get_cv_status(cursor, worker_id: str) -> dict:
+    """Get CV status for a worker. Returns dict with has_cv flag and metadata."""
+    cursor.execute(SQL_SELECT_CV_STATUS, (worker_id,))
+    row = cursor.fetchone()
+    # No record means no CV yet
+    return dict(zip(_CV_STATUS_COLS, row)) if row else None
+
+
 def update_cv_status(worker_id: str, has_cv: bool = True) -> bool:
     """
     Update or create CV status for worker.
@@ -815,53 +1163,13 @@ def update_cv_status(worker_id: str, has_cv: bool = True) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        logger.info(f"[CV STATUS] Updating cv_status for {worker_id}: has_cv={has_cv}")
-
-        # Check if record exists
-        cursor.execute("SELECT id FROM cv_status WHERE worker_id = ?", (worker_id,))
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing record
-            if has_cv:
-                cursor.execute("""
-                UPDATE cv_status 
-                SET has_cv = 1, cv_generated_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                WHERE worker_id = ?
-                """, (worker_id,))
-                logger.info(f"[CV STATUS] ✓ CV status updated for {worker_id}: has_cv=1, cv_generated_at=NOW")
-            else:
-                cursor.execute("""
-                UPDATE cv_status 
-                SET has_cv = 0, cv_generated_at = NULL, updated_at = CURRENT_TIMESTAMP
-                WHERE worker_id = ?
-                """, (worker_id,))
-                logger.info(f"[CV STATUS] ✓ CV status reset for {worker_id}: has_cv=0")
-        else:
-            # Create new record
-            if has_cv:
-                cursor.execute("""
-                INSERT INTO cv_status (worker_id, has_cv, cv_generated_at, created_at, updated_at)
-                VALUES (?, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """, (worker_id,))
-                logger.info(f"[CV STATUS] ✓ CV status created for {worker_id}: has_cv=1, cv_generated_at=NOW")
-            else:
-                cursor.execute("""
-                INSERT INTO cv_status (worker_id, has_cv, created_at, updated_at)
-                VALUES (?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """, (worker_id,))
-                logger.info(f"[CV STATUS] ✓ CV status created for {worker_id}: has_cv=0")
-
+        # One UPSERT (cv_status.worker_id is UNIQUE); rowcount is 1 for both the insert and the update
+        cursor.execute(SQL_UPSERT_CV_STATUS, (worker_id, 1 if has_cv else 0))
         conn.commit()
 
         if cursor.rowcount > 0:
-            # Verify the update
-            cursor.execute("SELECT has_cv FROM cv_status WHERE worker_id = ?", (worker_id,))
-            result = cursor.fetchone()
-            if result:
-                stored_has_cv = bool(result[0])
-                logger.info(f"[CV STATUS] ✓ Verified: has_cv stored in DB as {stored_has_cv}")
-                return True
+            logger.info("[CV STATUS] ✓ cv_status saved for %s: has_cv=%d", worker_id, has_cv)
+            return True
 
         logger.error(f"[CV STATUS] ✗ Failed to update cv_status for {worker_id}")
         return False
@@ -882,36 +1190,21 @@ def get_latest_voice_session_by_worker(worker_id: str) -> dict:
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-        SELECT * FROM voice_sessions 
-        WHERE worker_id = ? 
-        ORDER BY updated_at DESC 
-        LIMIT 1
-        """, (worker_id,))
+        cursor.execute(SQL_SELECT_LATEST_VOICE_SESSION_BY_WORKER, (worker_id,))
         row = cursor.fetchone()
         if row:
-            session_dict = dict(row)
-            # Convert exp_ready from integer (0/1) to boolean for JSON response
-            exp_ready_raw = session_dict.get('exp_ready')
-            logger.info(
-                f"[VOICE SESSION] Raw exp_ready from DB: {exp_ready_raw} (type: {type(exp_ready_raw).__name__})")
-
-            if 'exp_ready' in session_dict and session_dict['exp_ready'] is not None:
-                session_dict['exp_ready'] = bool(session_dict['exp_ready'])
-                logger.info(f"[VOICE SESSION] Converted exp_ready to boolean: {session_dict['exp_ready']}")
-            else:
-                logger.warning(f"[VOICE SESSION] exp_ready field missing or None")
-
-            logger.info(f"[VOICE SESSION] Latest session for worker {worker_id}:")
-            logger.info(f"  - call_id: {session_dict.get('call_id')}")
-            logger.info(f"  - status: {session_dict.get('status')}")
-            logger.info(f"  - current_step: {session_dict.get('current_step')}")
-            logger.info(
-                f"  - exp_ready: {session_dict.get('exp_ready')} (type: {type(session_dict.get('exp_ready')).__name__})")
-            logger.info(f"  - has_transcript: {len(session_dict.get('transcript', '')) > 0}")
-            logger.info(f"  - has_experience_json: {len(session_dict.get('experience_json', '')) > 0}")
+            session_dict = dict(zip(_VOICE_SESSION_SUMMARY_COLS, row))
+            if session_dict.get('exp_ready') is None:
+                logger.warning("[VOICE SESSION] exp_ready field missing or None")
+
+            # Polled by the dashboard - keep the per-call detail at DEBUG, formatted only when enabled
+            logger.debug("[VOICE SESSION] Latest session for worker %s: call_id=%s, status=%s, current_step=%s, "
+                         "exp_ready=%s, has_experience_json=%s",
+                         worker_id, session_dict.get('call_id'), session_dict.get('status'),
+                         session_dict.get('current_step'), session_dict.get('exp_ready'),
+                         bool(session_dict.get('experience_json')))
             return session_dict
-        logger.info(f"No voice sessions found for worker {worker_id}")
+        logger.debug("No voice sessions found for worker %s", worker_id)
         return None
     except Exception as e:
         logger.error(f"Error getting latest voice session for {worker_id}: {str(e)}", exc_info=True)
@@ -921,6 +1214,29 @@ def get_latest_voice_session_by_worker(worker_id: str) -> dict:
             conn.close()
 
 
+@_db_op(None, "getting exp_ready for")
+def get_exp_ready_flag(cursor, call_id: str) -> Optional[bool]:
+    """exp_ready for a voice session without fetching the session row; None if the session does not exist."""
+    cursor.execute(SQL_SELECT_EXP_READY, (call_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return row[0] or False
+
+
+@_db_op(None, "getting exp_ready by worker")
+def get_exp_ready_by_worker(cursor, worker_id: str) -> Optional[dict]:
+    """
+    exp_ready state of a worker's latest voice session: call_id, exp_ready and, only when
+    exp_ready is set, experience_json. None if the worker has no voice session.
+    """
+    cursor.execute(SQL_SELECT_EXP_READY_BY_WORKER, (worker_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return {"call_id": row["call_id"], "exp_ready": row["exp_ready"] or False, "experience_json": row[2]}
+
+
 def get_latest_voice_session_by_mobile(mobile_number: str) -> dict:
     """
     Get the latest voice session for a mobile number (fallback when worker_id lookup fails).
@@ -934,20 +1250,12 @@ def get_latest_voice_session_by_mobile(mobile_number: str) -> dict:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Extract just the phone number from call_id pattern (e.g., "MZ..._{mobile}")
-        cursor.execute("""
-        SELECT * FROM voice_sessions 
-        WHERE call_id LIKE '%' || ? 
-        ORDER BY updated_at DESC 
-        LIMIT 1
-        """, (mobile_number,))
+        # Match the phone number in the call_id pattern (e.g., "MZ..._{mobile}") via the expression index
+        cursor.execute(SQL_SELECT_LATEST_VOICE_SESSION_BY_CALL_MOBILE, (mobile_number, mobile_number))
         row = cursor.fetchone()
 
         if row:
-            session_dict = dict(row)
-            # Convert exp_ready from integer (0/1) to boolean for JSON response
-            if 'exp_ready' in session_dict and session_dict['exp_ready'] is not None:
-                session_dict['exp_ready'] = bool(session_dict['exp_ready'])
+            session_dict = dict(zip(_VOICE_SESSION_SUMMARY_COLS, row))
 
             logger.info(f"[VOICE SESSION] Found session by mobile {mobile_number}:")
             logger.info(f"  - call_id: {session_dict.get('call_id')}")
@@ -975,22 +1283,15 @@ def update_exp_ready(call_id: str, exp_ready: bool = True) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        logger.info(f"[EXP READY] Updating exp_ready for call_id {call_id}: exp_ready={exp_ready}")
-
         # Update the flag
-        cursor.execute("""
-        UPDATE voice_sessions 
-        SET exp_ready = ?, updated_at = CURRENT_TIMESTAMP
-        WHERE call_id = ?
-        """, (1 if exp_ready else 0, call_id))
+        cursor.execute(SQL_UPDATE_EXP_READY, (1 if exp_ready else 0, call_id))
         conn.commit()
 
         if cursor.rowcount == 0:
             logger.error(f"[EXP READY] ✗ Voice session {call_id} not found for update")
             return False
 
-        logger.info(
-            f"[EXP READY] ✓ exp_ready updated for {call_id}: exp_ready={exp_ready} (stored as {1 if exp_ready else 0})")
+        logger.info("[EXP READY] ✓ exp_ready updated for %s: exp_ready=%s", call_id, exp_ready)
         return True
     except Exception as e:
         logger.error(f"[EXP READY] ✗ Error updating exp_ready for {call_id}: {str(e)}", exc_info=True)
@@ -1000,32 +1301,12 @@ def update_exp_ready(call_id: str, exp_ready: bool = True) -> bool:
             conn.close()
 
 
-def get_voice_session_by_phone(phone_number: str) -> dict:
+@_db_op(None, "getting voice session by phone")
+def get_voice_session_by_phone(cursor, phone_number: str) -> dict:
     """Get the most recent voice session by phone number with exp_ready as boolean."""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM voice_sessions 
-            WHERE phone_number = ? 
-            ORDER BY created_at DESC 
-            LIMIT 1
-        """, (phone_number,))
-        row = cursor.fetchone()
-        if row:
-            session_dict = dict(row)
-            # Convert exp_ready from integer (0/1) to boolean for consistency
-            if 'exp_ready' in session_dict and session_dict['exp_ready'] is not None:
-                session_dict['exp_ready'] = bool(session_dict['exp_ready'])
-            return session_dict
-        return None
-    except Exception as e:
-        logger.error(f"Error getting voice session by phone {phone_number}: {str(e)}", exc_info=True)
-        return None
-    finally:
-        if conn is not None:
-            conn.close()
+    cursor.execute(SQL_SELECT_LATEST_VOICE_SESSION_BY_PHONE, (phone_number,))
+    row = cursor.fetchone()
+    return dict(zip(_VOICE_SESSION_SUMMARY_COLS, row)) if row else None
 
 
 def save_job_listing(title: str, description: str, required_skills: list, location: str) -> int:
@@ -1035,7 +1316,7 @@ def save_job_listing(title: str, description: str, required_skills: list, locati
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        skills_json = json.dumps(required_skills)
+        skills_json = _dumps(required_skills)
         logger.info(f"Saving job listing: {title} at {location}")
 
         cursor.execute("""
@@ -1054,32 +1335,75 @@ def save_job_listing(title: str, description: str, required_skills: list, locati
             conn.close()
 
 
-def get_all_jobs() -> list:
-    """Get all job listings"""
+def _row_to_job(row) -> dict:
+    """Job row as a dict with required_skills decoded from JSON."""
+    job = dict(row)
+    if job.get("required_skills"):
+        try:
+            job["required_skills"] = _loads(job["required_skills"])
+        except (TypeError, json.JSONDecodeError):
+            job["required_skills"] = []
+    return job
+
+
+def iter_all_jobs() -> Iterator[dict]:
+    """
+    Yield job listings (newest first) in fetchmany batches, without materializing the whole table.
+    Database errors propagate to the consumer - a stream cut short must not pass for the full list.
+    """
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
+        cursor.arraysize = 128
         cursor.execute("SELECT * FROM jobs ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        jobs = []
-        for row in rows:
-            job = dict(row)
-            if job.get("required_skills"):
-                try:
-                    job["required_skills"] = json.loads(job["required_skills"])
-                except (TypeError, json.JSONDecodeError):
-                    job["required_skills"] = []
-            jobs.append(job)
-        return jobs
-    except Exception as e:
-        logger.error(f"Error getting all jobs: {str(e)}", exc_info=True)
-        return []
+        while batch := cursor.fetchmany():
+            for row in batch:
+                yield _row_to_job(row)
     finally:
         if conn is not None:
             conn.close()
 
 
+def get_all_jobs() -> list:
+    """Get all job listings"""
+    try:
+        return list(iter_all_jobs())
+    except Exception as e:
+        logger.error(f"Error getting all jobs: {str(e)}", exc_info=True)
+        return []
+
+
+@_db_op(None, "getting job")
+def get_job(cursor, job_id: int) -> Optional[dict]:
+    """Get a single job listing by job_id"""
+    cursor.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+    row = cursor.fetchone()
+    return _row_to_job(row) if row else None
+
+
+def _educational_document_row(worker_id: str, education_data: dict) -> tuple:
+    """Parameters for SQL_INSERT_EDUCATIONAL_DOCUMENT, with percentage coerced to float or None (REAL column)."""
+    pct = education_data.get("percentage") or None
+    if pct is not None and pct != "":
+        try:
+            pct = float(str(pct).replace(",", ".").strip())
+        except (ValueError, TypeError):
+            pct = None
+    return (
+        worker_id,
+        education_data.get("document_type", "marksheet"),
+        education_data.get("qualification", ""),
+        education_data.get("board", ""),
+        education_data.get("stream", ""),
+        education_data.get("year_of_passing", ""),
+        education_data.get("school_name", ""),
+        education_data.get("marks_type", ""),
+        education_data.get("marks", ""),
+        pct
+    )
+
+
 def save_educational_document(worker_id: str, education_data: dict) -> bool:
     """Save educational document extracted data"""
     conn = None
@@ -1087,35 +1411,10 @@ def save_educational_document(worker_id: str, education_data: dict) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        logger.info(
-            f"Saving educational document for {worker_id}: qualification={education_data.get('qualification')}, board={education_data.get('board')}, marks_type={education_data.get('marks_type')}")
-
-        # Coerce percentage to float or None for REAL column
-        pct = education_data.get("percentage") or None
-        if pct is not None and pct != "":
-            try:
-                pct = float(str(pct).replace(",", ".").strip())
-            except (ValueError, TypeError):
-                pct = None
-
-        cursor.execute("""
-        INSERT INTO educational_documents
-        (worker_id, document_type, qualification, board, stream, year_of_passing, school_name, marks_type, marks, percentage)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            worker_id,
-            education_data.get("document_type", "marksheet"),
-            education_data.get("qualification", ""),
-            education_data.get("board", ""),
-            education_data.get("stream", ""),
-            education_data.get("year_of_passing", ""),
-            education_data.get("school_name", ""),
-            education_data.get("marks_type", ""),
-            education_data.get("marks", ""),
-            pct
-        ))
+        cursor.execute(SQL_INSERT_EDUCATIONAL_DOCUMENT, _educational_document_row(worker_id, education_data))
         conn.commit()
-        logger.info(f"Educational document saved successfully for {worker_id}")
+        logger.info("Educational document saved for %s: qualification=%s, board=%s, marks_type=%s", worker_id,
+                    education_data.get('qualification'), education_data.get('board'), education_data.get('marks_type'))
         return True
     except Exception as e:
         logger.error(f"Error saving educational document for {worker_id}: {str(e)}", exc_info=True)
@@ -1125,6 +1424,31 @@ def save_educational_document(worker_id: str, education_data: dict) -> bool:
             conn.close()
 
 
+def save_educational_documents_batch(worker_id: str, docs: list) -> bool:
+    """Save several educational documents for a worker in one transaction (one executemany, one commit)."""
+    if not docs:
+        return True
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        rows = [_educational_document_row(worker_id, education_data) for education_data in docs]
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(SQL_INSERT_EDUCATIONAL_DOCUMENT, rows)
+        conn.commit()
+        logger.info(f"Saved {len(rows)} educational document(s) for {worker_id}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving educational documents for {worker_id}: {str(e)}", exc_info=True)
+        if conn is not None:
+            conn.rollback()
+        return False
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 def get_educational_documents(worker_id: str) -> list:
     """
     Get educational documents for worker.
@@ -1143,11 +1467,7 @@ def get_educational_documents(worker_id: str) -> list:
             AND qualification IS NOT NULL 
             ORDER BY created_at DESC
         """, (worker_id,))
-        rows = cursor.fetchall()
-        docs = []
-        for row in rows:
-            docs.append(dict(row))
-        return docs
+        return [dict(row) for row in cursor]
     except Exception as e:
         logger.error(f"Error getting educational documents for {worker_id}: {str(e)}", exc_info=True)
         return []
@@ -1160,27 +1480,17 @@ def create_experience_session(session_id: str, worker_id: str) -> bool:
     """Create a new experience collection session - prevents duplicates"""
     conn = None
     try:
-        # Check if session already exists
-        existing = get_experience_session(session_id)
-        if existing:
-            logger.info(f"Experience session {session_id} already exists, skipping creation")
-            return True  # Return True as session exists (idempotent)
-
         conn = get_db_connection()
         cursor = conn.cursor()
-        logger.info(f"Creating experience session {session_id} for worker {worker_id}")
 
-        cursor.execute("""
-        INSERT INTO experience_sessions (session_id, worker_id, raw_conversation, structured_data)
-        VALUES (?, ?, ?, ?)
-        """, (session_id, worker_id, "{}", "{}"))
+        # Idempotent: an existing session_id is a no-op (rowcount 0), no probe SELECT needed
+        cursor.execute(SQL_INSERT_EXPERIENCE_SESSION, (session_id, worker_id))
         conn.commit()
-        logger.info(f"Experience session created: {session_id}")
+        if cursor.rowcount == 0:
+            logger.info(f"Experience session {session_id} already exists, skipping creation")
+        else:
+            logger.info(f"Experience session created: {session_id} for worker {worker_id}")
         return True
-    except sqlite3.IntegrityError as e:
-        # Handle race condition
-        logger.warning(f"Experience session {session_id} already exists (race condition): {str(e)}")
-        return True  # Return True as session exists (idempotent)
     except Exception as e:
         logger.error(f"Error creating experience session {session_id}: {str(e)}", exc_info=True)
         return False
@@ -1189,23 +1499,12 @@ def create_experience_session(session_id: str, worker_id: str) -> bool:
             conn.close()
 
 
-def get_experience_session(session_id: str) -> dict:
+@_db_op(None, "getting experience session")
+def get_experience_session(cursor, session_id: str) -> dict:
     """Get experience session details"""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM experience_sessions WHERE session_id = ?", (session_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
-    except Exception as e:
-        logger.error(f"Error getting experience session {session_id}: {str(e)}", exc_info=True)
-        return None
-    finally:
-        if conn is not None:
-            conn.close()
+    cursor.execute(SQL_SELECT_EXPERIENCE_SESSION, (session_id,))
+    row = cursor.fetchone()
+    return _unpack_experience_session(row) if row else None
 
 
 def update_experience_session(session_id: str, current_question: int, raw_conversation: dict,
@@ -1217,7 +1516,7 @@ def update_experience_session(session_id: str, current_question: int, raw_conver
         cursor = conn.cursor()
         logger.info(f"Updating experience session {session_id}: question={current_question}, status={status}")
 
-        raw_conversation_json = json.dumps(raw_conversation, ensure_ascii=False)
+        raw_conversation_json = _pack(_dumps(raw_conversation))
 
         cursor.execute("""
         UPDATE experience_sessions 
@@ -1248,7 +1547,7 @@ def update_experience_session_with_structured_data(session_id: str, raw_conversa
         UPDATE experience_sessions 
         SET raw_conversation = ?, structured_data = ?, updated_at = CURRENT_TIMESTAMP
         WHERE session_id = ?
-        """, (raw_conversation, structured_data, session_id))
+        """, (_pack(raw_conversation), _pack(structured_data), session_id))
         conn.commit()
         logger.info(f"Experience session updated with structured data: {session_id}")
         return True
@@ -1260,28 +1559,12 @@ def update_experience_session_with_structured_data(session_id: str, raw_conversa
             conn.close()
 
 
-def get_experience_session_by_worker(worker_id: str) -> dict:
+@_db_op(None, "getting experience session for worker")
+def get_experience_session_by_worker(cursor, worker_id: str) -> dict:
     """Get the latest experience session for a worker"""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-        SELECT * FROM experience_sessions 
-        WHERE worker_id = ? 
-        ORDER BY created_at DESC 
-        LIMIT 1
-        """, (worker_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
-    except Exception as e:
-        logger.error(f"Error getting experience session for worker {worker_id}: {str(e)}", exc_info=True)
-        return None
-    finally:
-        if conn is not None:
-            conn.close()
+    cursor.execute(SQL_SELECT_LATEST_EXPERIENCE_SESSION_BY_WORKER, (worker_id,))
+    row = cursor.fetchone()
+    return _unpack_experience_session(row) if row else None
 
 
 def save_pending_ocr_results(worker_id: str, personal_data: dict = None, education_data: dict = None,
@@ -1292,8 +1575,8 @@ def save_pending_ocr_results(worker_id: str, personal_data: dict = None, educati
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        personal_json = json.dumps(personal_data, ensure_ascii=False) if personal_data else None
-        education_json = json.dumps(education_data, ensure_ascii=False) if education_data else None
+        personal_json = _pack(_dumps(personal_data)) if personal_data else None
+        education_json = _pack(_dumps(education_data)) if education_data else None
 
         cursor.execute("""
         INSERT OR REPLACE INTO pending_ocr_results 
@@ -1322,15 +1605,17 @@ def get_pending_ocr_results(worker_id: str) -> dict:
 
         if row:
             result = dict(row)
+            result["personal_data_json"] = _unpack(result.get("personal_data_json"))
+            result["education_data_json"] = _unpack(result.get("education_data_json"))
             # Parse JSON fields
             if result.get("personal_data_json"):
                 try:
-                    result["personal_data"] = json.loads(result["personal_data_json"])
+                    result["personal_data"] = _loads(result["personal_data_json"])
                 except (TypeError, json.JSONDecodeError):
                     result["personal_data"] = None
             if result.get("education_data_json"):
                 try:
-                    result["education_data"] = json.loads(result["education_data_json"])
+                    result["education_data"] = _loads(result["education_data_json"])
                 except (TypeError, json.JSONDecodeError):
                     result["education_data"] = None
             return result
@@ -1343,22 +1628,13 @@ def get_pending_ocr_results(worker_id: str) -> dict:
             conn.close()
 
 
-def delete_pending_ocr_results(worker_id: str) -> bool:
+@_db_op(False, "deleting pending OCR results for")
+def delete_pending_ocr_results(cursor, worker_id: str) -> bool:
     """Delete pending OCR results after submission"""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM pending_ocr_results WHERE worker_id = ?", (worker_id,))
-        conn.commit()
-        logger.info(f"Pending OCR results deleted for worker {worker_id}")
-        return True
-    except Exception as e:
-        logger.error(f"Error deleting pending OCR results: {str(e)}", exc_info=True)
-        return False
-    finally:
-        if conn is not None:
-            conn.close()
+    cursor.execute(SQL_DELETE_PENDING_OCR_RESULTS, (worker_id,))
+    cursor.connection.commit()
+    logger.info(f"Pending OCR results deleted for worker {worker_id}")
+    return True
 
 
 def get_latest_transcript_by_worker(worker_id: str) -> Optional[str]:
@@ -1371,37 +1647,16 @@ def get_latest_transcript_by_worker(worker_id: str) -> Optional[str]:
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-            SELECT transcript
-            FROM voice_sessions
-            WHERE worker_id = ? AND transcript IS NOT NULL AND transcript != ''
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """, (worker_id,))
+        # One statement for both paths: the worker's own latest session wins, otherwise the latest
+        # session for the worker's mobile number (e.g. session not yet linked)
+        cursor.execute(SQL_SELECT_LATEST_TRANSCRIPT_FOR_WORKER, (worker_id,))
         row = cursor.fetchone()
-        if row and row[0]:
-            logger.info(f"Found transcript for worker {worker_id} (length: {len(row[0])} chars)")
-            return row[0]
+        if row and row["transcript"]:
+            call_id, transcript, session_worker_id = row["call_id"], row["transcript"], row["worker_id"]
+            if session_worker_id == worker_id:
+                logger.info(f"Found transcript for worker {worker_id} (length: {len(transcript)} chars)")
+                return transcript
 
-        # Fallback: find transcript by worker's phone_number (e.g. session not yet linked)
-        worker = get_worker(worker_id)
-        if not worker:
-            logger.info(f"No transcript found for worker {worker_id} (worker not found)")
-            return None
-        phone_number = worker.get("mobile_number")
-        if not phone_number:
-            logger.info(f"No transcript found for worker {worker_id} (no mobile)")
-            return None
-        cursor.execute("""
-            SELECT call_id, transcript
-            FROM voice_sessions
-            WHERE phone_number = ? AND transcript IS NOT NULL AND transcript != ''
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """, (phone_number,))
-        row = cursor.fetchone()
-        if row and row[1]:
-            call_id, transcript = row[0], row[1]
             cursor.execute(
                 "UPDATE voice_sessions SET worker_id = ?, updated_at = CURRENT_TIMESTAMP WHERE call_id = ?",
                 (worker_id, call_id)
@@ -1441,54 +1696,150 @@ def create_cv_status(worker_id: str) -> bool:
             conn.close()
 
 
-def get_cv_status(worker_id: str) -> dict:
-    """Get CV status for a worker"""
+def mark_cv_generated(worker_id: str) -> bool:
+    """Mark CV as generated for a worker"""
+    # Same single-statement upsert (one commit) as update_cv_status
+    return update_cv_status(worker_id, has_cv=True)
+
+
+# ========== PENDING EMBEDDINGS (vector DB retry queue) ==========
+
+def queue_pending_embedding(doc_id: str, document: str, metadata: dict, error: str = None) -> bool:
+    """Queue a failed vector DB write for background retry (replaces any queued payload for the same doc_id)."""
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM cv_status WHERE worker_id = ?", (worker_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        cursor.execute("""
+        INSERT INTO pending_embeddings (doc_id, document, metadata_json, last_error)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(doc_id) DO UPDATE SET
+            document = excluded.document,
+            metadata_json = excluded.metadata_json,
+            last_error = excluded.last_error,
+            attempts = 0,
+            next_attempt_at = CURRENT_TIMESTAMP
+        """, (doc_id, document, _dumps(metadata or {}), error))
+        conn.commit()
+        logger.info(f"Queued embedding {doc_id} for retry")
+        return True
     except Exception as e:
-        logger.error(f"Error getting cv_status for {worker_id}: {str(e)}", exc_info=True)
-        return None
+        logger.error(f"Error queueing pending embedding {doc_id}: {str(e)}", exc_info=True)
+        return False
     finally:
         if conn is not None:
             conn.close()
 
 
-def mark_cv_generated(worker_id: str) -> bool:
-    """Mark CV as generated for a worker"""
+def get_due_pending_embeddings(max_attempts: int, limit: int = 20) -> list:
+    """Get queued embeddings whose next attempt is due and that have not exhausted their attempts."""
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         cursor.execute("""
-        UPDATE cv_status 
-        SET has_cv = 1, cv_generated_at = CURRENT_TIMESTAMP
-        WHERE worker_id = ?
-        """, (worker_id,))
+        SELECT * FROM pending_embeddings
+        WHERE next_attempt_at <= CURRENT_TIMESTAMP AND attempts < ?
+        ORDER BY next_attempt_at
+        LIMIT ?
+        """, (max_attempts, limit))
+        pending = []
+        for row in cursor:
+            item = dict(row)
+            item["metadata"] = _loads(item["metadata_json"] or "{}")
+            pending.append(item)
+        return pending
+    except Exception as e:
+        logger.error(f"Error getting pending embeddings: {str(e)}", exc_info=True)
+        return []
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def reschedule_pending_embedding(doc_id: str, delay_seconds: int, error: str = None) -> bool:
+    """Record a failed retry: bump attempts and push next_attempt_at out by delay_seconds."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+        UPDATE pending_embeddings
+        SET attempts = attempts + 1,
+            next_attempt_at = datetime('now', ?),
+            last_error = ?
+        WHERE doc_id = ?
+        """, (f"+{int(delay_seconds)} seconds", error, doc_id))
+        conn.commit()
+        return cursor.rowcount > 0
+    except Exception as e:
+        logger.error(f"Error rescheduling pending embedding {doc_id}: {str(e)}", exc_info=True)
+        return False
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def delete_pending_embedding(doc_id: str) -> bool:
+    """Remove a queued embedding once it has been stored."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM pending_embeddings WHERE doc_id = ?", (doc_id,))
+        conn.commit()
+        return True
+    except Exception as e:
+        logger.error(f"Error deleting pending embedding {doc_id}: {str(e)}", exc_info=True)
+        return False
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def delete_pending_embeddings(items: list) -> bool:
+    """
+    Remove retried embeddings (items from get_due_pending_embeddings) from the queue in one transaction.
+    A row is only deleted if it is still the version that was read: a payload re-queued for the same
+    doc_id in the meantime (a newer write that failed) stays queued.
+    """
+    if not items:
+        return True
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            SQL_DELETE_PENDING_EMBEDDING_VERSION,
+            [(item["doc_id"], item["attempts"], item["next_attempt_at"], item["document"], item["metadata_json"])
+             for item in items]
+        )
         conn.commit()
-        if cursor.rowcount == 0:
-            # If no row exists, create one
-            cursor.execute("""
-            INSERT INTO cv_status (worker_id, has_cv, cv_generated_at)
-            VALUES (?, 1, CURRENT_TIMESTAMP)
-            """, (worker_id,))
-            conn.commit()
-        logger.info(f"CV marked as generated for worker {worker_id}")
         return True
     except Exception as e:
-        logger.error(f"Error marking CV as generated for {worker_id}: {str(e)}", exc_info=True)
+        logger.error(f"Error deleting {len(items)} pending embedding(s): {str(e)}", exc_info=True)
         return False
     finally:
         if conn is not None:
             conn.close()
 
 
+def count_pending_embeddings() -> int:
+    """Number of embeddings waiting in the retry queue."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM pending_embeddings")
+        return cursor.fetchone()[0]
+    except Exception as e:
+        logger.error(f"Error counting pending embeddings: {str(e)}", exc_info=True)
+        return 0
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 # ========== VERIFICATION CRUD FUNCTIONS ==========
 
 def update_worker_verification(
@@ -1517,63 +1868,51 @@ def update_worker_verification(
         cursor = conn.cursor()
 
         # Serialize errors dict to JSON string if provided
-        errors_json = json.dumps(errors, ensure_ascii=False) if errors else None
+        errors_json = _dumps(errors) if errors else None
 
-        # Build dynamic SQL based on what fields are being updated
-        updates = ["verification_status = ?"]
+        # Pick the prebuilt UPDATE for the fields being set (verified_at is stamped only on 'verified')
         values = [status]
-
-        if errors_json is not None:
-            updates.append("verification_errors = ?")
-            values.append(errors_json)
-
-        if extracted_name is not None:
-            updates.append("personal_extracted_name = ?")
-            values.append(extracted_name)
-
-        if extracted_dob is not None:
-            updates.append("personal_extracted_dob = ?")
-            values.append(extracted_dob)
-
-        # Add verified_at timestamp if status is verified
-        if status == 'verified':
-            updates.append("verified_at = CURRENT_TIMESTAMP")
-
-        # Add worker_id for WHERE clause
+        mask = 0
+        for i, value in enumerate((errors_json, extracted_name, extracted_dob)):
+            if value is not None:
+                mask |= 1 << i
+                values.append(value)
         values.append(worker_id)
 
-        sql = f"UPDATE workers SET {', '.join(updates)} WHERE worker_id = ?"
+        variants = SQL_UPDATE_WORKER_VERIFICATION_VERIFIED if status == 'verified' else SQL_UPDATE_WORKER_VERIFICATION
+        sql = variants[mask]
 
+        # Status update and the education-verification reset below commit together
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(sql, tuple(values))
-        conn.commit()
 
         if cursor.rowcount == 0:
             logger.error(f"UPDATE workers matched 0 rows for worker_id={worker_id!r}. Worker may not exist.")
+            conn.rollback()
             return False
 
-        logger.info(f"✓ Updated verification status for worker {worker_id}: status={status}")
+        logger.info("✓ Updated verification status for worker %s: status=%s", worker_id, status)
 
         # ============================================================================
         # RESET EDUCATIONAL DOCUMENT VERIFICATION (if personal data was updated)
         # Since personal extracted data changed, educational verification is now invalid
         # ============================================================================
         if extracted_name is not None or extracted_dob is not None:
-            logger.info(f"Personal extracted data changed for worker {worker_id} - resetting educational verification")
+            logger.info("Personal extracted data changed for worker %s - resetting educational verification", worker_id)
 
-            cursor.execute("""
-            UPDATE educational_documents
-            SET verification_status = NULL
-            WHERE worker_id = ?
-            """, (worker_id,))
+            cursor.execute(SQL_RESET_EDUCATION_VERIFICATION, (worker_id,))
 
-            logger.info(f"Reset educational document verification_status to NULL (rows affected: {cursor.rowcount})")
-            conn.commit()
+            logger.debug("Reset educational document verification_status to NULL (rows affected: %d)", cursor.rowcount)
 
+        conn.commit()
         return True
     except Exception as e:
         logger.error(f"Error updating worker verification for {worker_id}: {str(e)}", exc_info=True)
+        if conn is not None:
+            conn.rollback()
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -1594,23 +1933,25 @@ def save_educational_document_with_llm_data(
         llm_data: Full JSON response from LLM
 
     Returns:
-        True if successful, False otherwise
+        True if successful, False otherwise (including when education_data has no usable fields)
     """
+    if not education_data or not any(education_data.get(k) for k in _EDUCATIONAL_DOCUMENT_DATA_KEYS):
+        logger.info("[EDU+LLM SAVE] Empty education payload for %s, skipping", worker_id)
+        return False
+
     conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        logger.info(f"[EDU+LLM SAVE] Saving educational document with LLM data for {worker_id}")
-        logger.info(f"[EDU+LLM SAVE] Education data keys: {list(education_data.keys()) if education_data else 'None'}")
+        logger.info("[EDU+LLM SAVE] Saving educational document with LLM data for %s", worker_id)
+        logger.debug("[EDU+LLM SAVE] Education data keys: %s", list(education_data) if education_data else None)
 
         # Extract and validate name and DOB - CRITICAL FOR VERIFICATION
         extracted_name = education_data.get("name")
         extracted_dob = education_data.get("dob")
 
-        logger.info(f"[EDU+LLM SAVE] [STEP 0] Raw dict values:")
-        logger.info(f"[EDU+LLM SAVE]          name from dict: {repr(extracted_name)}")
-        logger.info(f"[EDU+LLM SAVE]          dob from dict: {repr(extracted_dob)}")
+        logger.debug("[EDU+LLM SAVE] [STEP 0] Raw dict values: name=%r, dob=%r", extracted_name, extracted_dob)
 
         # Ensure we're not storing null/None, only strings or None
         if extracted_name:
@@ -1623,16 +1964,8 @@ def save_educational_document_with_llm_data(
             if not extracted_dob:
                 extracted_dob = None
 
-        logger.info(f"[EDU+LLM SAVE] [STEP 1] After string conversion & strip:")
-        logger.info(
-            f"[EDU+LLM SAVE]          extracted_name={repr(extracted_name)} (type: {type(extracted_name).__name__ if extracted_name else 'NoneType'})")
-        logger.info(
-            f"[EDU+LLM SAVE]          extracted_dob={repr(extracted_dob)} (type: {type(extracted_dob).__name__ if extracted_dob else 'NoneType'})")
-
-        # Final validation
-        logger.info(f"[EDU+LLM SAVE] [STEP 2] Final validation before INSERT:")
-        logger.info(f"[EDU+LLM SAVE]          name_will_save={extracted_name if extracted_name else None}")
-        logger.info(f"[EDU+LLM SAVE]          dob_will_save={extracted_dob if extracted_dob else None}")
+        logger.debug("[EDU+LLM SAVE] [STEP 1] After strip: extracted_name=%r, extracted_dob=%r",
+                     extracted_name, extracted_dob)
 
         # Convert percentage to float if it exists
         percentage = education_data.get("percentage")
@@ -1641,206 +1974,116 @@ def save_educational_document_with_llm_data(
                 percentage_str = percentage.replace("%", "").strip()
                 percentage = float(percentage_str) if percentage_str else None
             except (ValueError, AttributeError):
-                logger.warning(f"[EDU+LLM SAVE] Could not convert percentage to float: {percentage}")
+                logger.warning("[EDU+LLM SAVE] Could not convert percentage to float: %s", percentage)
                 percentage = None
 
         # Serialize JSON data
-        llm_data_json = json.dumps(llm_data, ensure_ascii=False)
-
-        # First check if record exists
-        cursor.execute("""
-            SELECT id FROM educational_documents
-            WHERE worker_id = ?
-        """, (
-            worker_id,
-        ))
-
-        existing = cursor.fetchone()
-
-        if existing:
-            # Record found → UPDATE
-            cursor.execute("""
-                UPDATE educational_documents
-                SET document_type = ?, qualification = ?, board = ?, 
-                    stream = ?, year_of_passing = ?, school_name = ?, 
-                    marks_type = ?, marks = ?, percentage = ?, 
-                    raw_ocr_text = ?, llm_extracted_data = ?, 
-                    extracted_name = ?, extracted_dob = ?, verification_status = ?
-                WHERE worker_id = ? 
-            """, (
-                education_data.get("document_type"),
-                education_data.get("qualification"),
-                education_data.get("board"),
-                education_data.get("stream"),
-                education_data.get("year_of_passing"),
-                education_data.get("school_name"),
-                education_data.get("marks_type"),
-                education_data.get("marks"),
-                percentage,
-                raw_ocr_text,
-                llm_data_json,
-                extracted_name if extracted_name else None,
-                extracted_dob if extracted_dob else None,
-                'pending',
-                worker_id
-            ))
-        else:
-            # Record not found → INSERT
-            cursor.execute("""
-                INSERT INTO educational_documents 
-                (worker_id, document_type, qualification, board, stream, year_of_passing, 
-                 school_name, marks_type, marks, percentage, 
-                 raw_ocr_text, llm_extracted_data, extracted_name, extracted_dob, verification_status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                worker_id,
-                education_data.get("document_type"),
-                education_data.get("qualification"),
-                education_data.get("board"),
-                education_data.get("stream"),
-                education_data.get("year_of_passing"),
-                education_data.get("school_name"),
-                education_data.get("marks_type"),
-                education_data.get("marks"),
-                percentage,
-                raw_ocr_text,
-                llm_data_json,
-                extracted_name if extracted_name else None,
-                extracted_dob if extracted_dob else None,
-                'pending'
-            ))
-
-        logger.info(f"[EDU+LLM SAVE] [STEP 4] INSERT executed, values passed to DB:")
-        logger.info(f"[EDU+LLM SAVE]          extracted_name param={repr(extracted_name if extracted_name else None)}")
-        logger.info(f"[EDU+LLM SAVE]          extracted_dob param={repr(extracted_dob if extracted_dob else None)}")
-
-        conn.commit()
-
-        # Verify what was actually saved in the database
-        # Instead of using lastrowid, query by worker_id
-        cursor.execute("""
-        SELECT id, extracted_name, extracted_dob, verification_status
-        FROM educational_documents
-        WHERE worker_id = ?
-        """, (worker_id,))
+        llm_data_json = _dumps(llm_data) if llm_data else None
+
+        fields = (
+            education_data.get("document_type"),
+            education_data.get("qualification"),
+            education_data.get("board"),
+            education_data.get("stream"),
+            education_data.get("year_of_passing"),
+            education_data.get("school_name"),
+            education_data.get("marks_type"),
+            education_data.get("marks"),
+            percentage,
+            raw_ocr_text,
+            llm_data_json,
+            extracted_name,
+            extracted_dob,
+            'pending'
+        )
 
-        saved_row = cursor.fetchone()
+        # UPDATE the worker's row(s); INSERT only when nothing matched. Both run in one write
+        # transaction, so two concurrent OCR saves for the same worker cannot both insert.
+        # (No UNIQUE(worker_id) upsert: a worker may hold several educational_documents rows.)
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(SQL_UPDATE_EDUCATIONAL_DOCUMENT_LLM, fields + (worker_id,))
+        if cursor.rowcount == 0:
+            cursor.execute(SQL_INSERT_EDUCATIONAL_DOCUMENT_LLM, (worker_id,) + fields)
 
-        if saved_row:
-            logger.info(f"[EDU+LLM SAVE] [STEP 5] ✓ Verified in database:")
-            logger.info(f"[EDU+LLM SAVE]          doc_id={saved_row[0]}")
-            logger.info(f"[EDU+LLM SAVE]          saved_name={repr(saved_row[1])} (is_null={saved_row[1] is None})")
-            logger.info(f"[EDU+LLM SAVE]          saved_dob={repr(saved_row[2])} (is_null={saved_row[2] is None})")
-            logger.info(f"[EDU+LLM SAVE]          status={saved_row[3]}")
-        else:
-            logger.warning(f"[EDU+LLM SAVE] ✗ Could not verify saved row in database")
+        logger.debug("[EDU+LLM SAVE] [STEP 4] Document written: extracted_name=%r, extracted_dob=%r",
+                     fields[11], fields[12])
 
         # ============================================================================
         # VERIFICATION LOGIC: Compare extracted educational data with personal data
         # ============================================================================
-        logger.info(f"[EDU+LLM SAVE] [STEP 6] Starting verification comparison...")
+        logger.debug("[EDU+LLM SAVE] [STEP 6] Starting verification comparison")
 
-        cursor.execute("""
-            SELECT personal_extracted_name, personal_extracted_dob
-            FROM workers
-            WHERE worker_id = ?
-        """, (worker_id,))
+        cursor.execute(SQL_SELECT_WORKER_PERSONAL_EXTRACTED, (worker_id,))
 
         personal_row = cursor.fetchone()
 
         if personal_row:
-            personal_extracted_name = personal_row[0]
-            personal_extracted_dob = personal_row[1]
+            personal_extracted_name = personal_row["personal_extracted_name"]
+            personal_extracted_dob = personal_row["personal_extracted_dob"]
 
-            logger.info(f"[EDU+LLM SAVE] [VERIFICATION] Personal data retrieved:")
-            logger.info(f"[EDU+LLM SAVE]                 personal_name={repr(personal_extracted_name)}")
-            logger.info(f"[EDU+LLM SAVE]                 personal_dob={repr(personal_extracted_dob)}")
-            logger.info(f"[EDU+LLM SAVE] [VERIFICATION] Educational data to compare:")
-            logger.info(f"[EDU+LLM SAVE]                 edu_name={repr(extracted_name)}")
-            logger.info(f"[EDU+LLM SAVE]                 edu_dob={repr(extracted_dob)}")
+            logger.debug("[EDU+LLM SAVE] [VERIFICATION] personal_name=%r, personal_dob=%r, edu_name=%r, edu_dob=%r",
+                         personal_extracted_name, personal_extracted_dob, extracted_name, extracted_dob)
 
             # Verify only if both personal and educational data exist
             if personal_extracted_name and personal_extracted_dob and extracted_name and extracted_dob:
-                # Normalize for comparison (case-insensitive, strip whitespace)
+                # Normalize for comparison (case-insensitive, strip whitespace); the educational
+                # values were already converted to str and stripped above
                 personal_name_normalized = personal_extracted_name.lower().strip()
-                edu_name_normalized = extracted_name.lower().strip()
+                edu_name_normalized = extracted_name.lower()
                 personal_dob_normalized = str(personal_extracted_dob).strip()
-                edu_dob_normalized = str(extracted_dob).strip()
-
-                logger.info(f"[EDU+LLM SAVE] [VERIFICATION] Normalized comparison:")
-                logger.info(f"[EDU+LLM SAVE]                 personal_name_normalized={repr(personal_name_normalized)}")
-                logger.info(f"[EDU+LLM SAVE]                 edu_name_normalized={repr(edu_name_normalized)}")
-                logger.info(f"[EDU+LLM SAVE]                 personal_dob_normalized={repr(personal_dob_normalized)}")
-                logger.info(f"[EDU+LLM SAVE]                 edu_dob_normalized={repr(edu_dob_normalized)}")
+                edu_dob_normalized = extracted_dob
 
                 # Check if they match
                 name_match = personal_name_normalized == edu_name_normalized
                 dob_match = personal_dob_normalized == edu_dob_normalized
 
-                logger.info(
-                    f"[EDU+LLM SAVE] [VERIFICATION] Match results: name_match={name_match}, dob_match={dob_match}")
+                logger.debug("[EDU+LLM SAVE] [VERIFICATION] Normalized: personal_name=%r, edu_name=%r, "
+                             "personal_dob=%r, edu_dob=%r -> name_match=%s, dob_match=%s",
+                             personal_name_normalized, edu_name_normalized, personal_dob_normalized,
+                             edu_dob_normalized, name_match, dob_match)
 
                 if name_match and dob_match:
                     # VERIFIED
-                    cursor.execute("""
-                        UPDATE educational_documents
-                        SET verification_status = 'VERIFIED'
-                        WHERE worker_id = ?
-                    """, (worker_id,))
-
-                    cursor.execute("""
-                        UPDATE workers
-                        SET verification_status = 'VERIFIED'
-                        WHERE worker_id = ?
-                    """, (worker_id,))
-
-                    conn.commit()
-                    logger.info(f"[EDU+LLM SAVE] ✓ VERIFICATION PASSED for worker {worker_id}: All data matches!")
+                    cursor.execute(SQL_MARK_EDUCATIONAL_DOCUMENTS_VERIFIED, (worker_id,))
+                    cursor.execute(SQL_SET_WORKER_VERIFICATION_STATUS, ('VERIFIED', worker_id))
+                    logger.info("[EDU+LLM SAVE] ✓ VERIFICATION PASSED for worker %s: All data matches!", worker_id)
 
                 else:
                     # MISMATCH
                     mismatch_details = f"Name mismatch: '{extracted_name}' vs '{personal_extracted_name}' | DOB mismatch: '{extracted_dob}' vs '{personal_extracted_dob}'"
 
-                    cursor.execute("""
-                        UPDATE educational_documents
-                        SET verification_status = 'MISMATCH',
-                            verification_errors = ?
-                        WHERE worker_id = ?
-                    """, (mismatch_details, worker_id))
-
-                    cursor.execute("""
-                        UPDATE workers
-                        SET verification_status = 'MISMATCH'
-                        WHERE worker_id = ?
-                    """, (worker_id,))
-
-                    conn.commit()
-                    logger.warning(f"[EDU+LLM SAVE] ✗ VERIFICATION FAILED for worker {worker_id}: {mismatch_details}")
+                    cursor.execute(SQL_MARK_EDUCATIONAL_DOCUMENTS_MISMATCH, (mismatch_details, worker_id))
+                    cursor.execute(SQL_SET_WORKER_VERIFICATION_STATUS, ('MISMATCH', worker_id))
+                    logger.warning("[EDU+LLM SAVE] ✗ VERIFICATION FAILED for worker %s: %s",
+                                   worker_id, mismatch_details)
 
             else:
                 # Cannot verify yet - missing data
-                logger.info(f"[EDU+LLM SAVE] [VERIFICATION] Cannot verify - missing data:")
-                logger.info(f"[EDU+LLM SAVE]                 personal_name exists: {bool(personal_extracted_name)}")
-                logger.info(f"[EDU+LLM SAVE]                 personal_dob exists: {bool(personal_extracted_dob)}")
-                logger.info(f"[EDU+LLM SAVE]                 edu_name exists: {bool(extracted_name)}")
-                logger.info(f"[EDU+LLM SAVE]                 edu_dob exists: {bool(extracted_dob)}")
-                logger.info(f"[EDU+LLM SAVE] [VERIFICATION] Keeping status as 'pending' until all data available")
+                logger.info("[EDU+LLM SAVE] [VERIFICATION] Cannot verify yet (personal_name=%s, personal_dob=%s, "
+                            "edu_name=%s, edu_dob=%s) - keeping status 'pending'",
+                            bool(personal_extracted_name), bool(personal_extracted_dob),
+                            bool(extracted_name), bool(extracted_dob))
         else:
-            logger.info(
-                f"[EDU+LLM SAVE] [VERIFICATION] No personal data found for worker {worker_id} - cannot verify yet")
+            logger.info("[EDU+LLM SAVE] [VERIFICATION] No personal data found for worker %s - cannot verify yet",
+                        worker_id)
+
+        # Save and verification outcome land in one commit
+        conn.commit()
 
-        logger.info(f"[EDU+LLM SAVE] ✓ Educational document with LLM data saved successfully for {worker_id}")
-        logger.info(f"[EDU+LLM SAVE] Name saved: {bool(extracted_name)}, DOB saved: {bool(extracted_dob)}")
+        logger.info("[EDU+LLM SAVE] ✓ Educational document saved for %s (name saved: %s, DOB saved: %s)",
+                    worker_id, bool(extracted_name), bool(extracted_dob))
         return True
     except Exception as e:
         logger.error(f"[EDU+LLM SAVE] ✗ Error saving educational document for {worker_id}: {str(e)}", exc_info=True)
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
 
-def update_educational_document_verification(doc_id: int, status: str, errors: dict = None) -> bool:
+@_db_op(False, "updating educational document verification for")
+def update_educational_document_verification(cursor, doc_id: int, status: str, errors: dict = None) -> bool:
     """
     Update verification status for an educational document.
 
@@ -1852,32 +2095,17 @@ def update_educational_document_verification(doc_id: int, status: str, errors: d
     Returns:
         True if successful, False otherwise
     """
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    errors_json = _dumps(errors) if errors else None
 
-        errors_json = json.dumps(errors, ensure_ascii=False) if errors else None
+    cursor.execute(SQL_UPDATE_EDUCATIONAL_DOCUMENT_VERIFICATION, (status, errors_json, doc_id))
+    cursor.connection.commit()
 
-        cursor.execute("""
-        UPDATE educational_documents 
-        SET verification_status = ?, verification_errors = ?
-        WHERE id = ?
-        """, (status, errors_json, doc_id))
-        conn.commit()
-
-        if cursor.rowcount == 0:
-            logger.error(f"UPDATE educational_documents matched 0 rows for doc_id={doc_id}")
-            return False
-
-        logger.info(f"✓ Updated verification status for educational doc {doc_id}: status={status}")
-        return True
-    except Exception as e:
-        logger.error(f"Error updating educational document verification for {doc_id}: {str(e)}", exc_info=True)
+    if cursor.rowcount == 0:
+        logger.error(f"UPDATE educational_documents matched 0 rows for doc_id={doc_id}")
         return False
-    finally:
-        if conn is not None:
-            conn.close()
+
+    logger.info("✓ Updated verification status for educational doc %s: status=%s", doc_id, status)
+    return True
 
 
 def get_worker_extraction_status(worker_id: str) -> dict:
@@ -1912,36 +2140,21 @@ def get_worker_extraction_status(worker_id: str) -> dict:
         verification_status = 'pending'
 
         if row:
-            personal_name = row[0]
-            personal_dob = row[1]
-            verification_status = row[2] or 'pending'
+            personal_name = row["personal_extracted_name"]
+            personal_dob = row["personal_extracted_dob"]
+            verification_status = row["verification_status"] or 'pending'
             personal_extracted = bool(personal_name and personal_dob)
 
-        logger.info(
-            f"[EXTRACTION_STATUS] Personal extracted: {personal_extracted}, name='{personal_name}', dob='{personal_dob}'")
-
-        # Check educational extraction - COUNT ONLY DOCUMENTS WITH ACTUAL DATA (qualification NOT NULL)
-        # This filters out cleared/deleted records that still exist in table with NULL fields
-        cursor.execute("""
-        SELECT COUNT(*) 
-        FROM educational_documents 
-        WHERE worker_id = ? AND qualification IS NOT NULL
-        """, (worker_id,))
-        row = cursor.fetchone()
-        edu_count = row[0] if row else 0
-
-        logger.info(f"[EXTRACTION_STATUS] Educational documents saved: {edu_count}")
+        logger.debug("[EXTRACTION_STATUS] Personal extracted: %s, name=%r, dob=%r",
+                     personal_extracted, personal_name, personal_dob)
 
-        # Also check how many have extracted name for detailed logging
-        cursor.execute("""
-        SELECT COUNT(*) 
-        FROM educational_documents 
-        WHERE worker_id = ? AND extracted_name IS NOT NULL AND extracted_name != '' AND qualification IS NOT NULL
-        """, (worker_id,))
-        row = cursor.fetchone()
-        edu_with_name = row[0] if row else 0
+        # Count only documents with actual data (qualification NOT NULL) - cleared/deleted records
+        # can still exist with NULL fields. The with-name count (for logging) comes from the same scan.
+        cursor.execute(SQL_COUNT_EDUCATIONAL_DOCUMENTS_EXTRACTED, (worker_id,))
+        edu_count, edu_with_name = cursor.fetchone()
 
-        logger.info(f"[EXTRACTION_STATUS] Educational documents with extracted name: {edu_with_name}")
+        logger.debug("[EXTRACTION_STATUS] Educational documents saved: %d (with extracted name: %d)",
+                     edu_count, edu_with_name)
 
         result = {
             "personal_extracted": personal_extracted,
@@ -1951,7 +2164,7 @@ def get_worker_extraction_status(worker_id: str) -> dict:
             "verification_status": verification_status
         }
 
-        logger.info(f"[EXTRACTION_STATUS] Final status for {worker_id}: {result}")
+        logger.debug("[EXTRACTION_STATUS] Final status for %s: %s", worker_id, result)
         return result
     except Exception as e:
         logger.error(f"Error getting extraction status for {worker_id}: {str(e)}", exc_info=True)
@@ -1988,26 +2201,8 @@ def get_educational_documents_for_verification(worker_id: str) -> list:
         cursor = conn.cursor()
         # Only return documents with actual data (qualification not NULL)
         # This filters out cleared records
-        cursor.execute("""
-        SELECT id, qualification, extracted_name, extracted_dob, school_name, board, verification_status
-        FROM educational_documents 
-        WHERE worker_id = ? 
-        AND qualification IS NOT NULL
-        ORDER BY id
-        """, (worker_id,))
-        rows = cursor.fetchall()
-
-        documents = []
-        for row in rows:
-            documents.append({
-                "id": row[0],
-                "qualification": row[1],
-                "extracted_name": row[2],
-                "extracted_dob": row[3],
-                "school_name": row[4],
-                "board": row[5],
-                "verification_status": row[6] or 'pending'
-            })
+        cursor.execute(SQL_SELECT_EDUCATIONAL_DOCUMENTS_FOR_VERIFICATION, (worker_id,))
+        documents = [dict(zip(_EDUCATIONAL_VERIFICATION_COLS, row)) for row in cursor]
 
         logger.info(f"Retrieved {len(documents)} educational documents for verification (worker: {worker_id})")
         return documents
@@ -2031,51 +2226,39 @@ def delete_personal_data(worker_id: str) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Verify worker exists
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
-            logger.error(f"Cannot delete personal data: Worker {worker_id} does not exist")
-            return False
+        # Take the write lock up front: every clear/delete below is one transaction
+        cursor.execute("BEGIN IMMEDIATE")
 
-        logger.info(f"[DELETE_PERSONAL] Starting personal data deletion for worker {worker_id}")
+        logger.info("[DELETE_PERSONAL] Starting personal data deletion for worker %s", worker_id)
 
         # Clear personal fields in workers table (including extracted fields)
-        cursor.execute("""
-        UPDATE workers 
-        SET name = NULL, 
-            dob = NULL, 
-            address = NULL, 
-            personal_document_path = NULL,
-            personal_extracted_name = NULL,
-            personal_extracted_dob = NULL,
-            verification_status = NULL
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(f"[DELETE_PERSONAL] Cleared personal fields from workers table (rows affected: {cursor.rowcount})")
+        cursor.execute(SQL_CLEAR_WORKER_PERSONAL_DATA, (worker_id,))
+        logger.debug("[DELETE_PERSONAL] Cleared personal fields from workers table (rows affected: %d)",
+                     cursor.rowcount)
+        # The workers UPDATE doubles as the existence check (no separate probe)
+        if cursor.rowcount == 0:
+            logger.error(f"Cannot delete personal data: Worker {worker_id} does not exist")
+            conn.rollback()
+            return False
 
         # Delete work experience records
-        cursor.execute("DELETE FROM work_experience WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_PERSONAL] Deleted {cursor.rowcount} work experience record(s)")
+        cursor.execute(SQL_DELETE_WORK_EXPERIENCE_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_PERSONAL] Deleted %d work experience record(s)", cursor.rowcount)
 
         # Delete voice sessions
-        cursor.execute("DELETE FROM voice_sessions WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_PERSONAL] Deleted {cursor.rowcount} voice session(s)")
+        cursor.execute(SQL_DELETE_VOICE_SESSIONS_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_PERSONAL] Deleted %d voice session(s)", cursor.rowcount)
 
         # Delete experience sessions
-        cursor.execute("DELETE FROM experience_sessions WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_PERSONAL] Deleted {cursor.rowcount} experience session(s)")
+        cursor.execute(SQL_DELETE_EXPERIENCE_SESSIONS_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_PERSONAL] Deleted %d experience session(s)", cursor.rowcount)
 
         # Delete from pending_ocr_results (personal data part)
-        cursor.execute("""
-        UPDATE pending_ocr_results 
-        SET personal_document_path = NULL, 
-            personal_data_json = NULL 
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(f"[DELETE_PERSONAL] Cleared personal OCR results")
+        cursor.execute(SQL_CLEAR_PENDING_OCR_PERSONAL, (worker_id,))
+        logger.debug("[DELETE_PERSONAL] Cleared personal OCR results")
 
         conn.commit()
-        logger.info(f"[DELETE_PERSONAL] ✓ Personal data deletion completed for worker {worker_id}")
+        logger.info("[DELETE_PERSONAL] ✓ Personal data deletion completed for worker %s", worker_id)
         return True
 
     except Exception as e:
@@ -2084,6 +2267,7 @@ def delete_personal_data(worker_id: str) -> bool:
             conn.rollback()
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -2099,46 +2283,35 @@ def delete_educational_data(worker_id: str) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Verify worker exists
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
-            logger.error(f"Cannot delete educational data: Worker {worker_id} does not exist")
-            return False
+        # Take the write lock up front: every clear/delete below is one transaction
+        cursor.execute("BEGIN IMMEDIATE")
 
-        logger.info(f"[DELETE_EDUCATIONAL] Starting educational data deletion for worker {worker_id}")
+        logger.info("[DELETE_EDUCATIONAL] Starting educational data deletion for worker %s", worker_id)
 
         # Clear educational fields in workers table
         # Also reset verification status to 'pending' for clean slate
-        cursor.execute("""
-        UPDATE workers 
-        SET educational_document_paths = NULL,
-            verification_status = 'pending'
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(
-            f"[DELETE_EDUCATIONAL] Cleared educational fields from workers table (rows affected: {cursor.rowcount})")
+        cursor.execute(SQL_CLEAR_WORKER_EDUCATIONAL_DATA, (worker_id,))
+        logger.debug("[DELETE_EDUCATIONAL] Cleared educational fields from workers table (rows affected: %d)",
+                     cursor.rowcount)
+        # The workers UPDATE doubles as the existence check (no separate probe)
+        if cursor.rowcount == 0:
+            logger.error(f"Cannot delete educational data: Worker {worker_id} does not exist")
+            conn.rollback()
+            return False
 
         # Delete all educational document records for this worker
         # CRITICAL: Actually DELETE rows, don't just NULL them
         # This prevents old records from interfering with count comparisons and verification logic
-        cursor.execute("""
-            DELETE FROM educational_documents
-            WHERE worker_id = ?
-        """, (worker_id,))
+        cursor.execute(SQL_DELETE_EDUCATIONAL_DOCUMENTS_BY_WORKER, (worker_id,))
 
-        logger.info(f"[DELETE_EDUCATIONAL] Deleted {cursor.rowcount} educational document record(s)")
+        logger.debug("[DELETE_EDUCATIONAL] Deleted %d educational document record(s)", cursor.rowcount)
 
         # Clear from pending_ocr_results (educational data part)
-        cursor.execute("""
-        UPDATE pending_ocr_results 
-        SET educational_document_path = NULL, 
-            education_data_json = NULL 
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(f"[DELETE_EDUCATIONAL] Cleared educational OCR results")
+        cursor.execute(SQL_CLEAR_PENDING_OCR_EDUCATIONAL, (worker_id,))
+        logger.debug("[DELETE_EDUCATIONAL] Cleared educational OCR results")
 
         conn.commit()
-        logger.info(f"[DELETE_EDUCATIONAL] ✓ Educational data deletion completed for worker {worker_id}")
+        logger.info("[DELETE_EDUCATIONAL] ✓ Educational data deletion completed for worker %s", worker_id)
         return True
 
     except Exception as e:
@@ -2147,6 +2320,7 @@ def delete_educational_data(worker_id: str) -> bool:
             conn.rollback()
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
 
@@ -2164,60 +2338,46 @@ def delete_all_data(worker_id: str) -> bool:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # Verify worker exists
-        cursor.execute("SELECT worker_id FROM workers WHERE worker_id = ?", (worker_id,))
-        if not cursor.fetchone():
-            logger.error(f"Cannot delete all data: Worker {worker_id} does not exist")
-            return False
+        # Take the write lock up front: every clear/delete below is one transaction
+        cursor.execute("BEGIN IMMEDIATE")
 
-        logger.info(f"[DELETE_ALL] Starting complete data deletion for worker {worker_id}")
+        logger.info("[DELETE_ALL] Starting complete data deletion for worker %s", worker_id)
 
         # Clear ALL fields except worker_id and mobile_number
-        cursor.execute("""
-        UPDATE workers 
-        SET name = NULL, 
-            dob = NULL, 
-            address = NULL, 
-            personal_document_path = NULL,
-            personal_extracted_name = NULL,
-            personal_extracted_dob = NULL,
-            educational_document_paths = NULL,
-            video_url = NULL
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(f"[DELETE_ALL] Cleared all fields from workers table (rows affected: {cursor.rowcount})")
+        cursor.execute(SQL_CLEAR_WORKER_ALL_DATA, (worker_id,))
+        logger.debug("[DELETE_ALL] Cleared all fields from workers table (rows affected: %d)", cursor.rowcount)
+        # The workers UPDATE doubles as the existence check (no separate probe)
+        if cursor.rowcount == 0:
+            logger.error(f"Cannot delete all data: Worker {worker_id} does not exist")
+            conn.rollback()
+            return False
 
         # Delete all educational document records for this worker
-        cursor.execute("DELETE FROM educational_documents WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_ALL] Deleted {cursor.rowcount} educational document(s)")
+        cursor.execute(SQL_DELETE_EDUCATIONAL_DOCUMENTS_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_ALL] Deleted %d educational document(s)", cursor.rowcount)
 
         # Delete work experience
-        cursor.execute("DELETE FROM work_experience WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_ALL] Deleted {cursor.rowcount} work experience record(s)")
+        cursor.execute(SQL_DELETE_WORK_EXPERIENCE_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_ALL] Deleted %d work experience record(s)", cursor.rowcount)
 
         # Delete voice sessions
-        cursor.execute("DELETE FROM voice_sessions WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_ALL] Deleted {cursor.rowcount} voice session(s)")
+        cursor.execute(SQL_DELETE_VOICE_SESSIONS_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_ALL] Deleted %d voice session(s)", cursor.rowcount)
 
         # Delete experience sessions
-        cursor.execute("DELETE FROM experience_sessions WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_ALL] Deleted {cursor.rowcount} experience session(s)")
+        cursor.execute(SQL_DELETE_EXPERIENCE_SESSIONS_BY_WORKER, (worker_id,))
+        logger.debug("[DELETE_ALL] Deleted %d experience session(s)", cursor.rowcount)
 
         # Delete pending OCR results
-        cursor.execute("DELETE FROM pending_ocr_results WHERE worker_id = ?", (worker_id,))
-        logger.info(f"[DELETE_ALL] Deleted {cursor.rowcount} pending OCR result(s)")
+        cursor.execute(SQL_DELETE_PENDING_OCR_RESULTS, (worker_id,))
+        logger.debug("[DELETE_ALL] Deleted %d pending OCR result(s)", cursor.rowcount)
 
         # Reset CV status
-        cursor.execute("""
-        UPDATE cv_status 
-        SET has_cv = 0, 
-            cv_generated_at = NULL 
-        WHERE worker_id = ?
-        """, (worker_id,))
-        logger.info(f"[DELETE_ALL] Reset CV status")
+        cursor.execute(SQL_RESET_CV_STATUS, (worker_id,))
+        logger.debug("[DELETE_ALL] Reset CV status")
 
         conn.commit()
-        logger.info(f"[DELETE_ALL] ✓ Complete data deletion finished for worker {worker_id}")
+        logger.info("[DELETE_ALL] ✓ Complete data deletion finished for worker %s", worker_id)
         return True
 
     except Exception as e:
@@ -2226,5 +2386,6 @@ def delete_all_data(worker_id: str) -> bool:
             conn.rollback()
         return False
     finally:
+        _invalidate_worker(worker_id)
         if conn is not None:
             conn.close()
@@ -540,9 +540,14 @@
 #     init_db()
 #     print("Database initialized successfully!")
 
+import atexit
 import sqlite3
 import os
-import time
+import queue
+import re
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 import logging
 
@@ -560,27 +565,405 @@ except NameError:
 _initializing = False
 logger.info(f"Database path: {DB_PATH}")
 
+# Mobile number embedded in a voice call_id ("MZ..._{mobile}"): the text after the last "_".
+# Indexed as an expression; queries must use this exact text for SQLite to match the index.
+VOICE_SESSION_CALL_MOBILE_EXPR = "replace(call_id, rtrim(call_id, replace(call_id, '_', '')), '')"
 
-def get_db_connection(timeout: float = 30.0):
-    """Get SQLite database connection. Uses timeout to wait for lock; WAL mode reduces locking."""
-    try:
-        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(DB_PATH), timeout=timeout)
-        conn.row_factory = sqlite3.Row
+# Max idle connections kept for reuse; connections released beyond this are closed
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+
+# Stored in PRAGMA user_version once init_db has applied the schema; init_db skips the DDL when the
+# database is already at this version. Bump it whenever init_db's tables, columns or indexes change.
+SCHEMA_VERSION = 1
+
+
+def _convert_boolean(value: bytes) -> bool:
+    """Decode a BOOLEAN column (stored as 0/1) so rows come back with real bools."""
+    return value not in (b"0", b"")
+
+
+# Pooled connections use PARSE_DECLTYPES: BOOLEAN columns (exp_ready, has_cv) decode to bool.
+# TIMESTAMP columns are kept as the stored text - the API returns them as-is.
+sqlite3.register_converter("BOOLEAN", _convert_boolean)
+sqlite3.register_converter("TIMESTAMP", bytes.decode)
+
+
+def _configure_connection(conn: sqlite3.Connection):
+    """Apply the per-connection PRAGMAs. Raises sqlite3.OperationalError if the database is locked."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")  # 30 seconds in ms
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL: durable on checkpoint, no fsync per commit
+    conn.execute("PRAGMA wal_autocheckpoint=1000")  # checkpoint every ~1000 pages (4 MB) of WAL
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache (allocated lazily)
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that returns itself to the pool on close() instead of closing.
+    Callers keep the usual get_db_connection() ... finally: conn.close() pattern.
+    """
+
+    _pool = None
+    _closed = False
+
+    def close(self):
+        pool = self._pool
+        self._pool = None
+        if pool is None:
+            return  # already released (double close)
+        pool.release(self)
+
+    def close_connection(self):
+        """Really close the underlying SQLite connection, letting SQLite refresh planner stats first."""
+        self._pool = None
+        self._closed = True
         try:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA busy_timeout=30000")  # 30 seconds in ms
+            # Cheap no-op unless this connection's queries hit tables whose stats are stale
+            self.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable SQLite connections. PRAGMAs are applied once per connection.
+    Each thread keeps the connection it last released and gets it back on its next acquire,
+    so a threadpool worker reuses one connection across requests without touching the shared queue.
+    Parked and queued connections share the max_idle budget (DB_POOL_SIZE); connections released past it are closed.
+    """
+
+    def __init__(self, db_path: Path, max_idle: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self._max_idle = max_idle
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._local = threading.local()
+        # Connections parked on a thread, tracked weakly so they count against max_idle and close_all() can reach them
+        self._parked = weakref.WeakSet()
+        self._parked_lock = threading.Lock()
+
+    def _connect(self, timeout: float) -> PooledConnection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # check_same_thread=False: a connection is checked out by different threads over time (never concurrently)
+        conn = sqlite3.connect(str(self.db_path), timeout=timeout, factory=PooledConnection,
+                               check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES,
+                               cached_statements=256)
+        try:
+            _configure_connection(conn)
         except sqlite3.OperationalError:
             pass  # DB may be locked by another process; connection still usable with timeout
-        logger.debug(f"Database connection established: {DB_PATH}")
+        logger.debug(f"Database connection established: {self.db_path}")
+        return conn
+
+    def acquire(self, timeout: float = 30.0) -> PooledConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None  # nested acquires on this thread fall through to the shared queue
+            with self._parked_lock:
+                self._parked.discard(conn)
+        if conn is None or conn._closed:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect(timeout)
+        conn.row_factory = sqlite3.Row
+        conn._pool = self
         return conn
+
+    def release(self, conn: PooledConnection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # discard anything the caller did not commit
+            with self._parked_lock:
+                keep = len(self._parked) + self._idle.qsize() < self._max_idle
+                if keep and getattr(self._local, "conn", None) is None:
+                    self._local.conn = conn
+                    self._parked.add(conn)
+                elif keep:
+                    self._idle.put_nowait(conn)
+            if not keep:
+                conn.close_connection()
+        except (queue.Full, sqlite3.Error):
+            conn.close_connection()
+
+    def close_all(self):
+        """Close all idle and thread-parked connections (on shutdown). A closed parked connection is replaced on next use."""
+        with self._parked_lock:
+            parked = list(self._parked)
+            self._parked.clear()
+        for conn in parked:
+            conn.close_connection()
+        while True:
+            try:
+                self._idle.get_nowait().close_connection()
+            except queue.Empty:
+                return
+
+
+_pool = ConnectionPool(DB_PATH)
+atexit.register(lambda: _pool.close_all())
+
+
+def get_db_connection(timeout: float = 30.0):
+    """
+    Get SQLite database connection from the process-wide pool. Uses timeout to wait for lock; WAL mode reduces locking.
+    conn.close() returns the connection to the pool.
+    """
+    try:
+        return _pool.acquire(timeout)
     except Exception as e:
         logger.error(f"Failed to connect to database: {str(e)}", exc_info=True)
         raise
 
 
+@contextmanager
+def borrow_conn(timeout: float = 30.0):
+    """Context-manager form of get_db_connection(): the connection goes back to the pool on exit."""
+    conn = get_db_connection(timeout)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+# Tables and triggers, created in one executescript() by init_db. Columns added after a table first
+# shipped are listed in _ADDED_COLUMNS instead, so existing databases pick them up too.
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    mobile_number TEXT NOT NULL,
+    name TEXT,
+    dob TEXT,
+    address TEXT,
+    personal_document_path TEXT,
+    educational_document_paths TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS work_experience (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    worker_id TEXT NOT NULL,
+    primary_skill TEXT,
+    experience_years INTEGER,
+    skills TEXT,
+    preferred_location TEXT,
+    current_location TEXT,
+    availability TEXT,
+    workplaces TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+CREATE TABLE IF NOT EXISTS voice_sessions (
+    call_id TEXT PRIMARY KEY,
+    worker_id TEXT,
+    phone_number TEXT,
+    status TEXT DEFAULT 'initiated',
+    current_step INTEGER DEFAULT 0,
+    responses_json TEXT,
+    transcript TEXT,
+    experience_json TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+-- Job listings
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT,
+    required_skills TEXT,
+    location TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS educational_documents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    worker_id TEXT NOT NULL,
+    document_type TEXT,
+    qualification TEXT,
+    board TEXT,
+    stream TEXT,
+    year_of_passing TEXT,
+    school_name TEXT,
+    marks_type TEXT,
+    marks TEXT,
+    percentage REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+-- Experience conversation sessions
+CREATE TABLE IF NOT EXISTS experience_sessions (
+    session_id TEXT PRIMARY KEY,
+    worker_id TEXT NOT NULL,
+    current_question INTEGER DEFAULT 0,
+    raw_conversation TEXT,
+    structured_data TEXT,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+-- Pending OCR results (step-by-step review workflow)
+CREATE TABLE IF NOT EXISTS pending_ocr_results (
+    worker_id TEXT PRIMARY KEY,
+    personal_document_path TEXT,
+    educational_document_path TEXT,
+    personal_data_json TEXT,
+    education_data_json TEXT,
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+-- CV generation status per worker
+CREATE TABLE IF NOT EXISTS cv_status (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    worker_id TEXT UNIQUE NOT NULL,
+    has_cv BOOLEAN DEFAULT 0,
+    cv_generated_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+);
+
+-- Keep cv_status.updated_at current
+CREATE TRIGGER IF NOT EXISTS update_cv_status_timestamp
+AFTER UPDATE ON cv_status
+BEGIN
+    UPDATE cv_status SET updated_at = CURRENT_TIMESTAMP WHERE worker_id = NEW.worker_id;
+END;
+
+-- Vector DB writes that failed, retried in the background with backoff
+CREATE TABLE IF NOT EXISTS pending_embeddings (
+    doc_id TEXT PRIMARY KEY,
+    document TEXT NOT NULL,
+    metadata_json TEXT,
+    attempts INTEGER DEFAULT 0,
+    next_attempt_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_pending_embeddings_due ON pending_embeddings(next_attempt_at);
+"""
+
+# Columns added after their table first shipped; init_db adds whichever an older database lacks.
+_ADDED_COLUMNS = (
+    ("workers", (
+        # Document paths
+        ("personal_document_path", "TEXT"),
+        ("educational_document_paths", "TEXT"),  # JSON array of paths
+        ("video_url", "TEXT"),  # Cloudinary (or other) URL for video resume
+        # Verification columns for document matching
+        ("verification_status", "TEXT DEFAULT 'pending'"),
+        ("verified_at", "TIMESTAMP DEFAULT NULL"),
+        ("verification_errors", "TEXT DEFAULT NULL"),
+        ("personal_extracted_name", "TEXT DEFAULT NULL"),
+        ("personal_extracted_dob", "TEXT DEFAULT NULL"),
+    )),
+    ("work_experience", (
+        ("current_location", "TEXT"),
+        ("availability", "TEXT"),
+        ("workplaces", "TEXT"),  # JSON array of workplace objects
+        ("total_experience_duration", "INTEGER"),  # Total duration in months across all workplaces
+        ("experience_years_float", "REAL"),  # Total experience in years as float (e.g., 5.5)
+    )),
+    ("voice_sessions", (
+        ("responses_json", "TEXT"),
+        ("phone_number", "TEXT"),
+        ("transcript", "TEXT"),
+        ("experience_json", "TEXT"),
+        ("exp_ready", "BOOLEAN DEFAULT 0"),  # Flag to track when experience extraction is complete and ready for review
+    )),
+    ("educational_documents", (
+        # Extraction and verification
+        ("raw_ocr_text", "TEXT DEFAULT NULL"),
+        ("llm_extracted_data", "TEXT DEFAULT NULL"),
+        ("extracted_name", "TEXT DEFAULT NULL"),
+        ("extracted_dob", "TEXT DEFAULT NULL"),
+        ("verification_status", "TEXT DEFAULT 'pending'"),
+        ("verification_errors", "TEXT DEFAULT NULL"),
+    )),
+)
+
+# Secondary indexes, created after _ADDED_COLUMNS.
+# voice_sessions.call_id (PRIMARY KEY) and cv_status.worker_id (UNIQUE) already have implicit indexes.
+_INDEX_DDL = tuple(
+    f"CREATE INDEX IF NOT EXISTS {index_name} ON {index_def}"
+    for index_name, index_def in (
+        # Verification queries
+        ("idx_workers_verification_status", "workers(verification_status)"),
+        ("idx_educational_documents_verification", "educational_documents(worker_id, verification_status)"),
+        # Per-worker / per-phone lookups
+        ("idx_voice_sessions_worker", "voice_sessions(worker_id, updated_at)"),
+        ("idx_voice_sessions_phone_created", "voice_sessions(phone_number, created_at)"),
+        ("idx_voice_sessions_call_mobile", f"voice_sessions({VOICE_SESSION_CALL_MOBILE_EXPR}, updated_at)"),
+        ("idx_experience_sessions_worker", "experience_sessions(worker_id, created_at)"),
+        # Partial indexes matching the WHERE of the "latest transcript" / "documents with data" reads
+        ("idx_voice_sessions_worker_transcript",
+         "voice_sessions(worker_id, updated_at) WHERE transcript IS NOT NULL AND transcript != ''"),
+        ("idx_voice_sessions_phone_transcript",
+         "voice_sessions(phone_number, updated_at) WHERE transcript IS NOT NULL AND transcript != ''"),
+        ("idx_educational_documents_worker_created",
+         "educational_documents(worker_id, created_at) WHERE qualification IS NOT NULL"),
+    )
+)
+
+
+# Table/column names are spliced into DDL text (identifiers cannot be bound as parameters)
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER_RE.fullmatch(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def _existing_columns(cursor, table: str) -> set:
+    """Column names of a table, read once from PRAGMA table_info."""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({_check_identifier(table)})")}
+
+
+def _add_missing_columns(cursor, table: str, columns):
+    """
+    ALTER TABLE ... ADD COLUMN for each (name, type) the table does not have yet (older databases).
+    Runs inside init_db's schema transaction, so all added columns are committed together.
+    """
+    existing = _existing_columns(cursor, table)
+    missing = [(_check_identifier(name), column_type) for name, column_type in columns if name not in existing]
+    for column_name, column_type in missing:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+        logger.info(f"Added column {column_name} to {table} table")
+
+
+def _ensure_planner_stats(cursor):
+    """Gather planner statistics once there is data to describe; later runs keep the existing sqlite_stat1."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    has_stats = cursor.fetchone() is not None
+    if has_stats:
+        cursor.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1")
+        has_stats = cursor.fetchone() is not None
+    if not has_stats:
+        cursor.execute("ANALYZE")
+        logger.info("Collected query planner statistics (ANALYZE)")
+
+
 def init_db():
-    """Initialize database schema. Retries on database is locked (e.g. multiple workers starting)."""
+    """
+    Initialize database schema. Lock waits (e.g. multiple workers starting) are left to SQLite's
+    busy handler: the connection timeout / busy_timeout block for up to 30s before failing.
+    The connection comes from the pool and goes back to it afterwards, so it stays open for the first
+    requests instead of the last close checkpointing and deleting -wal/-shm only for them to be
+    recreated; the pool closes it at exit.
+    """
     global _initializing
 
     if _initializing:
@@ -588,264 +971,60 @@ def init_db():
         return
 
     _initializing = True
-    max_attempts = 3
-    lock_wait_sec = 2
     conn = None
-    cursor = None
 
     try:
-        for attempt in range(1, max_attempts + 1):
-            try:
-                logger.info(f"Initializing database at {DB_PATH} (attempt {attempt}/{max_attempts})")
-                DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-                conn = sqlite3.connect(str(DB_PATH), timeout=30.0)
-                conn.row_factory = sqlite3.Row
-                try:
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    conn.execute("PRAGMA busy_timeout=30000")
-                except sqlite3.OperationalError as e:
-                    logger.warning(f"Could not set WAL/busy_timeout (database may be in use): {e}. Continuing.")
-                cursor = conn.cursor()
-                break
-            except sqlite3.OperationalError as e:
-                if conn is not None:
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-                    conn = None
-                if "locked" in str(e).lower() and attempt < max_attempts:
-                    logger.warning(f"Database locked (attempt {attempt}), waiting {lock_wait_sec}s before retry: {e}")
-                    time.sleep(lock_wait_sec)
-                else:
-                    raise
-
-        if conn is None or cursor is None:
-            raise RuntimeError("Failed to obtain database connection after retries")
-
-        # Workers table
-        logger.info("Creating workers table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS workers (
-            worker_id TEXT PRIMARY KEY,
-            mobile_number TEXT NOT NULL,
-            name TEXT,
-            dob TEXT,
-            address TEXT,
-            personal_document_path TEXT,
-            educational_document_paths TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        # Add document path columns for existing DBs safely
-        for column_name, column_type in [
-            ("personal_document_path", "TEXT"),
-            ("educational_document_paths", "TEXT"),  # JSON array of paths
-            ("video_url", "TEXT")  # Cloudinary (or other) URL for video resume
-        ]:
-            try:
-                cursor.execute(f"ALTER TABLE workers ADD COLUMN {column_name} {column_type}")
-                logger.info(f"Added column {column_name} to workers table")
-            except sqlite3.OperationalError:
-                pass  # column already exists
-
-        # Work experience table
-        logger.info("Creating work_experience table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS work_experience (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            worker_id TEXT NOT NULL,
-            primary_skill TEXT,
-            experience_years INTEGER,
-            skills TEXT,
-            preferred_location TEXT,
-            current_location TEXT,
-            availability TEXT,
-            workplaces TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
-        # Add new columns for comprehensive data (workplaces, current_location, availability)
-        for column_name, column_type in [
-            ("current_location", "TEXT"),
-            ("availability", "TEXT"),
-            ("workplaces", "TEXT"),  # JSON array of workplace objects
-            ("total_experience_duration", "INTEGER"),  # Total duration in months across all workplaces
-            ("experience_years_float", "REAL")  # Total experience in years as float (e.g., 5.5)
-        ]:
-            try:
-                cursor.execute(f"ALTER TABLE work_experience ADD COLUMN {column_name} {column_type}")
-                logger.info(f"Added column {column_name} to work_experience table")
-            except sqlite3.OperationalError:
-                pass  # column already exists
+        logger.info(f"Initializing database at {_pool.db_path}")
+        conn = get_db_connection()
+        cursor = conn.cursor()
 
-        # Voice call sessions table
-        logger.info("Creating voice_sessions table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS voice_sessions (
-            call_id TEXT PRIMARY KEY,
-            worker_id TEXT,
-            phone_number TEXT,
-            status TEXT DEFAULT 'initiated',
-            current_step INTEGER DEFAULT 0,
-            responses_json TEXT,
-            transcript TEXT,
-            experience_json TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
-        # Add columns for existing DBs safely
-        for column_name, column_type in [
-            ("responses_json", "TEXT"),
-            ("phone_number", "TEXT"),
-            ("transcript", "TEXT"),
-            ("experience_json", "TEXT"),
-            ("exp_ready", "BOOLEAN DEFAULT 0")  # Flag to track when experience extraction is complete and ready for review
-        ]:
-            try:
-                cursor.execute(f"ALTER TABLE voice_sessions ADD COLUMN {column_name} {column_type}")
-                logger.info(f"Added column {column_name} to voice_sessions table")
-            except sqlite3.OperationalError:
-                pass  # column already exists
+        current_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if current_version >= SCHEMA_VERSION:
+            logger.info(f"Database schema is up to date (version {current_version})")
+            _ensure_planner_stats(cursor)
+            conn.commit()
+            return
 
-        # Job listings table
-        logger.info("Creating jobs table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS jobs (
-            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            required_skills TEXT,
-            location TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        # All tables/triggers in one script. The BEGIN it opens stays open: the column and index
+        # migrations below run in the same transaction and everything lands in the single commit.
+        # IMMEDIATE takes the write lock up front, so workers starting together migrate one at a time
+        # and a later one sees the columns the first added instead of re-adding them.
+        logger.info("Creating tables...")
+        conn.executescript("BEGIN IMMEDIATE;\n" + _SCHEMA_SQL)
 
-        # Educational documents table
-        logger.info("Creating educational_documents table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS educational_documents (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            worker_id TEXT NOT NULL,
-            document_type TEXT,
-            qualification TEXT,
-            board TEXT,
-            stream TEXT,
-            year_of_passing TEXT,
-            school_name TEXT,
-            marks_type TEXT,
-            marks TEXT,
-            percentage REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
+        # Columns added after their table first shipped (existing databases), then the indexes -
+        # several of which cover those columns
+        logger.info("Adding missing columns...")
+        for table, columns in _ADDED_COLUMNS:
+            _add_missing_columns(cursor, table, columns)
 
-        # Experience conversation sessions table
-        logger.info("Creating experience_sessions table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS experience_sessions (
-            session_id TEXT PRIMARY KEY,
-            worker_id TEXT NOT NULL,
-            current_question INTEGER DEFAULT 0,
-            raw_conversation TEXT,
-            structured_data TEXT,
-            status TEXT DEFAULT 'active',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
+        logger.info("Creating indexes...")
+        for index_sql in _INDEX_DDL:
+            cursor.execute(index_sql)
 
-        # Pending OCR results table (for step-by-step review workflow)
-        logger.info("Creating pending_ocr_results table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS pending_ocr_results (
-            worker_id TEXT PRIMARY KEY,
-            personal_document_path TEXT,
-            educational_document_path TEXT,
-            personal_data_json TEXT,
-            education_data_json TEXT,
-            status TEXT DEFAULT 'pending',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
+        # Superseded by idx_voice_sessions_phone_created (get_voice_session_by_phone orders by created_at)
+        cursor.execute("DROP INDEX IF EXISTS idx_voice_sessions_phone")
 
-        # CV status table - tracks CV generation status for each worker
-        logger.info("Creating cv_status table...")
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS cv_status (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            worker_id TEXT UNIQUE NOT NULL,
-            has_cv BOOLEAN DEFAULT 0,
-            cv_generated_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-        )
-        """)
-        # Add trigger to auto-update updated_at
+        # One work_experience row per worker (save_experience upserts on worker_id).
+        # Older databases may hold several rows per worker - keep only the newest before indexing.
         cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS update_cv_status_timestamp 
-        AFTER UPDATE ON cv_status
-        BEGIN
-            UPDATE cv_status SET updated_at = CURRENT_TIMESTAMP WHERE worker_id = NEW.worker_id;
-        END
+        DELETE FROM work_experience
+        WHERE id NOT IN (SELECT MAX(id) FROM work_experience GROUP BY worker_id)
         """)
+        if cursor.rowcount:
+            logger.info(f"Removed {cursor.rowcount} superseded work_experience row(s)")
+        cursor.execute("DROP INDEX IF EXISTS idx_work_experience_worker")
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS uq_work_experience_worker ON work_experience(worker_id)")
 
-        # Add verification columns to workers table for document matching
-        logger.info("Adding verification columns to workers table...")
-        for column_name, column_type in [
-            ("verification_status", "TEXT DEFAULT 'pending'"),
-            ("verified_at", "TIMESTAMP DEFAULT NULL"),
-            ("verification_errors", "TEXT DEFAULT NULL"),
-            ("personal_extracted_name", "TEXT DEFAULT NULL"),
-            ("personal_extracted_dob", "TEXT DEFAULT NULL")
-        ]:
-            try:
-                cursor.execute(f"ALTER TABLE workers ADD COLUMN {column_name} {column_type}")
-                logger.info(f"Added column {column_name} to workers table")
-            except sqlite3.OperationalError:
-                pass  # column already exists
-
-        # Add extraction and verification columns to educational_documents table
-        logger.info("Adding verification columns to educational_documents table...")
-        for column_name, column_type in [
-            ("raw_ocr_text", "TEXT DEFAULT NULL"),
-            ("llm_extracted_data", "TEXT DEFAULT NULL"),
-            ("extracted_name", "TEXT DEFAULT NULL"),
-            ("extracted_dob", "TEXT DEFAULT NULL"),
-            ("verification_status", "TEXT DEFAULT 'pending'"),
-            ("verification_errors", "TEXT DEFAULT NULL")
-        ]:
-            try:
-                cursor.execute(f"ALTER TABLE educational_documents ADD COLUMN {column_name} {column_type}")
-                logger.info(f"Added column {column_name} to educational_documents table")
-            except sqlite3.OperationalError:
-                pass  # column already exists
-
-        # Create indexes for faster verification queries
-        logger.info("Creating verification indexes...")
-        try:
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_workers_verification_status ON workers(verification_status)")
-            logger.info("Created index idx_workers_verification_status")
-        except sqlite3.OperationalError:
-            pass  # index already exists
-
-        try:
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_educational_documents_verification ON educational_documents(worker_id, verification_status)")
-            logger.info("Created index idx_educational_documents_verification")
-        except sqlite3.OperationalError:
-            pass  # index already exists
+        _ensure_planner_stats(cursor)
 
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
         logger.info("Database initialized successfully!")
     except Exception as e:
+        if isinstance(e, sqlite3.OperationalError) and "locked" in str(e).lower():
+            logger.error(f"Database still locked after waiting 30s, giving up on initialization: {e}")
+            raise
         logger.error(f"Error initializing database: {str(e)}", exc_info=True)
         raise
     finally:
@@ -162,6 +162,7 @@
 #         log_level="info"
 #     )
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -173,13 +174,13 @@ if str(_project_root) not in sys.path:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 from dotenv import load_dotenv
 
-# Configure logging - SET TO DEBUG LEVEL BEFORE SETUP
+# Configure logging once for the whole app - LOG_LEVEL=DEBUG for verbose output (default INFO)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -210,11 +211,19 @@ except Exception as e:
     logger.error(f"Failed to initialize database: {e}", exc_info=True)
     raise
 
+# Serialize responses with orjson when it is installed (ORJSONResponse asserts on import otherwise)
+try:
+    import orjson  # noqa: F401
+    _default_response_class = ORJSONResponse
+except ImportError:
+    _default_response_class = JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title="Worker CV POC API",
     description="POC for worker data collection, CV generation, and job matching",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_default_response_class
 )
 
 # POC ONLY — NO AUTHENTICATION
@@ -293,6 +302,20 @@ async def startup_event():
     logger.info("[POC] Database: Ready")
     logger.info("[POC] CORS: Enabled for all origins")
 
+    # Sync (def) endpoints run in anyio's threadpool - raise the default 40-thread limit
+    import anyio.to_thread
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    logger.info("[POC] Threadpool: 200 worker threads for sync endpoints")
+
+    # Load the vector DB index once here instead of on the first request that needs it
+    from app.vector_db.chroma_client import get_vector_db
+    app.state.vector_db = get_vector_db()
+    logger.info(f"[POC] Vector DB: {len(app.state.vector_db.index)} documents loaded")
+
+    # Retry vector DB writes that failed during requests (pending_embeddings table)
+    from app.services.embedding_retry import run_retry_loop
+    app.state.embedding_retry_task = asyncio.create_task(run_retry_loop())
+
     # Check for OpenAI API key
     if os.getenv("OPENAI_API_KEY"):
         logger.info("[POC] OPENAI_API_KEY: Set (LLM extraction available)")
@@ -315,6 +338,13 @@ async def startup_event():
     logger.info("=" * 80)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared clients on shutdown"""
+    app.state.embedding_retry_task.cancel()
+    await form.close_voice_agent_client()
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -7,7 +7,7 @@ import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 import logging
 
 # Configure logging
@@ -633,13 +633,14 @@ def html_to_pdf(html_content: str, pdf_path: Path) -> bool:
     return False
 
 
-def save_cv(worker_id: str, worker_data: dict, experience_data: dict, cv_dir: Path, education_data=None,
+def save_cv(worker_id: str, worker_data: Mapping, experience_data: dict, cv_dir: Path, education_data=None,
             use_llm: bool = True, transcript: str = None) -> str:
     """
     Save CV in HTML, TXT, and PDF formats.
     Tries LLM generation first, falls back to template if LLM unavailable.
 
     Args:
+        worker_data: Worker row as returned by crud.get_worker (read-only; not copied or mutated)
         transcript: Optional conversation transcript for richer CV content
 
     Returns path to PDF file (or HTML if PDF generation fails).
@@ -683,9 +684,10 @@ def save_cv(worker_id: str, worker_data: dict, experience_data: dict, cv_dir: Pa
         html_content = generate_cv_html(worker_data, experience_data, education_list)
         logger.info("CV generated using template")
 
-    # Save HTML
+    # Save HTML (encoded once - reused for the name-based copy below)
     html_path = cv_dir / f"{cv_name}.html"
-    html_path.write_text(html_content, encoding='utf-8')
+    html_bytes = html_content.encode('utf-8')
+    html_path.write_bytes(html_bytes)
 
     # Save TXT (always use template for text version)
     txt_path = cv_dir / f"{cv_name}.txt"
@@ -697,7 +699,7 @@ def save_cv(worker_id: str, worker_data: dict, experience_data: dict, cv_dir: Pa
     else:
         txt_education = education_data[0] if education_data else None  # Use first for text version
     txt_content = generate_cv_text(worker_data, experience_data, txt_education)
-    txt_path.write_text(txt_content, encoding='utf-8')
+    txt_path.write_bytes(txt_content.encode('utf-8'))
 
     # Generate and save PDF - MUST succeed
     pdf_path = cv_dir / f"{cv_name}.pdf"
@@ -721,8 +723,8 @@ def save_cv(worker_id: str, worker_data: dict, experience_data: dict, cv_dir: Pa
                 if safe_name:
                     name_based_html = cv_dir / f"{safe_name}_Resume.html"
                     name_based_pdf = cv_dir / f"{safe_name}_Resume.pdf"
-                    # Copy timestamped files to name-based files
-                    shutil.copy2(html_path, name_based_html)
+                    # HTML is still in memory - write it rather than re-reading the file; PDF copy uses sendfile
+                    name_based_html.write_bytes(html_bytes)
                     shutil.copy2(pdf_path, name_based_pdf)
 
                     os.environ[worker_id] = str(name_based_pdf)
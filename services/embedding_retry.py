@@ -0,0 +1,99 @@
+"""
+Embedding Retry - store CV embeddings without letting a failing vector DB cost every request.
+
+Failed vector DB writes are parked in the pending_embeddings table and retried by a
+background loop with exponential backoff. Counters are exposed via GET /debug/embeddings.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+
+from ..db import crud
+from ..vector_db.chroma_client import get_vector_db
+
+logger = logging.getLogger(__name__)
+
+# Errors a vector DB write can legitimately hit (disk full / permissions, unserializable metadata).
+# Anything else is a bug and is not queued.
+EMBEDDING_WRITE_ERRORS = (OSError, TypeError, ValueError)
+
+RETRY_INTERVAL_SECONDS = int(os.getenv("EMBEDDING_RETRY_INTERVAL", "30"))
+RETRY_BASE_DELAY_SECONDS = 30
+RETRY_MAX_DELAY_SECONDS = 3600
+RETRY_MAX_ATTEMPTS = 10
+
+_metrics = {
+    "embedding_failures_total": 0,
+    "embedding_retries_succeeded_total": 0,
+    "embedding_retries_failed_total": 0,
+}
+_metrics_lock = threading.Lock()
+
+
+def _incr(name: str):
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def get_metrics() -> dict:
+    """Snapshot of the embedding counters."""
+    with _metrics_lock:
+        return dict(_metrics)
+
+
+def store_embedding(embedding_data: dict):
+    """
+    Write a prepared embedding (from prepare_for_chromadb) to the vector DB.
+    On a write failure the payload is queued for background retry and the error re-raised.
+    """
+    try:
+        get_vector_db().add_document(
+            embedding_data["id"],
+            embedding_data["document"],
+            embedding_data["metadata"]
+        )
+    except EMBEDDING_WRITE_ERRORS as e:
+        _incr("embedding_failures_total")
+        crud.queue_pending_embedding(
+            embedding_data["id"], embedding_data["document"], embedding_data["metadata"], error=str(e)
+        )
+        raise
+    # A stale queued payload must not overwrite this newer write on its next retry
+    # (PK delete that usually matches nothing - no pages written)
+    crud.delete_pending_embedding(embedding_data["id"])
+
+
+def drain_pending_embeddings(limit: int = 20) -> int:
+    """Retry due pending embeddings once. Returns the number stored successfully."""
+    stored = []
+    vector_db = get_vector_db()
+    for item in crud.get_due_pending_embeddings(RETRY_MAX_ATTEMPTS, limit):
+        doc_id = item["doc_id"]
+        try:
+            vector_db.add_document(doc_id, item["document"], item["metadata"])
+        except EMBEDDING_WRITE_ERRORS as e:
+            _incr("embedding_retries_failed_total")
+            delay = min(RETRY_BASE_DELAY_SECONDS * (2 ** item["attempts"]), RETRY_MAX_DELAY_SECONDS)
+            crud.reschedule_pending_embedding(doc_id, delay, error=str(e))
+            logger.warning(f"Embedding retry failed for {doc_id} (attempt {item['attempts'] + 1}): {e}")
+            continue
+        _incr("embedding_retries_succeeded_total")
+        stored.append(item)
+    if stored:
+        # One executemany transaction for the whole batch (a crash before this only means a harmless re-add).
+        # Only the row versions read above are removed - a payload re-queued meanwhile is kept for retry
+        crud.delete_pending_embeddings(stored)
+        logger.info(f"✓ Stored {len(stored)} pending embedding(s) on retry")
+    return len(stored)
+
+
+async def run_retry_loop(interval: int = RETRY_INTERVAL_SECONDS):
+    """Background task: drain the pending_embeddings queue every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(drain_pending_embeddings)
+        except Exception as e:
+            logger.error(f"Embedding retry loop error: {str(e)}", exc_info=True)
@@ -1,31 +1,49 @@
+import functools
 import json
-from typing import List
+from typing import List, Mapping
 
 """
 Embedding Service - Generate and store embeddings in ChromaDB
 """
 
-def create_cv_embedding_text(worker_data: dict, experience_data: dict) -> str:
-    """Create text for embedding from CV data"""
+@functools.lru_cache(maxsize=2048)
+def _embedding_text(name: str, primary_skill: str, experience_years: str, skills: tuple, preferred_location: str, address: str) -> str:
+    """Pure text builder behind create_cv_embedding_text - memoized on the fields it reads (all str / tuple of str)"""
     
     parts = [
-        f"Worker: {worker_data.get('name', '')}",
-        f"Primary skill: {experience_data.get('primary_skill', '')}",
-        f"Experience: {experience_data.get('experience_years', 0)} years",
-        f"Skills: {', '.join(experience_data.get('skills', []))}",
-        f"Location: {experience_data.get('preferred_location', '')}",
-        f"Address: {worker_data.get('address', '')}",
+        f"Worker: {name}",
+        f"Primary skill: {primary_skill}",
+        f"Experience: {experience_years} years",
+        f"Skills: {', '.join(skills)}",
+        f"Location: {preferred_location}",
+        f"Address: {address}",
     ]
     
     return " ".join(parts)
 
+def create_cv_embedding_text(worker_data: Mapping, experience_data: dict) -> str:
+    """Create text for embedding from CV data"""
+    
+    # Coerce to hashable str keys - client-supplied fields (e.g. preferred_location) may be lists
+    return _embedding_text(
+        str(worker_data.get('name', '')),
+        str(experience_data.get('primary_skill', '')),
+        str(experience_data.get('experience_years', 0)),
+        tuple(str(skill) for skill in experience_data.get('skills', [])),
+        str(experience_data.get('preferred_location', '')),
+        str(worker_data.get('address', '')),
+    )
+
 def prepare_for_chromadb(
     worker_id: str, 
-    worker_data: dict, 
+    worker_data: Mapping, 
     experience_data: dict
 ) -> dict:
     """
-    Prepare CV data for ChromaDB storage
+    Prepare CV data for ChromaDB storage.
+    worker_data is read-only (worker row from crud.get_worker); it is not copied.
+    The embedding text is memoized on the exact fields it uses, so re-link/confirm retries reuse it;
+    metadata is a fresh dict on every call (callers may mutate it).
     """
     
     embedding_text = create_cv_embedding_text(worker_data, experience_data)
@@ -566,9 +566,13 @@
 #         logger.warning(f"Transcript extraction error: {e}")
 #     return result
 
+import copy
+import hashlib
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 from openai import OpenAI
 
@@ -589,6 +593,10 @@ try:
 except Exception as e:
     logger.warning(f"OpenAI client not initialized for experience extractor: {e}")
 
+# Precompiled patterns (shared by all extractors)
+_DIGITS_RE = re.compile(r"\d+")
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
+
 STRUCTURING_PROMPT = """You are a data extraction expert for blue-collar and grey-collar workers.
 Extract and structure work experience information from raw responses in Hindi, Hinglish, or English.
 
@@ -659,7 +667,7 @@ def extract_from_responses(responses: dict) -> dict:
         exp_text = responses["experience_years"]
         try:
             # Try to extract number
-            numbers = re.findall(r'\d+', str(exp_text))
+            numbers = _DIGITS_RE.findall(str(exp_text))
             if numbers:
                 result["experience_years"] = int(numbers[0])
                 logger.info(f"[EXTRACTION]   ✓ Years of experience: {result['experience_years']}")
@@ -846,7 +854,7 @@ def structure_with_openai(responses: dict) -> Optional[dict]:
         except:
             # Fallback: extract JSON from text
             logger.info("[LLM_STRUCT] Direct parsing failed, extracting JSON from text...")
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(response_text)
             if json_match:
                 data = json.loads(json_match.group(0))
                 logger.info("[LLM_STRUCT] ✓ Extracted JSON from text")
@@ -877,9 +885,9 @@ def structure_with_openai(responses: dict) -> Optional[dict]:
             structured["primary_skill"] = structured["job_title"]
         if structured["total_experience"]:
             # Extract years from "X years" format
-            years_match = re.search(r'(\d+)', structured["total_experience"])
+            years_match = _DIGITS_RE.search(structured["total_experience"])
             if years_match:
-                structured["experience_years"] = int(years_match.group(1))
+                structured["experience_years"] = int(years_match.group(0))
                 logger.info(f"[LLM_STRUCT]   - experience_years: {structured['experience_years']}")
 
         # Combine skills and tools for backward compatibility
@@ -980,6 +988,33 @@ Return JSON in this exact format:
 }}"""
 
 
+# Successful LLM extractions keyed by transcript hash, so re-linking an already-extracted call is a dict hit
+_TRANSCRIPT_CACHE_MAX = 256
+_transcript_cache = OrderedDict()
+_transcript_cache_lock = threading.Lock()
+
+
+def _transcript_cache_key(transcript: str) -> str:
+    return hashlib.blake2b(transcript.strip().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_extraction(key: str) -> Optional[dict]:
+    with _transcript_cache_lock:
+        cached = _transcript_cache.get(key)
+        if cached is None:
+            return None
+        _transcript_cache.move_to_end(key)
+    return copy.deepcopy(cached)  # callers may mutate the result
+
+
+def _cache_extraction(key: str, result: dict):
+    with _transcript_cache_lock:
+        _transcript_cache[key] = copy.deepcopy(result)
+        _transcript_cache.move_to_end(key)
+        while len(_transcript_cache) > _TRANSCRIPT_CACHE_MAX:
+            _transcript_cache.popitem(last=False)
+
+
 def extract_from_transcript_comprehensive(transcript: str) -> dict:
     """
     NEW: Extract comprehensive structured experience from full voice call transcript using system prompt.
@@ -1011,13 +1046,18 @@ def extract_from_transcript_comprehensive(transcript: str) -> dict:
     }
 
     # Rule-based fallback: try to get numbers for years
-    numbers = re.findall(r"\d+", transcript)
+    numbers = _DIGITS_RE.findall(transcript)
     if numbers:
         result["experience_years"] = min(int(numbers[0]), 50)
 
-    # Try OpenAI for comprehensive extraction
+    # Try OpenAI for comprehensive extraction (served from cache when this transcript was already extracted)
     try:
         if openai_client and os.getenv("OPENAI_API_KEY"):
+            cache_key = _transcript_cache_key(transcript)
+            cached = _get_cached_extraction(cache_key)
+            if cached is not None:
+                logger.info("✓ Comprehensive extraction served from cache")
+                return cached
             prompt = SYSTEM_PROMPT_EXTRACTION_PROMPT.format(
                 transcript=transcript.strip()[:6000])  # Increased limit for comprehensive data
             # Try with JSON mode first (for supported models)
@@ -1046,7 +1086,7 @@ def extract_from_transcript_comprehensive(transcript: str) -> dict:
                     max_tokens=1500
                 )
             text = response.choices[0].message.content.strip()
-            json_match = re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(text)
             if json_match:
                 data = json.loads(json_match.group(0))
                 result["primary_skill"] = (data.get("primary_skill") or "").strip()
@@ -1065,6 +1105,7 @@ def extract_from_transcript_comprehensive(transcript: str) -> dict:
                 if not isinstance(result["workplaces"], list):
                     result["workplaces"] = []
                 logger.info(f"✓ Comprehensive extraction successful: {len(result['workplaces'])} workplaces found")
+                _cache_extraction(cache_key, result)
                 return result
     except Exception as e:
         logger.warning(f"Comprehensive transcript extraction error: {e}")
@@ -1084,7 +1125,7 @@ def extract_from_transcript(transcript: str) -> dict:
         return {"primary_skill": "", "experience_years": 0, "skills": [], "tools": [], "preferred_location": ""}
     result = {"primary_skill": "", "experience_years": 0, "skills": [], "tools": [], "preferred_location": ""}
     # Rule-based: try to get numbers for years
-    numbers = re.findall(r"\d+", transcript)
+    numbers = _DIGITS_RE.findall(transcript)
     if numbers:
         result["experience_years"] = min(int(numbers[0]), 50)
     # Try OpenAI for full extraction
@@ -1117,7 +1158,7 @@ def extract_from_transcript(transcript: str) -> dict:
                     max_tokens=500
                 )
             text = response.choices[0].message.content.strip()
-            json_match = re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(text)
             if json_match:
                 data = json.loads(json_match.group(0))
                 result["primary_skill"] = (data.get("primary_skill") or "").strip()
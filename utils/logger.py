@@ -16,6 +16,8 @@ DEBUG_LOG_FILE = DEBUG_LOGS_DIR / "app_debug.log"
 _FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 _DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 _debug_file_handler: Optional[logging.FileHandler] = None
 
 
@@ -23,15 +25,15 @@ def setup_debug_logging() -> None:
     """
     Create debug_logs folder and add file handler with rotation.
     Call once from main on startup to enable file logging.
-    All logs (INFO, DEBUG, WARNING, ERROR) will be saved to debug_logs/app_debug.log
+    Logs at or above LOG_LEVEL (env, default INFO) will be saved to debug_logs/app_debug.log
     """
     global _debug_file_handler
     try:
         # Get root logger FIRST and set level IMMEDIATELY
         root_logger = logging.getLogger()
 
-        # Set root logger level to DEBUG to capture everything
-        root_logger.setLevel(logging.DEBUG)
+        # Root level comes from LOG_LEVEL (default INFO); set LOG_LEVEL=DEBUG to capture everything
+        root_logger.setLevel(LOG_LEVEL)
 
         # Create debug_logs directory
         DEBUG_LOGS_DIR.mkdir(parents=True, exist_ok=True)
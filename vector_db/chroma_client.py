@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import threading
 
 """
 ChromaDB Client for CV embeddings storage
@@ -15,6 +16,8 @@ class SimpleVectorDB:
         self.db_dir = Path(db_dir)
         self.db_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.db_dir / "index.json"
+        # One instance is shared by every request thread and the embedding retry drain
+        self._lock = threading.RLock()
         self.load_index()
     
     def load_index(self):
@@ -27,16 +30,18 @@ class SimpleVectorDB:
     
     def save_index(self):
         """Save index to file"""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        with self._lock:
+            with open(self.index_file, 'w') as f:
+                json.dump(self.index, f, indent=2)
     
     def add_document(self, doc_id: str, text: str, metadata: dict = None):
         """Add document to vector DB"""
-        self.index[doc_id] = {
-            "text": text,
-            "metadata": metadata or {}
-        }
-        self.save_index()
+        with self._lock:
+            self.index[doc_id] = {
+                "text": text,
+                "metadata": metadata or {}
+            }
+            self.save_index()
     
     def query(self, query_text: str, top_k: int = 5) -> list:
         """Simple text-based query"""
@@ -44,7 +49,10 @@ class SimpleVectorDB:
         
         query_words = set(query_text.lower().split())
         
-        for doc_id, doc_data in self.index.items():
+        with self._lock:
+            documents = list(self.index.items())
+        
+        for doc_id, doc_data in documents:
             doc_text = doc_data.get("text", "").lower()
             doc_words = set(doc_text.split())
             
@@ -69,20 +77,25 @@ class SimpleVectorDB:
     
     def delete_document(self, doc_id: str):
         """Delete document"""
-        if doc_id in self.index:
-            del self.index[doc_id]
-            self.save_index()
+        with self._lock:
+            if doc_id in self.index:
+                del self.index[doc_id]
+                self.save_index()
 
 # Initialize global vector DB
 _vector_db = None
+_vector_db_lock = threading.Lock()
 
 def get_vector_db(db_dir: Path = None):
-    """Get vector database instance"""
+    """Get vector database instance (one per process, shared by every request)"""
     global _vector_db
     
     if _vector_db is None:
-        if db_dir is None:
-            db_dir = Path(__file__).parent.parent / "data" / "vector_db"
-        _vector_db = SimpleVectorDB(db_dir)
+        # Sync endpoints run on a threadpool - don't let two threads each load the index
+        with _vector_db_lock:
+            if _vector_db is None:
+                if db_dir is None:
+                    db_dir = Path(__file__).parent.parent / "data" / "vector_db"
+                _vector_db = SimpleVectorDB(db_dir)
     
     return _vector_db